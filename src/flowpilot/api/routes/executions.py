@@ -426,14 +426,12 @@ def get_execution_logs(
                 detail=f"Execution not found: {execution_id}",
             )
 
-        # Get all node executions for this execution
+        # Count all node executions, but only load the requested page
         node_repo = NodeExecutionRepository(session)
-        all_nodes = node_repo.get_by_execution(execution_id)
-
-        total = len(all_nodes)
-        start = (page - 1) * page_size
-        end = start + page_size
-        page_nodes = all_nodes[start:end]
+        total = node_repo.count_by_execution(execution_id)
+        page_nodes = node_repo.get_by_execution(
+            execution_id, offset=(page - 1) * page_size, limit=page_size
+        )
 
         return ExecutionLogsResponse(
             execution_id=execution_id,
@@ -500,11 +498,11 @@ async def websocket_logs(websocket: WebSocket, execution_id: str) -> None:
 
                     # Check for new node executions
                     node_repo = NodeExecutionRepository(session)
-                    nodes = node_repo.get_by_execution(execution_id)
+                    nodes = node_repo.get_by_execution(execution_id, offset=last_log_count)
 
                     # Send any new node logs
-                    if len(nodes) > last_log_count:
-                        for node in nodes[last_log_count:]:
+                    if nodes:
+                        for node in nodes:
                             log_message = WebSocketMessage(
                                 type="log",
                                 execution_id=execution_id,
@@ -519,7 +517,7 @@ async def websocket_logs(websocket: WebSocket, execution_id: str) -> None:
                                 },
                             )
                             await websocket.send_json(log_message.model_dump(mode="json"))
-                        last_log_count = len(nodes)
+                        last_log_count += len(nodes)
 
                     # Check if execution is complete
                     if execution.status in (
@@ -29,6 +29,10 @@ router = APIRouter(prefix="/hooks", tags=["webhooks"])
 # Registry of active webhooks: path -> WebhookConfig
 _webhooks: dict[str, dict[str, Any]] = {}
 
+# Workflow name -> its webhook paths in registration order (values unused);
+# entries are checked against _webhooks on read, which stays authoritative
+_paths_by_workflow: dict[str, dict[str, None]] = {}
+
 # Global runner reference (set via set_global_webhook_runner)
 _global_runner: WorkflowRunner | None = None
 
@@ -80,6 +84,10 @@ def register_webhook(
     # Resolve secret from environment variable if needed
     resolved_secret = _resolve_secret(secret)
 
+    previous = _webhooks.get(path)
+    if previous is not None and previous["workflow_name"] != workflow_name:
+        _paths_by_workflow.get(previous["workflow_name"], {}).pop(path, None)
+    _paths_by_workflow.setdefault(workflow_name, {})[path] = None
     _webhooks[path] = {
         "workflow_name": workflow_name,
         "workflow_path": workflow_path,
@@ -104,7 +112,9 @@ def unregister_webhook(workflow_name: str) -> bool:
         True if any webhooks were removed, False otherwise.
     """
     to_remove = [
-        path for path, config in _webhooks.items() if config["workflow_name"] == workflow_name
+        path
+        for path in _paths_by_workflow.pop(workflow_name, {})
+        if _webhooks.get(path, {}).get("workflow_name") == workflow_name
     ]
 
     for path in to_remove:
@@ -137,10 +147,12 @@ def get_webhook(workflow_name: str) -> dict[str, Any] | None:
         workflow_name: Name of the workflow.
 
     Returns:
-        Webhook information or None if not found.
+        Webhook information for the workflow's first registered webhook, or
+        None if not found.
     """
-    for path, config in _webhooks.items():
-        if config["workflow_name"] == workflow_name:
+    for path in _paths_by_workflow.get(workflow_name, ()):
+        config = _webhooks.get(path)
+        if config is not None and config["workflow_name"] == workflow_name:
             return {
                 "path": path,
                 "workflow_name": config["workflow_name"],
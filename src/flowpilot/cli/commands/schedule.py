@@ -116,9 +116,9 @@ def disable(
 
 @app.command()
 def status(
-    name: str | None = typer.Argument(
+    names: list[str] | None = typer.Argument(
         None,
-        help="Workflow name to check (shows all if omitted)",
+        help="Workflow names to check (shows all if omitted)",
     ),
     json_output: bool = typer.Option(
         False,
@@ -134,10 +134,11 @@ def status(
     Examples:
         flowpilot status
         flowpilot status my-workflow
+        flowpilot status my-workflow other-workflow
         flowpilot status --json
     """
     manager = _get_schedule_manager()
-    schedules = manager.get_status(name)
+    schedules = manager.get_status_many(names) if names else manager.get_status()
 
     if json_output:
         data = [
@@ -157,8 +158,8 @@ def status(
         return
 
     if not schedules:
-        if name:
-            console.print(f"[yellow]No schedule found for workflow:[/] {name}")
+        if names:
+            console.print(f"[yellow]No schedule found for workflow:[/] {', '.join(names)}")
         else:
             console.print("[yellow]No scheduled workflows.[/]")
             console.print("Use [cyan]flowpilot enable <name>[/] to schedule a workflow.")
@@ -227,13 +227,16 @@ def run_server(host: str, port: int, reload: bool = False) -> None:
     )
 
     # Run uvicorn
-    uvicorn.run(
-        app_instance,
-        host=host,
-        port=port,
-        reload=reload,
-        log_level="info",
-    )
+    try:
+        uvicorn.run(
+            app_instance,
+            host=host,
+            port=port,
+            reload=reload,
+            log_level="info",
+        )
+    finally:
+        db.dispose()
 
 
 @app.command()
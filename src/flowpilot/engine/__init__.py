@@ -24,7 +24,7 @@ from .errors import (
     classify_http_error,
 )
 from .executor import ExecutorRegistry, NodeExecutor, get_node_timeout
-from .parser import WorkflowParseError, WorkflowParser, get_node_by_id
+from .parser import WorkflowParseError, WorkflowParser, get_node_by_id, load_workflow_file
 from .retry import RetryExecutor, calculate_backoff
 from .runner import CircularDependencyError, WorkflowRunner, WorkflowRunnerError
 from .template import TemplateEngine
@@ -64,5 +64,6 @@ __all__ = [
     "get_error_reporter",
     "get_node_by_id",
     "get_node_timeout",
+    "load_workflow_file",
     "reset_circuit_breaker",
 ]
@@ -48,7 +48,7 @@ class CircuitBreaker:
 
     name: str
     failure_threshold: int = 5  # Failures before opening
-    recovery_timeout: int = 60  # Seconds before trying again
+    recovery_timeout: float = 60  # Seconds before trying again
     half_open_requests: int = 1  # Requests to allow in half-open
 
     state: CircuitState = field(default=CircuitState.CLOSED, init=False)
@@ -172,7 +172,7 @@ _breakers_lock = asyncio.Lock()
 def get_circuit_breaker(
     name: str,
     failure_threshold: int = 5,
-    recovery_timeout: int = 60,
+    recovery_timeout: float = 60,
     half_open_requests: int = 1,
 ) -> CircuitBreaker:
     """Get or create a circuit breaker.
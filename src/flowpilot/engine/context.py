@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any, Literal
 
@@ -225,6 +225,18 @@ class ExecutionContext:
         """Check if any node has errors."""
         return any(r.status == "error" for r in self.nodes.values())
 
+    def loop_scope(self) -> ExecutionContext:
+        """Return a context with its own loop variables for running a loop.
+
+        The scope shares inputs and node results with this context, so child
+        results stay visible to the rest of the workflow, while loop variables
+        set on it cannot clobber those of a sibling loop running concurrently.
+
+        Returns:
+            ExecutionContext sharing this context's state except loop variables.
+        """
+        return replace(self, loop_variables=dict(self.loop_variables))
+
     def set_loop_variable(self, name: str, value: Any) -> None:
         """Set a loop variable for use in child node templates.
 
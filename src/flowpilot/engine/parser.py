@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -13,6 +15,20 @@ from flowpilot.models import ConditionNode, LoopNode, ParallelNode, Workflow
 if TYPE_CHECKING:
     from flowpilot.models import Node
 
+# Use the LibYAML-backed loader when PyYAML was built with it (much faster)
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Maximum number of parsed workflows kept by load_workflow_file
+WORKFLOW_CACHE_SIZE = 128
+
+# Parsed workflows shared across the process; path -> (st_mtime_ns, st_size,
+# workflow), least recently used first
+_workflow_cache: OrderedDict[Path, tuple[int, int, Workflow]] = OrderedDict()
+_workflow_cache_lock = threading.Lock()
+
 
 class WorkflowParseError(Exception):
     """Error parsing workflow YAML."""
@@ -42,9 +58,9 @@ class WorkflowParser:
         if not path.exists():
             raise FileNotFoundError(f"Workflow file not found: {path}")
 
-        with open(path) as f:
+        with open(path, "rb") as f:
             try:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_SafeLoader)
             except yaml.YAMLError as e:
                 raise WorkflowParseError(f"Invalid YAML syntax: {e}") from e
 
@@ -66,7 +82,7 @@ class WorkflowParser:
             WorkflowParseError: If the content cannot be parsed.
         """
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise WorkflowParseError(f"Invalid YAML syntax: {e}") from e
 
@@ -226,6 +242,47 @@ class WorkflowParser:
         return Workflow.model_json_schema()
 
 
+# Parser behind load_workflow_file (WorkflowParser keeps no per-parse state)
+_parser = WorkflowParser()
+
+
+def load_workflow_file(path: Path | str) -> Workflow:
+    """Parse a workflow file, reusing the parsed model while the file is unchanged.
+
+    Cached workflows are revalidated against the file's modification time
+    and size on every call, so callers that load the same file repeatedly
+    (scheduled runs, file-watch events, schedule management) only re-parse
+    it after it changes. Beyond WORKFLOW_CACHE_SIZE files, the least
+    recently used are evicted. Safe to call from several threads.
+
+    Args:
+        path: Path to the workflow YAML file.
+
+    Returns:
+        Parsed Workflow object, shared with other callers; do not mutate it.
+
+    Raises:
+        FileNotFoundError: If the workflow file does not exist.
+        WorkflowParseError: If the workflow file is invalid.
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _workflow_cache_lock:
+        cached = _workflow_cache.get(path)
+        if cached is not None and cached[:2] == key:
+            _workflow_cache.move_to_end(path)
+            return cached[2]
+
+    workflow = _parser.parse_file(path)
+    with _workflow_cache_lock:
+        _workflow_cache[path] = (*key, workflow)
+        _workflow_cache.move_to_end(path)
+        if len(_workflow_cache) > WORKFLOW_CACHE_SIZE:
+            _workflow_cache.popitem(last=False)
+    return workflow
+
+
 def get_node_by_id(workflow: Workflow, node_id: str) -> Node | None:
     """Get a node from workflow by ID.
 
@@ -5,12 +5,16 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 import uuid
-from datetime import UTC, datetime
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from graphlib import CycleError, TopologicalSorter
-from typing import TYPE_CHECKING, Any
+from types import UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
 from flowpilot.models import (
+    BaseNode,
     ConditionNode,
     InputDefinition,
     LoopNode,
@@ -32,6 +36,73 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Dependency statuses that cause dependent nodes to be skipped
+_FAILED_OR_SKIPPED = frozenset({"error", "skipped"})
+
+# Renders one field value: (engine, value, template_context) -> rendered value
+FieldRenderer = Callable[[TemplateEngine, Any, dict[str, Any]], Any]
+
+
+def _render_str(engine: TemplateEngine, value: Any, ctx: dict[str, Any]) -> Any:
+    """Render a plain (possibly None) string field."""
+    if isinstance(value, str) and engine.has_template(value):
+        return engine.render(value, ctx)
+    return value
+
+
+def _render_str_list(engine: TemplateEngine, value: Any, ctx: dict[str, Any]) -> Any:
+    """Render a (possibly None) list of strings."""
+    if not value:
+        return value
+    return [engine.render(v, ctx) if engine.has_template(v) else v for v in value]
+
+
+def _render_str_dict(engine: TemplateEngine, value: Any, ctx: dict[str, Any]) -> Any:
+    """Render the values of a (possibly None) string-to-string dict."""
+    if not value:
+        return value
+    return {k: engine.render(v, ctx) if engine.has_template(v) else v for k, v in value.items()}
+
+
+def _render_any(engine: TemplateEngine, value: Any, ctx: dict[str, Any]) -> Any:
+    """Render an arbitrarily nested value."""
+    return engine.render_value(value, ctx)
+
+
+def _field_renderer(annotation: Any) -> FieldRenderer:
+    """Pick the cheapest renderer able to handle a field annotation."""
+    # Strip Optional[...] since every specialized renderer passes None through
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+
+    if annotation is str:
+        return _render_str
+    if get_args(annotation) == (str,) and get_origin(annotation) is list:
+        return _render_str_list
+    if get_args(annotation) == (str, str) and get_origin(annotation) is dict:
+        return _render_str_dict
+    return _render_any
+
+
+# Render plans keyed by node class, built lazily on first execution
+_RENDER_PLANS: dict[type[BaseNode], list[tuple[str, FieldRenderer]]] = {}
+
+
+def _get_render_plan(node_cls: type[BaseNode]) -> list[tuple[str, FieldRenderer]]:
+    """Get the (field name, renderer) pairs for a node class's template fields."""
+    plan = _RENDER_PLANS.get(node_cls)
+    if plan is None:
+        plan = [
+            (name, _field_renderer(info.annotation))
+            for name, info in node_cls.model_fields.items()
+            if name in node_cls._TEMPLATE_FIELDS
+        ]
+        _RENDER_PLANS[node_cls] = plan
+    return plan
+
+
 class WorkflowRunnerError(Exception):
     """Error during workflow execution."""
 
@@ -58,6 +129,10 @@ class WorkflowRunner:
         self._db = db
         self._retry_executor = RetryExecutor(default_retry_config)
         self._error_reporter = get_error_reporter()
+        # Wall-clock anchor for monotonic timestamps. Set once: concurrent runs
+        # share this runner, so re-anchoring would shift their timestamps
+        self._wall_epoch = datetime.now()
+        self._mono_epoch = time.monotonic_ns()
 
     async def run(
         self,
@@ -88,7 +163,7 @@ class WorkflowRunner:
             workflow_name=workflow.name,
             execution_id=execution_id or str(uuid.uuid4()),
             inputs=self._merge_inputs(workflow.inputs, inputs or {}),
-            started_at=datetime.now(),
+            started_at=self._now(),
         )
 
         # Create execution record in database
@@ -105,51 +180,67 @@ class WorkflowRunner:
             # Build and validate dependency graph
             graph = self._build_dependency_graph(workflow)
 
-            # Get execution order
+            # Prepare the dependency graph for incremental scheduling
             try:
                 sorter = TopologicalSorter(graph)
-                execution_order = list(sorter.static_order())
+                sorter.prepare()
             except CycleError as e:
                 raise CircularDependencyError(f"Circular dependency detected: {e}") from e
 
-            # Execute nodes in order
-            for node_id in execution_order:
-                node = self._get_node(workflow, node_id)
-                if node is None:
-                    continue  # Skip nodes that don't exist (shouldn't happen)
+            # Execute nodes as soon as their dependencies complete, running
+            # independent nodes concurrently
+            running: dict[asyncio.Task[NodeResult], Node] = {}
+            try:
+                while sorter.is_active():
+                    for node_id in sorter.get_ready():
+                        node = self._get_node(workflow, node_id)
+                        if node is None:
+                            sorter.done(node_id)  # Skip nodes that don't exist (shouldn't happen)
+                            continue
 
-                # Check if we should skip this node
-                if self._should_skip_node(node, context):
-                    context.set_node_result(node_id, NodeResult.skipped("Condition not met"))
-                    continue
+                        # Check if we should skip this node
+                        if self._should_skip_node(node, context):
+                            context.set_node_result(
+                                node_id, NodeResult.skipped("Condition not met")
+                            )
+                            sorter.done(node_id)
+                            continue
 
-                # Handle loop nodes specially
-                if isinstance(node, LoopNode):
-                    result = await self._execute_loop_node(node, context, workflow, error_report)
-                elif isinstance(node, ParallelNode):
-                    result = await self._execute_parallel_node(
-                        node, context, workflow, error_report
-                    )
-                else:
-                    # Execute the node with retry and fallback support
-                    result = await self._execute_node(node, context, workflow, error_report)
-
-                context.set_node_result(node_id, result)
-
-                # Check if we should stop on error
-                # Stop if: error AND on_error=stop AND NOT continue_on_error
-                should_stop = (
-                    result.status == "error"
-                    and workflow.settings.on_error == "stop"
-                    and not node.continue_on_error
-                    and not result.data.get("continued_on_error", False)
-                )
+                        task = asyncio.create_task(
+                            self._dispatch_node(node, context, workflow, error_report)
+                        )
+                        running[task] = node
+
+                    if not running:
+                        # Only skipped nodes were ready; fetch the next batch
+                        continue
 
-                if should_stop:
-                    context.mark_finished("error")
-                    error_report.finish()
-                    self._finalize_execution_record(context, workflow)
-                    return context
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                    should_stop = False
+                    for task in done:
+                        node = running.pop(task)
+                        result = task.result()
+                        context.set_node_result(node.id, result)
+                        sorter.done(node.id)
+
+                        # Check if we should stop on error
+                        # Stop if: error AND on_error=stop AND NOT continue_on_error
+                        should_stop = should_stop or (
+                            result.status == "error"
+                            and workflow.settings.on_error == "stop"
+                            and not node.continue_on_error
+                            and not result.data.get("continued_on_error", False)
+                        )
+
+                    if should_stop:
+                        await self._cancel_tasks(running)
+                        context.mark_finished("error")
+                        error_report.finish()
+                        self._finalize_execution_record(context, workflow)
+                        return context
+            finally:
+                await self._cancel_tasks(running)
 
             # Mark successful completion
             context.mark_finished("error" if context.has_errors else "success")
@@ -169,6 +260,42 @@ class WorkflowRunner:
 
         return context
 
+    async def _dispatch_node(
+        self,
+        node: Node,
+        context: ExecutionContext,
+        workflow: Workflow,
+        error_report: ErrorReport,
+    ) -> NodeResult:
+        """Execute a top-level node, routing control flow nodes to their handlers.
+
+        Args:
+            node: The node to execute.
+            context: Current execution context.
+            workflow: The parent workflow.
+            error_report: Error report to record errors.
+
+        Returns:
+            NodeResult with execution outcome.
+        """
+        # Handle loop nodes specially
+        if isinstance(node, LoopNode):
+            return await self._execute_loop_node(node, context, workflow, error_report)
+        if isinstance(node, ParallelNode):
+            return await self._execute_parallel_node(node, context, workflow, error_report)
+        # Execute the node with retry and fallback support
+        return await self._execute_node(node, context, workflow, error_report)
+
+    @staticmethod
+    async def _cancel_tasks(tasks: dict[asyncio.Task[NodeResult], Node]) -> None:
+        """Cancel still-running node tasks and wait for them to finish."""
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        tasks.clear()
+
     def _create_execution_record(
         self,
         context: ExecutionContext,
@@ -368,12 +495,11 @@ class WorkflowRunner:
         Returns:
             True if node should be skipped.
         """
-        # Check if any dependency failed (and on_error is stop)
+        # Check if any dependency failed (and on_error is stop) or was skipped
+        results = context.nodes
         for dep_id in node.depends_on:
-            dep_result = context.get_node_result(dep_id)
-            if dep_result and dep_result.status == "error":
-                return True
-            if dep_result and dep_result.status == "skipped":
+            dep_result = results.get(dep_id)
+            if dep_result is not None and dep_result.status in _FAILED_OR_SKIPPED:
                 return True
 
         return False
@@ -397,27 +523,30 @@ class WorkflowRunner:
             NodeResult with execution outcome.
         """
         # Mark node as running
-        started_at = datetime.now()
+        started_ns = time.monotonic_ns()
 
         # Check if executor is registered
         if not ExecutorRegistry.has_executor(node.type):
             return NodeResult.error(
                 f"No executor registered for node type: {node.type}",
-                started_at=started_at,
+                started_at=self._wall_time(started_ns),
             )
 
         try:
             # Get executor and render node with templates
             executor = ExecutorRegistry.get(node.type)
 
-            # Render template values in the node
-            rendered_data = self.template_engine.render_dict(
-                node.model_dump(),
-                context.get_template_context(),
-            )
-
-            # Recreate node with rendered values
-            rendered_node = type(node).model_validate(rendered_data)
+            # Render template values in the node (per-type plan of template-capable fields).
+            # Only those fields are read; everything else is shared with the original node
+            # rather than dumped and re-validated.
+            template_context = context.get_template_context()
+            rendered_fields = {
+                field_name: render(
+                    self.template_engine, getattr(node, field_name), template_context
+                )
+                for field_name, render in _get_render_plan(type(node))
+            }
+            rendered_node = node.model_copy(update=rendered_fields)
 
             # Execute with retry logic if configured
             if node.retry is not None:
@@ -457,7 +586,7 @@ class WorkflowRunner:
             return result
 
         except Exception as e:
-            error_result = NodeResult.error(str(e), started_at=started_at)
+            error_result = NodeResult.error(str(e), started_at=self._wall_time(started_ns))
             if error_report:
                 error_report.add_error(
                     node_id=node.id,
@@ -543,7 +672,12 @@ class WorkflowRunner:
         Returns:
             NodeResult with loop execution results.
         """
-        started_at = datetime.now()
+        started_ns = time.monotonic_ns()
+        started_at = self._wall_time(started_ns)
+
+        # Iterate in a scope of our own so concurrently running loops keep
+        # their loop variables apart
+        context = context.loop_scope()
 
         try:
             # First, execute the loop node itself to resolve for_each expression
@@ -570,9 +704,9 @@ class WorkflowRunner:
                         "items_processed": [],
                         "break_triggered": False,
                     },
-                    duration_ms=self._duration_ms(started_at),
+                    duration_ms=self._duration_ms(started_ns),
                     started_at=started_at,
-                    finished_at=datetime.now(),
+                    finished_at=self._now(),
                 )
 
             # Execute iterations
@@ -641,9 +775,9 @@ class WorkflowRunner:
                             "break_triggered": False,
                             "failed_at_iteration": index,
                         },
-                        duration_ms=self._duration_ms(started_at),
+                        duration_ms=self._duration_ms(started_ns),
                         started_at=started_at,
-                        finished_at=datetime.now(),
+                        finished_at=self._now(),
                     )
 
             # Clear loop variables after completion
@@ -661,9 +795,9 @@ class WorkflowRunner:
                     "items_processed": items_processed,
                     "break_triggered": break_triggered,
                 },
-                duration_ms=self._duration_ms(started_at),
+                duration_ms=self._duration_ms(started_ns),
                 started_at=started_at,
-                finished_at=datetime.now(),
+                finished_at=self._now(),
             )
 
         except Exception as e:
@@ -688,7 +822,8 @@ class WorkflowRunner:
         Returns:
             NodeResult with parallel execution results.
         """
-        started_at = datetime.now()
+        started_ns = time.monotonic_ns()
+        started_at = self._wall_time(started_ns)
 
         try:
             # First, execute the parallel node itself to get configuration
@@ -714,9 +849,9 @@ class WorkflowRunner:
                         "results": {},
                         "errors": [],
                     },
-                    duration_ms=self._duration_ms(started_at),
+                    duration_ms=self._duration_ms(started_ns),
                     started_at=started_at,
-                    finished_at=datetime.now(),
+                    finished_at=self._now(),
                 )
 
             # Create semaphore for concurrency limiting
@@ -803,9 +938,9 @@ class WorkflowRunner:
                                 "errors": errors,
                                 "timed_out": True,
                             },
-                            duration_ms=self._duration_ms(started_at),
+                            duration_ms=self._duration_ms(started_ns),
                             started_at=started_at,
-                            finished_at=datetime.now(),
+                            finished_at=self._now(),
                         )
 
                 except TimeoutError:
@@ -824,9 +959,9 @@ class WorkflowRunner:
                             "errors": errors,
                             "timed_out": True,
                         },
-                        duration_ms=self._duration_ms(started_at),
+                        duration_ms=self._duration_ms(started_ns),
                         started_at=started_at,
-                        finished_at=datetime.now(),
+                        finished_at=self._now(),
                     )
 
                 # If fail-fast and we have errors, return error
@@ -840,9 +975,9 @@ class WorkflowRunner:
                             "results": {k: v.status for k, v in results.items()},
                             "errors": errors,
                         },
-                        duration_ms=self._duration_ms(started_at),
+                        duration_ms=self._duration_ms(started_ns),
                         started_at=started_at,
-                        finished_at=datetime.now(),
+                        finished_at=self._now(),
                     )
 
             else:
@@ -880,9 +1015,9 @@ class WorkflowRunner:
                             "errors": errors,
                             "timed_out": True,
                         },
-                        duration_ms=self._duration_ms(started_at),
+                        duration_ms=self._duration_ms(started_ns),
                         started_at=started_at,
-                        finished_at=datetime.now(),
+                        finished_at=self._now(),
                     )
 
                 # In wait-all mode, return error if any node failed
@@ -896,9 +1031,9 @@ class WorkflowRunner:
                             "results": {k: v.status for k, v in results.items()},
                             "errors": errors,
                         },
-                        duration_ms=self._duration_ms(started_at),
+                        duration_ms=self._duration_ms(started_ns),
                         started_at=started_at,
-                        finished_at=datetime.now(),
+                        finished_at=self._now(),
                     )
 
             # All successful
@@ -914,9 +1049,9 @@ class WorkflowRunner:
                     "results": {k: v.status for k, v in results.items()},
                     "errors": [],
                 },
-                duration_ms=self._duration_ms(started_at),
+                duration_ms=self._duration_ms(started_ns),
                 started_at=started_at,
-                finished_at=datetime.now(),
+                finished_at=self._now(),
             )
 
         except Exception as e:
@@ -938,10 +1073,56 @@ class WorkflowRunner:
         executor = LoopExecutor()
         return executor._evaluate_break_condition(expr, context.get_template_context())
 
+    def _wall_time(self, mono_ns: int) -> datetime:
+        """Convert a monotonic timestamp to wall-clock time via the runner anchor."""
+        return self._wall_epoch + timedelta(microseconds=(mono_ns - self._mono_epoch) // 1000)
+
+    def _now(self) -> datetime:
+        """Current wall-clock time derived from the monotonic clock."""
+        return self._wall_time(time.monotonic_ns())
+
     @staticmethod
-    def _duration_ms(started_at: datetime) -> int:
-        """Calculate duration in milliseconds."""
-        return int((datetime.now() - started_at).total_seconds() * 1000)
+    def _duration_ms(started_ns: int) -> int:
+        """Calculate duration in milliseconds from a monotonic start time."""
+        return (time.monotonic_ns() - started_ns) // 1_000_000
+
+    @staticmethod
+    def _find_cycle(graph: dict[str, set[str]]) -> list[str] | None:
+        """Find a dependency cycle using an iterative three-color DFS.
+
+        Cheaper than a full topological sort when only cycle detection is
+        needed, as it stops at the first back edge.
+
+        Args:
+            graph: Dictionary mapping node IDs to their dependencies.
+
+        Returns:
+            Node IDs forming the cycle (first ID repeated at the end), or None.
+        """
+        white, gray, black = 0, 1, 2
+        color = dict.fromkeys(graph, white)
+
+        for root in graph:
+            if color[root] != white:
+                continue
+            color[root] = gray
+            path = [root]
+            stack = [iter(graph[root])]
+            while stack:
+                dep = next(stack[-1], None)
+                if dep is None:
+                    color[path.pop()] = black
+                    stack.pop()
+                    continue
+                dep_color = color.get(dep, black)  # Unknown IDs can't form a cycle
+                if dep_color == gray:
+                    return [*path[path.index(dep) :], dep]
+                if dep_color == white:
+                    color[dep] = gray
+                    path.append(dep)
+                    stack.append(iter(graph[dep]))
+
+        return None
 
     def validate_workflow(self, workflow: Workflow) -> list[str]:
         """Validate workflow before execution.
@@ -955,12 +1136,9 @@ class WorkflowRunner:
         errors: list[str] = []
 
         # Check for circular dependencies
-        graph = self._build_dependency_graph(workflow)
-        try:
-            sorter = TopologicalSorter(graph)
-            list(sorter.static_order())
-        except CycleError as e:
-            errors.append(f"Circular dependency detected: {e}")
+        cycle = self._find_cycle(self._build_dependency_graph(workflow))
+        if cycle is not None:
+            errors.append(f"Circular dependency detected: {' -> '.join(cycle)}")
 
         # Check all required node executors are registered
         for node in workflow.nodes:
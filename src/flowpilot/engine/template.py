@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import re
 from typing import TYPE_CHECKING, Any
 
 from jinja2 import StrictUndefined
@@ -58,7 +57,7 @@ class TemplateEngine:
         """
         if isinstance(value, str):
             # Only render if it looks like it contains a template
-            if "{{" in value or "{%" in value:
+            if self.has_template(value):
                 return self.render(value, context)
             return value
         elif isinstance(value, dict):
@@ -96,8 +95,12 @@ class TemplateEngine:
         return self.render(template, execution_context.get_template_context())
 
     def has_template(self, value: str) -> bool:
-        """Check if a string contains Jinja2 template syntax."""
-        return bool(re.search(r"\{\{.*?\}\}|\{%.*?%\}", value))
+        """Check if a string contains Jinja2 template syntax.
+
+        Uses plain substring checks on the opening delimiters rather than a
+        regex, since this runs for every string field and is almost always False.
+        """
+        return "{{" in value or "{%" in value
 
     # Custom filters
 
@@ -121,13 +124,17 @@ class TemplateEngine:
     @staticmethod
     def _first_line(value: str) -> str:
         """Get the first line of a string."""
-        lines = value.splitlines()
+        # Only split up to the first newline instead of the whole string
+        newline = value.find("\n")
+        lines = (value if newline == -1 else value[:newline]).splitlines()
         return lines[0] if lines else ""
 
     @staticmethod
     def _last_line(value: str) -> str:
         """Get the last line of a string."""
-        lines = value.splitlines()
+        # Only split what follows the last newline (ignoring a trailing one)
+        newline = value.rfind("\n", 0, len(value) - 1)
+        lines = value[newline + 1 :].splitlines()
         return lines[-1] if lines else ""
 
     @staticmethod
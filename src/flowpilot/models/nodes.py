@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Literal
+import types
+from typing import Annotated, Any, ClassVar, Literal, Union, get_args, get_origin
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+def _may_hold_template(annotation: Any) -> bool:
+    """Check whether a field annotation can hold a (possibly nested) string.
+
+    Literal fields are excluded since their values are fixed by validation.
+    Dict keys are ignored because template rendering only touches values.
+    """
+    if annotation is str or annotation is Any:
+        return True
+    origin = get_origin(annotation)
+    if origin is None or origin is Literal:
+        return False
+    args = get_args(annotation)
+    if origin is Union or origin is types.UnionType or origin is list:
+        return any(_may_hold_template(arg) for arg in args)
+    if origin is dict:
+        return len(args) == 2 and _may_hold_template(args[1])
+    return False
+
+
 class RetryConfig(BaseModel):
     """Retry configuration for nodes."""
 
@@ -42,6 +62,17 @@ class BaseNode(BaseModel):
     fallback: str | None = Field(default=None, description="Node ID to execute on failure")
     continue_on_error: bool = Field(default=False, description="Don't stop workflow on error")
 
+    # Names of fields that may contain Jinja2 templates, computed once per subclass
+    _TEMPLATE_FIELDS: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Record which fields can hold template strings for this node type."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._TEMPLATE_FIELDS = frozenset(
+            name for name, info in cls.model_fields.items() if _may_hold_template(info.annotation)
+        )
+
 
 class ShellNode(BaseNode):
     """Execute a shell command."""
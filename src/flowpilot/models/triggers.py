@@ -3,14 +3,53 @@
 from __future__ import annotations
 
 import re
-from typing import Annotated, Literal
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
+
+if TYPE_CHECKING:
+    from apscheduler.triggers.cron import CronTrigger as APCronTrigger
+
+# Cron field names for 5-field (standard) and 6-field (with seconds) expressions
+_CRON_FIELDS = {
+    5: ("minute", "hour", "day", "month", "day_of_week"),
+    6: ("second", "minute", "hour", "day", "month", "day_of_week"),
+}
+
+# Interval strings like '30s', '5m', '2h', '1d'
+_INTERVAL_RE = re.compile(r"^(\d+)([smhd])$")
+_INTERVAL_MULTIPLIERS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _interval_seconds(every: str) -> int | None:
+    """Convert an interval string like '5m' to seconds.
+
+    Args:
+        every: The interval string.
+
+    Returns:
+        The interval in seconds, or None if the format is invalid.
+    """
+    # Plain ASCII digits plus a unit letter needs no regex; anything else
+    # (including other Unicode digits, which \d accepts) takes the slow path
+    multiplier = _INTERVAL_MULTIPLIERS.get(every[-1:])
+    head = every[:-1]
+    if multiplier is not None and head.isascii() and head.isdigit():
+        return int(head) * multiplier
+
+    match = _INTERVAL_RE.match(every)
+    if not match:
+        return None
+    return int(match.group(1)) * _INTERVAL_MULTIPLIERS[match.group(2)]
 
 
 class CronTrigger(BaseModel):
     """Trigger workflow on a cron schedule."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["cron"]
     schedule: str = Field(..., description="Cron expression (5 or 6 fields)")
     timezone: str = Field(default="local", description="Timezone for schedule")
@@ -25,40 +64,93 @@ class CronTrigger(BaseModel):
             raise ValueError(msg)
         return v
 
+    @model_validator(mode="after")
+    def validate_schedule(self) -> CronTrigger:
+        """Validate field values and timezone by parsing the schedule once."""
+        try:
+            self.to_apscheduler()
+        except (ValueError, LookupError) as e:
+            msg = f"Invalid cron schedule '{self.schedule}': {e}"
+            raise ValueError(msg) from e
+        return self
+
+    def to_apscheduler(self) -> APCronTrigger:
+        """Get the parsed APScheduler trigger for this schedule (cached)."""
+        return _build_cron_trigger(self.schedule, self.timezone)
+
+
+@lru_cache(maxsize=256)
+def _build_cron_trigger(schedule: str, timezone: str) -> APCronTrigger:
+    """Parse a cron expression into an APScheduler trigger.
+
+    APScheduler triggers are stateless, so identical expressions share one
+    parsed instance across workflows and reloads.
+
+    Raises:
+        ValueError: If the expression is invalid.
+        LookupError: If the timezone is unknown.
+    """
+    from apscheduler.triggers.cron import CronTrigger as APCronTrigger
+
+    parts = schedule.split()
+    fields = _CRON_FIELDS.get(len(parts))
+    if fields is None:
+        msg = f"Invalid cron expression: {schedule}. Expected 5 or 6 fields."
+        raise ValueError(msg)
+
+    return APCronTrigger(
+        timezone=timezone if timezone != "local" else None,
+        **dict(zip(fields, parts, strict=True)),
+    )
+
 
 class IntervalTrigger(BaseModel):
     """Trigger workflow at regular intervals."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["interval"]
     every: str = Field(..., description="Interval like '30s', '5m', '2h', '1d'")
 
+    # (every, seconds) computed at validation time
+    _seconds: tuple[str, int] | None = PrivateAttr(default=None)
+
     @field_validator("every")
     @classmethod
     def validate_interval(cls, v: str) -> str:
         """Validate interval format."""
-        pattern = r"^(\d+)(s|m|h|d)$"
-        if not re.match(pattern, v):
+        if _interval_seconds(v) is None:
             msg = f"Invalid interval format: {v}. Use format like '30s', '5m', '2h', '1d'"
             raise ValueError(msg)
         return v
 
+    @model_validator(mode="after")
+    def cache_seconds(self) -> IntervalTrigger:
+        """Precompute the interval in seconds."""
+        self.to_seconds()
+        return self
+
     def to_seconds(self) -> int:
         """Convert interval to seconds."""
-        match = re.match(r"^(\d+)(s|m|h|d)$", self.every)
-        if not match:
+        # Keyed on `every` so a copy with an updated interval isn't served a stale value
+        cached = self._seconds
+        if cached is not None and cached[0] == self.every:
+            return cached[1]
+
+        seconds = _interval_seconds(self.every)
+        if seconds is None:
             msg = f"Invalid interval: {self.every}"
             raise ValueError(msg)
 
-        value = int(match.group(1))
-        unit = match.group(2)
-
-        multipliers = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-        return value * multipliers[unit]
+        self._seconds = (self.every, seconds)
+        return seconds
 
 
 class FileWatchTrigger(BaseModel):
     """Trigger workflow when files change."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["file-watch"]
     path: str = Field(..., description="Path to watch (file or directory)")
     events: list[Literal["created", "modified", "deleted"]] = Field(
@@ -70,6 +162,8 @@ class FileWatchTrigger(BaseModel):
 class WebhookTrigger(BaseModel):
     """Trigger workflow via HTTP webhook."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["webhook"]
     path: str = Field(..., description="Webhook path like '/hooks/my-trigger'")
     secret: str | None = Field(default=None, description="Secret for authentication")
@@ -77,15 +171,21 @@ class WebhookTrigger(BaseModel):
     @field_validator("path")
     @classmethod
     def validate_path(cls, v: str) -> str:
-        """Ensure path starts with /."""
+        """Ensure path starts with /.
+
+        The normalized path is interned, so reloading a workflow reuses the
+        same str object instead of holding a new copy per reload.
+        """
         if not v.startswith("/"):
-            return f"/{v}"
-        return v
+            v = f"/{v}"
+        return sys.intern(v)
 
 
 class ManualTrigger(BaseModel):
     """Trigger workflow manually."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["manual"]
 
 
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from .nodes import ConditionNode, LoopNode, Node, ParallelNode
 from .triggers import ManualTrigger, Trigger
 
+# Default trigger for workflows that declare none, shared since triggers are frozen
+_MANUAL_TRIGGER = ManualTrigger(type="manual")
+
 
 class InputDefinition(BaseModel):
     """Definition for a workflow input parameter."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["string", "number", "boolean", "array", "object"] = Field(
         default="string", description="Input type"
     )
@@ -24,6 +29,8 @@ class InputDefinition(BaseModel):
 class WorkflowSettings(BaseModel):
     """Workflow execution settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     timeout: int = Field(default=300, ge=1, description="Total workflow timeout in seconds")
     retry: int = Field(default=0, ge=0, description="Number of retries on failure")
     retry_delay: int = Field(default=5, ge=0, description="Delay between retries in seconds")
@@ -43,7 +50,7 @@ class Workflow(BaseModel):
     description: str = Field(default="", description="Workflow description")
     version: int = Field(default=1, ge=1, description="Workflow version")
     triggers: list[Trigger] = Field(
-        default_factory=lambda: [ManualTrigger(type="manual")],  # type: ignore[arg-type]
+        default_factory=lambda: [_MANUAL_TRIGGER],  # type: ignore[arg-type]
         description="Workflow triggers",
     )
     inputs: dict[str, InputDefinition] = Field(default_factory=dict, description="Input parameters")
@@ -52,68 +59,96 @@ class Workflow(BaseModel):
         default_factory=WorkflowSettings, description="Workflow settings"
     )
 
+    # Node lookup by ID, built during validation
+    _node_index: dict[str, Node] = PrivateAttr(default_factory=dict)
+    # Control-flow nodes by type, built during validation
+    _condition_nodes: list[ConditionNode] = PrivateAttr(default_factory=list)
+    _loop_nodes: list[LoopNode] = PrivateAttr(default_factory=list)
+    _parallel_nodes: list[ParallelNode] = PrivateAttr(default_factory=list)
+
     @model_validator(mode="after")
-    def validate_node_references(self) -> Workflow:
-        """Validate all node ID references exist."""
-        node_ids = {n.id for n in self.nodes}
+    def validate_nodes(self) -> Workflow:
+        """Ensure node IDs are unique and all node ID references exist."""
+        node_ids: dict[str, Node] = {}
+        duplicates: dict[str, None] = {}  # Ordered set of duplicate IDs
+        # Control-flow nodes are rare, so collect them here rather than
+        # type-checking every node again for the reference checks below
+        conditions: list[ConditionNode] = []
+        loops: list[LoopNode] = []
+        parallels: list[ParallelNode] = []
+        for node in self.nodes:
+            if node.id in node_ids:
+                duplicates[node.id] = None
+            else:
+                node_ids[node.id] = node
+            node_type = type(node)
+            if node_type is ConditionNode:
+                conditions.append(node)  # type: ignore[arg-type]
+            elif node_type is LoopNode:
+                loops.append(node)  # type: ignore[arg-type]
+            elif node_type is ParallelNode:
+                parallels.append(node)  # type: ignore[arg-type]
+        self._node_index = node_ids
+        self._condition_nodes = conditions
+        self._loop_nodes = loops
+        self._parallel_nodes = parallels
+
         errors: list[str] = []
+        if duplicates:
+            errors.append(f"Duplicate node IDs found: {list(duplicates)}")
 
+        # Check depends_on references
         for node in self.nodes:
-            # Check depends_on references
             for dep_id in node.depends_on:
                 if dep_id not in node_ids:
                     errors.append(f"Node '{node.id}' depends on unknown node '{dep_id}'")
 
-            # Check condition node references
-            if isinstance(node, ConditionNode):
-                if node.then not in node_ids:
+        # Check condition node references
+        for condition in conditions:
+            if condition.then not in node_ids:
+                errors.append(
+                    f"Condition node '{condition.id}' references unknown 'then' node "
+                    f"'{condition.then}'"
+                )
+            if condition.else_node and condition.else_node not in node_ids:
+                errors.append(
+                    f"Condition node '{condition.id}' references unknown 'else' node "
+                    f"'{condition.else_node}'"
+                )
+
+        # Check loop node references
+        for loop in loops:
+            for do_node_id in loop.do:
+                if do_node_id not in node_ids:
                     errors.append(
-                        f"Condition node '{node.id}' references unknown 'then' node '{node.then}'"
+                        f"Loop node '{loop.id}' references unknown 'do' node '{do_node_id}'"
                     )
-                if node.else_node and node.else_node not in node_ids:
+
+        # Check parallel node references
+        for parallel in parallels:
+            for parallel_id in parallel.nodes:
+                if parallel_id not in node_ids:
                     errors.append(
-                        f"Condition node '{node.id}' references unknown 'else' node "
-                        f"'{node.else_node}'"
+                        f"Parallel node '{parallel.id}' references unknown node '{parallel_id}'"
                     )
 
-            # Check loop node references
-            if isinstance(node, LoopNode):
-                for do_node_id in node.do:
-                    if do_node_id not in node_ids:
-                        errors.append(
-                            f"Loop node '{node.id}' references unknown 'do' node '{do_node_id}'"
-                        )
-
-            # Check parallel node references
-            if isinstance(node, ParallelNode):
-                for parallel_id in node.nodes:
-                    if parallel_id not in node_ids:
-                        errors.append(
-                            f"Parallel node '{node.id}' references unknown node '{parallel_id}'"
-                        )
-
         if errors:
             raise ValueError("\n".join(errors))
 
         return self
 
-    @model_validator(mode="after")
-    def validate_no_duplicate_node_ids(self) -> Workflow:
-        """Ensure all node IDs are unique."""
-        node_ids = [n.id for n in self.nodes]
-        duplicates = [nid for nid in node_ids if node_ids.count(nid) > 1]
-        if duplicates:
-            unique_duplicates = list(set(duplicates))
-            raise ValueError(f"Duplicate node IDs found: {unique_duplicates}")
-        return self
+    def _get_node_index(self) -> dict[str, Node]:
+        """Get the node index, building it for unvalidated (model_construct) instances."""
+        if not self._node_index:
+            self._node_index = {}
+            for node in self.nodes:
+                self._node_index.setdefault(node.id, node)
+        return self._node_index
 
     def get_node(self, node_id: str) -> Node | None:
         """Get a node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._get_node_index().get(node_id)
 
     def get_node_ids(self) -> set[str]:
         """Get all node IDs."""
-        return {n.id for n in self.nodes}
+        return set(self._get_node_index())
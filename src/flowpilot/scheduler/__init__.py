@@ -3,16 +3,39 @@
 This module provides APScheduler-based workflow scheduling with cron
 and interval triggers, file system watching with watchdog, and job
 persistence via SQLite.
+
+Submodules are imported lazily on first attribute access so that importing
+the package does not pull in APScheduler, watchdog, or the storage layer.
 """
 
-from .file_watcher import (
-    DebouncedHandler,
-    FileWatchService,
-    set_global_file_watcher_runner,
-)
-from .manager import ScheduleManager, ScheduleManagerError
-from .service import SchedulerService
-from .triggers import is_schedulable, parse_cron_trigger, parse_interval_trigger, parse_trigger
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .file_watcher import (
+        DebouncedHandler,
+        FileWatchService,
+        set_global_file_watcher_runner,
+    )
+    from .manager import ScheduleManager, ScheduleManagerError
+    from .service import SchedulerService
+    from .triggers import is_schedulable, parse_cron_trigger, parse_interval_trigger, parse_trigger
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "DebouncedHandler": "file_watcher",
+    "FileWatchService": "file_watcher",
+    "set_global_file_watcher_runner": "file_watcher",
+    "ScheduleManager": "manager",
+    "ScheduleManagerError": "manager",
+    "SchedulerService": "service",
+    "is_schedulable": "triggers",
+    "parse_cron_trigger": "triggers",
+    "parse_interval_trigger": "triggers",
+    "parse_trigger": "triggers",
+}
 
 __all__ = [
     "DebouncedHandler",
@@ -26,3 +49,18 @@ __all__ = [
     "parse_trigger",
     "set_global_file_watcher_runner",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public names by importing their submodule on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including ones not yet imported."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,79 @@
+"""Long-lived asyncio event loop on a background thread."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+async def _cancel_running_tasks() -> None:
+    """Cancel every other task on the running loop and wait for them to finish."""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class BackgroundLoop:
+    """An asyncio event loop running forever on its own daemon thread.
+
+    Services that run workflows from other threads (scheduler jobs, file
+    events) submit them to one long-lived loop instead of creating and
+    tearing down a loop with asyncio.run() for every run.
+    """
+
+    def __init__(self, thread_name: str, description: str) -> None:
+        """Initialize the background loop.
+
+        Args:
+            thread_name: Name of the thread running the loop.
+            description: What runs on the loop, for log messages.
+        """
+        self._thread_name = thread_name
+        self._description = description
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """The running loop, or None when stopped."""
+        return self._loop
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop on its thread, if it is not already running.
+
+        Returns:
+            The running event loop.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name=self._thread_name, daemon=True
+            )
+            self._thread.start()
+        return self._loop
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Cancel tasks still running on the loop, then stop and close it.
+
+        Args:
+            timeout: Seconds to wait for cancellation and for the thread to exit.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_running_tasks(), loop).result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            logger.warning(f"Timed out cancelling running {self._description}")
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        if not loop.is_running():
+            loop.close()
+        self._loop = None
+        self._thread = None
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import fnmatch
+import heapq
+import itertools
 import logging
+import re
 import threading
-from collections.abc import Sequence  # noqa: TC003 - used in function signature
+import time
+from collections.abc import Callable, Sequence  # noqa: TC003 - used in function signature
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -14,7 +19,11 @@ from typing import TYPE_CHECKING, Any
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from .background_loop import BackgroundLoop
+
 if TYPE_CHECKING:
+    import concurrent.futures
+
     from flowpilot.engine.runner import WorkflowRunner
     from flowpilot.models.triggers import FileWatchTrigger
 
@@ -23,6 +32,20 @@ logger = logging.getLogger(__name__)
 # Global reference to runner for file watch execution (set via set_global_runner)
 _global_runner: WorkflowRunner | None = None
 
+# Event loop that file-watch executions are submitted to (owned by FileWatchService)
+_global_loop: asyncio.AbstractEventLoop | None = None
+
+# Runs submitted to _global_loop that have not finished yet (keeps them referenced)
+_inflight: set[concurrent.futures.Future[Any]] = set()
+
+# Map watchdog event types to our types
+_EVENT_TYPE_MAP = {
+    "created": "created",
+    "modified": "modified",
+    "deleted": "deleted",
+    "moved": "modified",  # Treat move as modified
+}
+
 
 def set_global_file_watcher_runner(runner: WorkflowRunner | None) -> None:
     """Set the global workflow runner for file watch execution.
@@ -34,11 +57,29 @@ def set_global_file_watcher_runner(runner: WorkflowRunner | None) -> None:
     _global_runner = runner
 
 
+def _event_path(event: FileSystemEvent) -> str:
+    """Get an event's source path as a string (watchdog may report bytes)."""
+    src_path = event.src_path
+    return src_path if isinstance(src_path, str) else src_path.decode()
+
+
+@dataclass(eq=False)
+class _Subscription:
+    """A callback registered on a DebouncedHandler with its own filters."""
+
+    callback: Callable[[FileSystemEvent], None]
+    event_set: frozenset[str]
+    pattern_re: re.Pattern[str] | None
+    debounce_seconds: float
+
+
 class DebouncedHandler(FileSystemEventHandler):
     """Handler that debounces rapid file changes.
 
     Filters events by type and glob pattern, and debounces rapid changes
     to avoid triggering multiple workflow executions for a single file operation.
+    Several callbacks (e.g. workflows watching the same directory) can share one
+    handler; each keeps its own filters and debounce state.
     """
 
     def __init__(
@@ -57,64 +98,144 @@ class DebouncedHandler(FileSystemEventHandler):
             debounce_seconds: Time to wait before firing callback.
         """
         super().__init__()
-        self.callback = callback
-        self.events = events
-        self.pattern = pattern
-        self.debounce_seconds = debounce_seconds
-        self._pending: dict[str, datetime] = {}
-        self._timers: dict[str, threading.Timer] = {}
+        # Replaced (never mutated) on add/remove so the observer thread can
+        # iterate it without locking
+        self._subscriptions: tuple[_Subscription, ...] = ()
+        # (path, subscription) -> (monotonic deadline, latest event); a single
+        # worker thread drains a heap of deadlines instead of spawning a Timer
+        # per event
+        self._pending: dict[tuple[str, _Subscription], tuple[float, FileSystemEvent]] = {}
+        self._deadlines: list[tuple[float, int, str, _Subscription]] = []
+        self._sequence = itertools.count()  # Heap tie-breaker
         self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._worker: threading.Thread | None = None
+        self.add_callback(callback, events, pattern, debounce_seconds)
 
-    def _should_handle(self, event: FileSystemEvent) -> bool:
-        """Check if event should be handled.
+    def add_callback(
+        self,
+        callback: Callable[[FileSystemEvent], None],
+        events: Sequence[str],
+        pattern: str | None = None,
+        debounce_seconds: float = 1.0,
+    ) -> None:
+        """Register another callback with its own filters on this handler.
 
         Args:
-            event: The file system event to check.
+            callback: Function to call when debounced event fires.
+            events: List of event types to handle (created, modified, deleted).
+            pattern: Optional glob pattern to filter files.
+            debounce_seconds: Time to wait before firing callback.
+        """
+        subscription = _Subscription(
+            callback=callback,
+            event_set=frozenset(events),
+            pattern_re=re.compile(fnmatch.translate(pattern)) if pattern else None,
+            debounce_seconds=debounce_seconds,
+        )
+        with self._lock:
+            self._subscriptions = (*self._subscriptions, subscription)
+
+    def remove_callback(self, callback: Callable[[FileSystemEvent], None]) -> int:
+        """Unregister a callback and drop its pending events.
+
+        Args:
+            callback: Callback previously passed to the handler.
 
         Returns:
-            True if event should be handled, False otherwise.
+            Number of callbacks still registered.
         """
-        if event.is_directory:
-            return False
+        with self._wakeup:
+            self._subscriptions = tuple(
+                sub for sub in self._subscriptions if sub.callback is not callback
+            )
+            self._pending = {
+                key: entry
+                for key, entry in self._pending.items()
+                if key[1].callback is not callback
+            }
+            self._wakeup.notify()
+            return len(self._subscriptions)
 
-        # Map watchdog event types to our types
-        event_type_map = {
-            "created": "created",
-            "modified": "modified",
-            "deleted": "deleted",
-            "moved": "modified",  # Treat move as modified
-        }
+    def _matching_subscriptions(
+        self, event: FileSystemEvent, path: str | None = None
+    ) -> list[_Subscription]:
+        """Get the callbacks whose filters accept an event.
 
-        event_type = event_type_map.get(event.event_type)
-        if event_type not in self.events:
-            return False
+        Args:
+            event: The file system event to check.
+            path: The event's source path, if already decoded.
 
-        # Check pattern
-        if self.pattern:
-            src_path = event.src_path
-            path_str = src_path if isinstance(src_path, str) else src_path.decode()
-            filename = Path(path_str).name
-            if not fnmatch.fnmatch(filename, self.pattern):
-                return False
+        Returns:
+            Subscriptions that should receive the event.
+        """
+        if event.is_directory:
+            return []
+
+        event_type = _EVENT_TYPE_MAP.get(event.event_type)
+        filename: str | None = None
+        matches = []
+        for sub in self._subscriptions:
+            if event_type not in sub.event_set:
+                continue
+
+            # Check pattern
+            if sub.pattern_re is not None:
+                if filename is None:
+                    filename = Path(path if path is not None else _event_path(event)).name
+                if sub.pattern_re.match(filename) is None:
+                    continue
+
+            matches.append(sub)
+        return matches
+
+    def _should_handle(self, event: FileSystemEvent, path: str | None = None) -> bool:
+        """Check if event should be handled.
 
-        return True
+        Args:
+            event: The file system event to check.
+            path: The event's source path, if already decoded.
 
-    def _debounced_callback(self, event: FileSystemEvent) -> None:
-        """Called after debounce period.
+        Returns:
+            True if event should be handled, False otherwise.
+        """
+        return bool(self._matching_subscriptions(event, path))
 
-        Args:
-            event: The file system event to handle.
+    def _next_due_event(self) -> tuple[_Subscription, str, FileSystemEvent] | None:
+        """Wait for the next debounced event to come due.
+
+        Returns:
+            The subscription, path and latest event whose debounce period
+            elapsed, or None once nothing is pending (the worker then exits).
         """
-        src_path = event.src_path
-        path = src_path if isinstance(src_path, str) else src_path.decode()
-        with self._lock:
-            if path in self._pending:
-                del self._pending[path]
-            if path in self._timers:
-                del self._timers[path]
+        with self._wakeup:
+            while self._deadlines:
+                deadline, _, path, sub = self._deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+
+                heapq.heappop(self._deadlines)
+                entry = self._pending.get((path, sub))
+                if entry is None or entry[0] != deadline:
+                    continue  # Stale: the path was rescheduled or cancelled
+
+                del self._pending[(path, sub)]
+                return sub, path, entry[1]
+
+            self._worker = None
+            return None
 
-        logger.debug(f"Debounce complete for {path}, calling callback")
-        self.callback(event)
+    def _run_worker(self) -> None:
+        """Fire callbacks for debounced events until nothing is pending."""
+        while (due := self._next_due_event()) is not None:
+            sub, path, event = due
+            logger.debug(f"Debounce complete for {path}, calling callback")
+            try:
+                sub.callback(event)
+            except Exception:
+                logger.exception(f"File watch callback failed for {path}")
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle any file system event.
@@ -122,37 +243,35 @@ class DebouncedHandler(FileSystemEventHandler):
         Args:
             event: The file system event.
         """
-        if not self._should_handle(event):
+        path = _event_path(event)
+        subscriptions = self._matching_subscriptions(event, path)
+        if not subscriptions:
             return
 
-        src_path = event.src_path
-        path = src_path if isinstance(src_path, str) else src_path.decode()
         logger.debug(f"File event: {event.event_type} - {path}")
 
-        with self._lock:
-            # Cancel existing timer for this path
-            if path in self._timers:
-                self._timers[path].cancel()
-
-            # Record pending event
-            self._pending[path] = datetime.now()
-
-            # Schedule new callback after debounce period
-            timer = threading.Timer(
-                self.debounce_seconds,
-                self._debounced_callback,
-                args=[event],
-            )
-            self._timers[path] = timer
-            timer.start()
+        with self._wakeup:
+            # (Re)schedule each callback; any earlier deadline for it goes stale
+            now = time.monotonic()
+            for sub in subscriptions:
+                deadline = now + sub.debounce_seconds
+                self._pending[(path, sub)] = (deadline, event)
+                heapq.heappush(self._deadlines, (deadline, next(self._sequence), path, sub))
+
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="flowpilot-debounce", daemon=True
+                )
+                self._worker.start()
+            else:
+                self._wakeup.notify()
 
     def cancel_all(self) -> None:
-        """Cancel all pending timers."""
-        with self._lock:
-            for timer in self._timers.values():
-                timer.cancel()
-            self._timers.clear()
+        """Cancel all pending callbacks."""
+        with self._wakeup:
             self._pending.clear()
+            self._deadlines.clear()
+            self._wakeup.notify()
 
 
 class FileWatchService:
@@ -167,6 +286,11 @@ class FileWatchService:
         self._observer = Observer()
         self._watches: dict[str, Any] = {}  # workflow_name -> watch handle
         self._handlers: dict[str, DebouncedHandler] = {}  # workflow_name -> handler
+        self._callbacks: dict[str, Callable[[FileSystemEvent], None]] = {}  # workflow_name -> cb
+        # (watched directory, recursive) -> (shared handler, watch handle)
+        self._dir_handlers: dict[tuple[str, bool], tuple[DebouncedHandler, Any]] = {}
+        self._by_path: dict[str, set[str]] = {}  # watched directory -> workflow names
+        self._loop = BackgroundLoop("flowpilot-file-watch-loop", "file-watch workflows")
         self._running = False
 
     @property
@@ -179,6 +303,7 @@ class FileWatchService:
         if self._running:
             return
 
+        self._start_loop()
         self._observer.start()
         self._running = True
         logger.info("File watcher started")
@@ -189,14 +314,32 @@ class FileWatchService:
             return
 
         # Cancel all pending debounced callbacks
-        for handler in self._handlers.values():
+        for handler, _ in self._dir_handlers.values():
             handler.cancel_all()
 
         self._observer.stop()
         self._observer.join(timeout=5.0)
+        self._stop_loop()
         self._running = False
         logger.info("File watcher stopped")
 
+    def _start_loop(self) -> None:
+        """Start the background event loop that runs triggered workflows.
+
+        One long-lived loop replaces creating and tearing down a loop with
+        asyncio.run() for every file event.
+        """
+        global _global_loop
+        _global_loop = self._loop.start()
+
+    def _stop_loop(self) -> None:
+        """Stop and close the background event loop."""
+        global _global_loop
+        if _global_loop is not None and _global_loop is self._loop.loop:
+            _global_loop = None
+        # Workflows are submitted without waiting, so any still running are cancelled
+        self._loop.stop()
+
     def add_watch(
         self,
         workflow_name: str,
@@ -222,23 +365,14 @@ class FileWatchService:
 
         def on_file_event(event: FileSystemEvent) -> None:
             """Callback when file event occurs."""
-            src_path = event.src_path
-            event_path = src_path if isinstance(src_path, str) else src_path.decode()
             _execute_file_watch_workflow(
                 workflow_name=workflow_name,
                 workflow_path=workflow_path,
                 event_type=event.event_type,
-                event_path=event_path,
+                event_path=_event_path(event),
                 event_is_directory=event.is_directory,
             )
 
-        handler = DebouncedHandler(
-            callback=on_file_event,
-            events=trigger.events,
-            pattern=trigger.pattern,
-            debounce_seconds=debounce_seconds,
-        )
-
         # Watch directory or parent of file
         if watch_path.is_dir():
             watch_dir = watch_path
@@ -247,14 +381,36 @@ class FileWatchService:
             watch_dir = watch_path.parent
             recursive = False
 
-        watch = self._observer.schedule(
-            handler,
-            str(watch_dir),
-            recursive=recursive,
-        )
+        # Workflows watching the same directory share one handler, so each
+        # event is dispatched and filtered once rather than once per workflow
+        key = (str(watch_dir), recursive)
+        shared = self._dir_handlers.get(key)
+        if shared is None:
+            handler = DebouncedHandler(
+                callback=on_file_event,
+                events=trigger.events,
+                pattern=trigger.pattern,
+                debounce_seconds=debounce_seconds,
+            )
+            watch = self._observer.schedule(
+                handler,
+                str(watch_dir),
+                recursive=recursive,
+            )
+            self._dir_handlers[key] = (handler, watch)
+        else:
+            handler, watch = shared
+            handler.add_callback(
+                on_file_event,
+                events=trigger.events,
+                pattern=trigger.pattern,
+                debounce_seconds=debounce_seconds,
+            )
 
         self._watches[workflow_name] = watch
         self._handlers[workflow_name] = handler
+        self._callbacks[workflow_name] = on_file_event
+        self._by_path.setdefault(str(watch_dir), set()).add(workflow_name)
 
         logger.info(
             f"Added file watch for workflow '{workflow_name}' on {watch_dir} "
@@ -275,17 +431,41 @@ class FileWatchService:
         if workflow_name not in self._watches:
             return False
 
-        # Cancel pending timers
-        if workflow_name in self._handlers:
-            self._handlers[workflow_name].cancel_all()
-            del self._handlers[workflow_name]
-
-        self._observer.unschedule(self._watches[workflow_name])
-        del self._watches[workflow_name]
+        # Detach this workflow's callback (and its pending events); the
+        # directory is unscheduled once no workflow is watching it
+        handler = self._handlers.pop(workflow_name)
+        callback = self._callbacks.pop(workflow_name)
+        watch = self._watches.pop(workflow_name)
+        if handler.remove_callback(callback) == 0:
+            handler.cancel_all()
+            self._observer.unschedule(watch)
+            del self._dir_handlers[(str(watch.path), watch.is_recursive)]
+        self._discard_path_entry(str(watch.path), workflow_name)
 
         logger.info(f"Removed file watch for workflow: {workflow_name}")
         return True
 
+    def _discard_path_entry(self, watch_dir: str, workflow_name: str) -> None:
+        """Remove a workflow from the reverse path index."""
+        names = self._by_path.get(watch_dir)
+        if names is None:
+            return
+        names.discard(workflow_name)
+        if not names:
+            del self._by_path[watch_dir]
+
+    def get_watches_for_path(self, path: str | Path) -> set[str]:
+        """Get the workflows watching a directory.
+
+        Args:
+            path: Watched directory (``~`` is expanded).
+
+        Returns:
+            Names of workflows with a watch scheduled on that directory.
+        """
+        watch_dir = str(Path(path).expanduser().resolve())
+        return set(self._by_path.get(watch_dir, ()))
+
     def get_watches(self) -> list[dict[str, Any]]:
         """Get all active file watches.
 
@@ -321,6 +501,28 @@ class FileWatchService:
         }
 
 
+def _log_completion(workflow_name: str, future: concurrent.futures.Future[Any]) -> None:
+    """Log the outcome of a file-watch workflow submitted to the service loop.
+
+    Args:
+        workflow_name: Name of the workflow.
+        future: Future for the workflow run.
+    """
+    _inflight.discard(future)
+    if future.cancelled():
+        logger.warning(f"File-watch workflow cancelled: {workflow_name}")
+        return
+
+    exc = future.exception()
+    if exc is not None:
+        logger.error(
+            f"Failed to execute file-watch workflow '{workflow_name}': {exc}",
+            exc_info=exc,
+        )
+    else:
+        logger.info(f"Completed file-watch workflow: {workflow_name}")
+
+
 def _execute_file_watch_workflow(
     workflow_name: str,
     workflow_path: str,
@@ -339,20 +541,17 @@ def _execute_file_watch_workflow(
         event_path: Path to the affected file.
         event_is_directory: Whether the event is for a directory.
     """
-    from flowpilot.engine.parser import WorkflowParser
-
     if _global_runner is None:
         logger.error(f"Cannot execute workflow '{workflow_name}': no runner configured")
         return
 
-    path = Path(workflow_path)
-    if not path.exists():
-        logger.error(f"Workflow file not found: {path}")
-        return
+    # Imported here so importing the watcher does not pull in the engine
+    from flowpilot.engine.parser import load_workflow_file
 
+    path = Path(workflow_path)
     try:
-        parser = WorkflowParser()
-        workflow = parser.parse_file(path)
+        # File events are frequent and the workflow file rarely changes between them
+        workflow = load_workflow_file(path)
 
         # Pass file event info as special inputs
         inputs = {
@@ -369,17 +568,26 @@ def _execute_file_watch_workflow(
             f"(event={event_type}, path={event_path})"
         )
 
-        # Run the async workflow in an event loop
-        asyncio.run(
-            _global_runner.run(
-                workflow,
-                inputs=inputs,
-                workflow_path=str(path),
-                trigger_type="file-watch",
-            )
+        coro = _global_runner.run(
+            workflow,
+            inputs=inputs,
+            workflow_path=str(path),
+            trigger_type="file-watch",
         )
+        loop = _global_loop
+        if loop is not None and loop.is_running():
+            # Submit to the service's event loop without waiting, so the debounce
+            # worker can dispatch the next event while this workflow runs
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+            _inflight.add(future)
+            future.add_done_callback(lambda f: _log_completion(workflow_name, f))
+            return
 
+        # No service loop (e.g. called directly); use a temporary one
+        asyncio.run(coro)
         logger.info(f"Completed file-watch workflow: {workflow_name}")
 
+    except FileNotFoundError:
+        logger.error(f"Workflow file not found: {path}")
     except Exception as e:
         logger.exception(f"Failed to execute file-watch workflow '{workflow_name}': {e}")
@@ -2,48 +2,122 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeGuard
+from typing import TYPE_CHECKING, Any
 
-from flowpilot.engine.parser import WorkflowParser
-from flowpilot.storage import Database, Schedule, ScheduleRepository
+from flowpilot.engine.parser import WORKFLOW_CACHE_SIZE, load_workflow_file
+from flowpilot.storage import Database, ScheduleRepository
 
 from .file_watcher import FileWatchService  # noqa: TC001
 from .service import SchedulerService  # noqa: TC001
-from .triggers import is_schedulable, parse_trigger
+from .triggers import SCHEDULABLE_TRIGGER_TYPES, parse_trigger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+    from sqlalchemy.orm import Session
+
     from flowpilot.api.webhooks import WebhookService
     from flowpilot.models import Workflow
-    from flowpilot.models.triggers import FileWatchTrigger, WebhookTrigger
+    from flowpilot.models.triggers import FileWatchTrigger, Trigger, WebhookTrigger
 
 logger = logging.getLogger(__name__)
 
+# Grouped triggers of workflows from load_workflow_file, shared by every
+# ScheduleManager in the process; path -> (workflow, its grouped triggers),
+# least recently used first
+_trigger_cache: OrderedDict[Path, tuple[Workflow, _WorkflowTriggers]] = OrderedDict()
+_trigger_cache_lock = threading.Lock()
+
+# How long get_status(name) results are reused, and how many names are kept
+_STATUS_CACHE_TTL = 1.0
+_STATUS_CACHE_SIZE = 1024
+
+# Timestamp shared by every write in the current batch operation (see _now)
+_batch_now: ContextVar[datetime | None] = ContextVar("schedule_manager_batch_now", default=None)
+
+
+def _now() -> datetime:
+    """Get the current time, or the timestamp sampled for the running batch."""
+    return _batch_now.get() or datetime.now(UTC)
 
-def _is_file_watch_trigger(trigger: Any) -> TypeGuard[FileWatchTrigger]:
-    """Check if trigger is a file-watch trigger.
+
+def _format_stored_trigger_config(trigger_config: dict[str, Any] | None) -> str | None:
+    """Format a stored trigger config for status output.
 
     Args:
-        trigger: The trigger to check.
+        trigger_config: The trigger config stored with a schedule.
 
     Returns:
-        True if file-watch trigger, False otherwise.
+        The config as a JSON string, or None if there is none.
     """
-    return getattr(trigger, "type", None) == "file-watch"
+    if not trigger_config:
+        return None
+    if orjson is not None:
+        try:
+            return orjson.dumps(trigger_config, default=str).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let stdlib handle it
+    return json.dumps(trigger_config, default=str)
+
 
+@dataclass(frozen=True)
+class _WorkflowTriggers:
+    """A parsed workflow's triggers grouped by how they are registered."""
 
-def _is_webhook_trigger(trigger: Any) -> TypeGuard[WebhookTrigger]:
-    """Check if trigger is a webhook trigger.
+    schedulable: list[Trigger]
+    file_watches: list[FileWatchTrigger]
+    webhooks: list[WebhookTrigger]
+    # Combined trigger config stored with the workflow's schedule
+    stored_config: dict[str, Any]
+
+
+def _group_triggers(workflow: Workflow) -> _WorkflowTriggers:
+    """Group a workflow's triggers and build the trigger config to store.
 
     Args:
-        trigger: The trigger to check.
+        workflow: The workflow being enabled.
 
     Returns:
-        True if webhook trigger, False otherwise.
+        Schedulable, file-watch and webhook triggers with their serialized config.
     """
-    return getattr(trigger, "type", None) == "webhook"
+    schedulable: list[Trigger] = []
+    file_watches: list[FileWatchTrigger] = []
+    webhooks: list[WebhookTrigger] = []
+    # One pass, dispatching on each trigger's type tag
+    for trigger in workflow.triggers:
+        if trigger.type in SCHEDULABLE_TRIGGER_TYPES:
+            schedulable.append(trigger)
+        elif trigger.type == "file-watch":
+            file_watches.append(trigger)
+        elif trigger.type == "webhook":
+            webhooks.append(trigger)
+
+    # Unset optional fields (pattern, secret) are left out of the stored JSON
+    stored_config: dict[str, Any] = {}
+    if schedulable:
+        stored_config["schedule"] = schedulable[0].model_dump(exclude_none=True)
+    if file_watches:
+        stored_config["file_watches"] = [fw.model_dump(exclude_none=True) for fw in file_watches]
+    if webhooks:
+        stored_config["webhooks"] = [wh.model_dump(exclude_none=True) for wh in webhooks]
+    return _WorkflowTriggers(schedulable, file_watches, webhooks, stored_config)
 
 
 class ScheduleManagerError(Exception):
@@ -79,7 +153,46 @@ class ScheduleManager:
         self._file_watcher = file_watcher
         self._webhook_service = webhook_service
         self._workflows_dir = workflows_dir or (Path.home() / ".flowpilot" / "workflows")
-        self._parser = WorkflowParser()
+        # Workflow name -> file, from one scan of workflows_dir; rescanned when
+        # the directory's mtime changes (files added, removed or renamed)
+        self._dir_index: dict[str, Path] = {}
+        self._dir_mtime: int | None = None
+        # Workflow name -> (time.monotonic() when fetched, statuses), oldest first;
+        # absorbs bursts of polling for the same workflow
+        self._status_cache: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._status_cache_lock = threading.Lock()
+        # Session shared by calls made inside session_scope() in this context
+        self._current_session: ContextVar[Session | None] = ContextVar(
+            f"schedule_manager_session_{id(self)}", default=None
+        )
+
+    @contextmanager
+    def session_scope(self) -> Generator[Session, None, None]:
+        """Provide a database session shared by nested manager calls.
+
+        The outermost scope opens a transactional session; manager methods
+        called inside it reuse that session instead of checking out a new
+        connection and committing per call. Usage:
+
+            with manager.session_scope():
+                manager.enable_workflow("a")
+                manager.update_last_run("a", "success")
+
+        Yields:
+            The active SQLAlchemy Session, committed when the outermost
+            scope exits successfully and rolled back on exception.
+        """
+        current = self._current_session.get()
+        if current is not None:
+            yield current
+            return
+
+        with self._db.session_scope() as session:
+            token = self._current_session.set(session)
+            try:
+                yield session
+            finally:
+                self._current_session.reset(token)
 
     def _find_workflow_path(self, workflow_name: str) -> Path:
         """Find the path to a workflow file.
@@ -93,13 +206,41 @@ class ScheduleManager:
         Raises:
             ScheduleManagerError: If workflow file not found.
         """
-        for ext in [".yaml", ".yml"]:
-            path = self._workflows_dir / f"{workflow_name}{ext}"
-            if path.exists():
-                return path
+        try:
+            index = self._get_dir_index()
+            if workflow_name not in index:
+                # Directory mtimes are coarse, so a file added just after the
+                # last scan may not have changed it yet; rescan before failing
+                self._dir_mtime = None
+                index = self._get_dir_index()
+            return index[workflow_name]
+        except (KeyError, OSError):
+            msg = f"Workflow not found: {workflow_name}"
+            raise ScheduleManagerError(msg) from None
+
+    def _get_dir_index(self) -> dict[str, Path]:
+        """Get the workflow file index, rescanning the directory if it changed.
 
-        msg = f"Workflow not found: {workflow_name}"
-        raise ScheduleManagerError(msg)
+        Returns:
+            Mapping of workflow name to workflow file path.
+
+        Raises:
+            OSError: If the workflows directory cannot be read.
+        """
+        mtime = self._workflows_dir.stat().st_mtime_ns
+        if mtime != self._dir_mtime:
+            index: dict[str, Path] = {}
+            with os.scandir(self._workflows_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext not in (".yaml", ".yml") or not entry.is_file():
+                        continue
+                    # Prefer .yaml when both extensions exist
+                    if ext == ".yaml" or stem not in index:
+                        index[stem] = Path(entry.path)
+            self._dir_index = index
+            self._dir_mtime = mtime
+        return self._dir_index
 
     def _load_workflow(self, workflow_name: str) -> tuple[Workflow, Path]:
         """Load a workflow by name.
@@ -116,11 +257,80 @@ class ScheduleManager:
         path = self._find_workflow_path(workflow_name)
 
         try:
-            workflow = self._parser.parse_file(path)
-            return workflow, path
+            workflow = load_workflow_file(path)
+        except FileNotFoundError:
+            # Removed since the directory was last scanned
+            self._dir_mtime = None
+            msg = f"Workflow not found: {workflow_name}"
+            raise ScheduleManagerError(msg) from None
         except Exception as e:
             msg = f"Failed to load workflow '{workflow_name}': {e}"
             raise ScheduleManagerError(msg) from e
+        return workflow, path
+
+    def warm_cache(self) -> int:
+        """Parse the workflows in the workflows directory ahead of first use.
+
+        Files are read and parsed on a thread pool. Workflows that fail to
+        load are skipped; the error is reported when they are next used.
+
+        Returns:
+            Number of workflows loaded into the parse cache.
+        """
+        try:
+            names = list(self._get_dir_index())[:WORKFLOW_CACHE_SIZE]
+        except OSError:
+            return 0
+        return self._load_many(names)
+
+    def _load_many(self, workflow_names: list[str]) -> int:
+        """Parse several workflows into the parse cache on a thread pool.
+
+        Args:
+            workflow_names: Names of the workflows to load.
+
+        Returns:
+            Number of workflows loaded; failures are skipped.
+        """
+
+        def load(name: str) -> bool:
+            try:
+                self._load_workflow(name)
+            except ScheduleManagerError as e:
+                logger.debug("Skipping workflow while preloading: %s", e)
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return sum(executor.map(load, workflow_names))
+
+    def _get_workflow_triggers(self, path: Path, workflow: Workflow) -> _WorkflowTriggers:
+        """Get a workflow's grouped triggers.
+
+        Triggers are grouped and serialized once per parsed workflow;
+        triggers are frozen, so that stays valid for as long as
+        load_workflow_file keeps returning the same workflow object.
+
+        Args:
+            path: Path to the workflow file.
+            workflow: The parsed workflow.
+
+        Returns:
+            The workflow's triggers grouped by kind, with their stored config.
+        """
+        with _trigger_cache_lock:
+            cached = _trigger_cache.get(path)
+            if cached is not None and cached[0] is workflow:
+                _trigger_cache.move_to_end(path)
+                return cached[1]
+
+        triggers = _group_triggers(workflow)
+        with _trigger_cache_lock:
+            _trigger_cache[path] = (workflow, triggers)
+            _trigger_cache.move_to_end(path)
+            if len(_trigger_cache) > WORKFLOW_CACHE_SIZE:
+                _trigger_cache.popitem(last=False)
+        return triggers
 
     def enable_workflow(self, workflow_name: str) -> dict[str, Any]:
         """Enable scheduling for a workflow.
@@ -131,15 +341,82 @@ class ScheduleManager:
         Returns:
             Dictionary with scheduling results for all trigger types.
 
+        Raises:
+            ScheduleManagerError: If workflow has no schedulable triggers.
+        """
+        result, row = self._register_triggers(workflow_name)
+
+        with self.session_scope() as session:
+            ScheduleRepository(session).upsert(**row)
+        self._invalidate_status(workflow_name)
+
+        logger.info(f"Enabled schedule for workflow: {workflow_name}")
+
+        return result
+
+    def enable_workflows(self, workflow_names: list[str]) -> list[dict[str, Any]]:
+        """Enable scheduling for several workflows.
+
+        The scheduler picks up all the new jobs in one wakeup, and the
+        schedule records are written in one batched upsert rather than one
+        round-trip per workflow.
+
+        Args:
+            workflow_names: Names of the workflows to enable.
+
+        Returns:
+            Scheduling results for each workflow, in order.
+
+        Raises:
+            ScheduleManagerError: If a workflow cannot be loaded or has no
+                schedulable triggers. Workflows enabled before it are still
+                recorded.
+        """
+        # Parse concurrently up front; registration below then hits the cache
+        # and reports any load error in order
+        if len(workflow_names) > 1:
+            self._load_many(workflow_names)
+
+        results: list[dict[str, Any]] = []
+        rows: list[dict[str, Any]] = []
+        # Stamp every record in the batch with one timestamp
+        token = _batch_now.set(_now())
+        try:
+            with self._scheduler.batch():
+                for workflow_name in workflow_names:
+                    result, row = self._register_triggers(workflow_name)
+                    results.append(result)
+                    rows.append(row)
+        finally:
+            _batch_now.reset(token)
+            if rows:
+                with self.session_scope() as session:
+                    ScheduleRepository(session).bulk_upsert(rows)
+                for row in rows:
+                    self._invalidate_status(row["workflow_name"])
+                logger.info(f"Enabled schedules for {len(rows)} workflows")
+
+        return results
+
+    def _register_triggers(self, workflow_name: str) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Register a workflow's triggers with the scheduler and watch services.
+
+        Args:
+            workflow_name: Name of the workflow to enable.
+
+        Returns:
+            Tuple of (scheduling results, schedule record values to store).
+
         Raises:
             ScheduleManagerError: If workflow has no schedulable triggers.
         """
         workflow, path = self._load_workflow(workflow_name)
 
         # Find all trigger types
-        schedulable = [t for t in workflow.triggers if is_schedulable(t)]
-        file_watches = [t for t in workflow.triggers if _is_file_watch_trigger(t)]
-        webhooks = [t for t in workflow.triggers if _is_webhook_trigger(t)]
+        triggers = self._get_workflow_triggers(path, workflow)
+        schedulable = triggers.schedulable
+        file_watches = triggers.file_watches
+        webhooks = triggers.webhooks
 
         if not schedulable and not file_watches and not webhooks:
             msg = (
@@ -162,13 +439,11 @@ class ScheduleManager:
             trigger_config = schedulable[0]
             ap_trigger = parse_trigger(trigger_config)
 
-            job_id = self._scheduler.schedule_workflow(
+            job_id, next_run = self._scheduler.schedule_workflow(
                 workflow,
                 ap_trigger,
                 workflow_path=str(path),
             )
-
-            next_run = self._scheduler.get_next_run(workflow_name)
             result["scheduled"].append(
                 {
                     "type": trigger_config.type,
@@ -211,43 +486,66 @@ class ScheduleManager:
                     }
                 )
 
+        row = {
+            "workflow_name": workflow_name,
+            "workflow_path": str(path),
+            "enabled": True,
+            "trigger_config": triggers.stored_config,
+            "next_run": next_run,
+            "updated_at": _now(),
+        }
+        return result, row
+
+    def disable_workflow(self, workflow_name: str) -> dict[str, Any]:
+        """Disable scheduling for a workflow.
+
+        Args:
+            workflow_name: Name of the workflow to disable.
+
+        Returns:
+            Dictionary with disabled trigger info.
+        """
+        result = self._unregister_triggers(workflow_name)
+
         # Update database
-        with self._db.session_scope() as session:
-            repo = ScheduleRepository(session)
-            schedule = repo.get_by_workflow(workflow_name)
-
-            # Build combined trigger config for storage
-            combined_config: dict[str, Any] = {}
-            if trigger_config:
-                combined_config["schedule"] = trigger_config.model_dump()
-            if file_watches:
-                combined_config["file_watches"] = [fw.model_dump() for fw in file_watches]
-            if webhooks:
-                combined_config["webhooks"] = [wh.model_dump() for wh in webhooks]
-
-            if schedule is None:
-                schedule = Schedule(
-                    workflow_name=workflow_name,
-                    workflow_path=str(path),
-                    enabled=1,
-                    trigger_config=combined_config,
-                    next_run=next_run,
-                )
-                repo.create(schedule)
-            else:
-                schedule.enabled = 1
-                schedule.workflow_path = str(path)
-                schedule.trigger_config = combined_config
-                schedule.next_run = next_run
-                schedule.updated_at = datetime.now(UTC)
-                repo.update(schedule)
+        with self.session_scope() as session:
+            ScheduleRepository(session).update_by_workflow(
+                workflow_name, enabled=False, next_run=None, updated_at=_now()
+            )
+        self._invalidate_status(workflow_name)
 
-        logger.info(f"Enabled schedule for workflow: {workflow_name}")
+        if result["schedule_removed"] or result["file_watch_removed"] or result["webhook_removed"]:
+            logger.info(f"Disabled schedule for workflow: {workflow_name}")
 
         return result
 
-    def disable_workflow(self, workflow_name: str) -> dict[str, Any]:
-        """Disable scheduling for a workflow.
+    def disable_workflows(self, workflow_names: list[str]) -> list[dict[str, Any]]:
+        """Disable scheduling for several workflows.
+
+        The schedule records are updated in one statement rather than one
+        round-trip per workflow.
+
+        Args:
+            workflow_names: Names of the workflows to disable.
+
+        Returns:
+            Disabled trigger info for each workflow, in order.
+        """
+        results = [self._unregister_triggers(name) for name in workflow_names]
+
+        with self.session_scope() as session:
+            ScheduleRepository(session).update_by_workflows(
+                workflow_names, enabled=False, next_run=None, updated_at=_now()
+            )
+        for workflow_name in workflow_names:
+            self._invalidate_status(workflow_name)
+
+        logger.info(f"Disabled schedules for {len(workflow_names)} workflows")
+
+        return results
+
+    def _unregister_triggers(self, workflow_name: str) -> dict[str, Any]:
+        """Remove a workflow's job, file watch and webhook.
 
         Args:
             workflow_name: Name of the workflow to disable.
@@ -273,20 +571,6 @@ class ScheduleManager:
         if self._webhook_service:
             result["webhook_removed"] = self._webhook_service.unregister(workflow_name)
 
-        # Update database
-        with self._db.session_scope() as session:
-            repo = ScheduleRepository(session)
-            schedule = repo.get_by_workflow(workflow_name)
-
-            if schedule:
-                schedule.enabled = 0
-                schedule.next_run = None
-                schedule.updated_at = datetime.now(UTC)
-                repo.update(schedule)
-
-        if result["schedule_removed"] or result["file_watch_removed"] or result["webhook_removed"]:
-            logger.info(f"Disabled schedule for workflow: {workflow_name}")
-
         return result
 
     def pause_workflow(self, workflow_name: str) -> bool:
@@ -301,14 +585,10 @@ class ScheduleManager:
         paused = self._scheduler.pause_schedule(workflow_name)
 
         if paused:
-            with self._db.session_scope() as session:
-                repo = ScheduleRepository(session)
-                schedule = repo.get_by_workflow(workflow_name)
-
-                if schedule:
-                    schedule.next_run = None
-                    schedule.updated_at = datetime.now(UTC)
-                    repo.update(schedule)
+            with self.session_scope() as session:
+                # No-op when already paused
+                ScheduleRepository(session).update_next_run(workflow_name, None, updated_at=_now())
+            self._invalidate_status(workflow_name)
 
             logger.info(f"Paused schedule for workflow: {workflow_name}")
 
@@ -328,54 +608,97 @@ class ScheduleManager:
         if resumed:
             next_run = self._scheduler.get_next_run(workflow_name)
 
-            with self._db.session_scope() as session:
-                repo = ScheduleRepository(session)
-                schedule = repo.get_by_workflow(workflow_name)
-
-                if schedule:
-                    schedule.next_run = next_run
-                    schedule.updated_at = datetime.now(UTC)
-                    repo.update(schedule)
+            with self.session_scope() as session:
+                # No-op when the stored next run is already current
+                ScheduleRepository(session).update_next_run(
+                    workflow_name, next_run, updated_at=_now()
+                )
+            self._invalidate_status(workflow_name)
 
             logger.info(f"Resumed schedule for workflow: {workflow_name}")
 
         return resumed
 
-    def get_status(self, workflow_name: str | None = None) -> list[dict[str, Any]]:
-        """Get status of schedules.
-
-        Args:
-            workflow_name: Optional specific workflow to get status for.
+    def _get_active_watches_and_webhooks(
+        self,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Get active file watches and webhooks keyed by workflow name.
 
         Returns:
-            List of schedule status dictionaries.
+            Tuple of (file watches, webhooks).
         """
-        # Get active file watches
         file_watches = {}
         if self._file_watcher:
             for watch in self._file_watcher.get_watches():
                 file_watches[watch["workflow"]] = watch
 
-        # Get active webhooks
-        webhooks = {}
+        webhooks: dict[str, dict[str, Any]] = {}
         if self._webhook_service:
             for webhook in self._webhook_service.get_webhooks():
-                webhooks[webhook["workflow_name"]] = webhook
+                # Report a workflow's first webhook, as get_webhook() does
+                webhooks.setdefault(webhook["workflow_name"], webhook)
 
-        if workflow_name:
-            # Get status for specific workflow
-            schedule_info = self._scheduler.get_schedule(workflow_name)
-            file_watch_info = file_watches.get(workflow_name)
-            webhook_info = webhooks.get(workflow_name)
+        return file_watches, webhooks
+
+    def _get_registrations(
+        self, workflow_name: str
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Get one workflow's file watch, webhook and APScheduler job.
+
+        Args:
+            workflow_name: Name of the workflow.
+
+        Returns:
+            Tuple of (file watches, webhooks, schedules), each keyed by
+            workflow name and empty if the workflow has none.
+        """
+        file_watch = self._file_watcher.get_watch(workflow_name) if self._file_watcher else None
+        webhook = (
+            self._webhook_service.get_webhook(workflow_name) if self._webhook_service else None
+        )
+        schedule = self._scheduler.get_schedule(workflow_name)
+        return (
+            {workflow_name: file_watch} if file_watch else {},
+            {workflow_name: webhook} if webhook else {},
+            {workflow_name: schedule} if schedule else {},
+        )
+
+    def get_status_many(self, workflow_names: list[str]) -> list[dict[str, Any]]:
+        """Get status of schedules for several workflows.
+
+        Reads the scheduler's jobs and the database once for all workflows
+        instead of once per workflow.
+
+        Args:
+            workflow_names: Names of the workflows to get status for.
 
-            with self._db.session_scope() as session:
-                repo = ScheduleRepository(session)
-                db_schedule = repo.get_by_workflow(workflow_name)
+        Returns:
+            List of schedule status dictionaries, in the order requested,
+            for workflows that have a schedule.
+        """
+        names = list(dict.fromkeys(workflow_names))
+        if len(names) == 1:
+            # Look the one workflow up directly instead of listing everything
+            file_watches, webhooks, active_schedules = self._get_registrations(names[0])
+        else:
+            file_watches, webhooks = self._get_active_watches_and_webhooks()
+            active_schedules = {sched["name"]: sched for sched in self._scheduler.get_schedules()}
+
+        result: list[dict[str, Any]] = []
+        with self.session_scope() as session:
+            repo = ScheduleRepository(session)
+            db_schedules = repo.get_by_workflows(names)
+
+            for name in names:
+                schedule_info = active_schedules.get(name)
+                file_watch_info = file_watches.get(name)
+                webhook_info = webhooks.get(name)
+                db_schedule = db_schedules.get(name)
 
                 if schedule_info or file_watch_info or webhook_info:
-                    return [
+                    result.append(
                         {
-                            "name": workflow_name,
+                            "name": name,
                             "enabled": True,
                             "next_run": schedule_info["next_run"] if schedule_info else None,
                             "trigger": schedule_info["trigger"] if schedule_info else None,
@@ -384,110 +707,136 @@ class ScheduleManager:
                             "last_run": db_schedule.last_run if db_schedule else None,
                             "last_status": db_schedule.last_status if db_schedule else None,
                         }
-                    ]
+                    )
                 elif db_schedule:
                     # Schedule exists in DB but not in scheduler (disabled)
-                    return [
+                    result.append(
                         {
-                            "name": workflow_name,
+                            "name": name,
                             "enabled": bool(db_schedule.enabled),
                             "next_run": db_schedule.next_run,
-                            "trigger": str(db_schedule.trigger_config)
-                            if db_schedule.trigger_config
-                            else None,
+                            "trigger": _format_stored_trigger_config(db_schedule.trigger_config),
                             "file_watch": None,
                             "webhook": None,
                             "last_run": db_schedule.last_run,
                             "last_status": db_schedule.last_status,
                         }
-                    ]
-                else:
-                    return []
+                    )
 
-        # Get all schedules
-        active_schedules = self._scheduler.get_schedules()
+        return result
 
-        with self._db.session_scope() as session:
-            repo = ScheduleRepository(session)
-            all_db_schedules = {s.workflow_name: s for s in repo.get_all()}
+    def get_status(self, workflow_name: str | None = None) -> list[dict[str, Any]]:
+        """Get status of schedules.
 
-            result: list[dict[str, Any]] = []
+        Args:
+            workflow_name: Optional specific workflow to get status for.
 
-            # Add active schedules from APScheduler
-            seen_names: set[str] = set()
-            for sched in active_schedules:
-                name = sched["name"]
-                seen_names.add(name)
-                db_sched = all_db_schedules.get(name)
+        Returns:
+            List of schedule status dictionaries. Results for a specific
+            workflow may be up to a second old unless this manager changed
+            its schedule in the meantime.
+        """
+        if workflow_name:
+            return self._get_cached_status(workflow_name)
+        return list(self.iter_status())
 
-                result.append(
-                    {
-                        "name": name,
-                        "enabled": not sched["paused"],
-                        "next_run": sched["next_run"],
-                        "trigger": sched["trigger"],
-                        "file_watch": file_watches.get(name),
-                        "webhook": webhooks.get(name),
-                        "last_run": db_sched.last_run if db_sched else None,
-                        "last_status": db_sched.last_status if db_sched else None,
-                    }
-                )
+    def _get_cached_status(self, workflow_name: str) -> list[dict[str, Any]]:
+        """Get a workflow's status, reusing a result fetched in the last second.
 
-            # Add workflows with only file watches (no APScheduler job)
-            for name, watch_info in file_watches.items():
-                if name not in seen_names:
-                    seen_names.add(name)
-                    db_sched = all_db_schedules.get(name)
-                    result.append(
-                        {
-                            "name": name,
-                            "enabled": True,
-                            "next_run": None,
-                            "trigger": None,
-                            "file_watch": watch_info,
-                            "webhook": webhooks.get(name),
-                            "last_run": db_sched.last_run if db_sched else None,
-                            "last_status": db_sched.last_status if db_sched else None,
-                        }
-                    )
+        Args:
+            workflow_name: Name of the workflow.
 
-            # Add workflows with only webhooks (no APScheduler job or file watch)
-            for name, webhook_info in webhooks.items():
-                if name not in seen_names:
-                    seen_names.add(name)
-                    db_sched = all_db_schedules.get(name)
-                    result.append(
-                        {
-                            "name": name,
-                            "enabled": True,
-                            "next_run": None,
-                            "trigger": None,
-                            "file_watch": None,
-                            "webhook": webhook_info,
-                            "last_run": db_sched.last_run if db_sched else None,
-                            "last_status": db_sched.last_status if db_sched else None,
-                        }
-                    )
+        Returns:
+            List of schedule status dictionaries (empty if not scheduled).
+        """
+        now = time.monotonic()
+        with self._status_cache_lock:
+            cached = self._status_cache.get(workflow_name)
+        if cached is not None and now - cached[0] < _STATUS_CACHE_TTL:
+            statuses = cached[1]
+        else:
+            statuses = self.get_status_many([workflow_name])
+            with self._status_cache_lock:
+                self._status_cache[workflow_name] = (now, statuses)
+                self._status_cache.move_to_end(workflow_name)
+                if len(self._status_cache) > _STATUS_CACHE_SIZE:
+                    self._status_cache.popitem(last=False)
+
+        # Copy so callers cannot modify the cached entries
+        return [dict(status) for status in statuses]
+
+    def _invalidate_status(self, workflow_name: str) -> None:
+        """Drop a workflow's cached status after changing its schedule.
 
-            # Add disabled schedules from database
-            for name, db_sched in all_db_schedules.items():
-                if name not in seen_names:
-                    result.append(
-                        {
-                            "name": name,
-                            "enabled": False,
-                            "next_run": None,
-                            "trigger": str(db_sched.trigger_config)
-                            if db_sched.trigger_config
-                            else None,
-                            "file_watch": None,
-                            "webhook": None,
-                            "last_run": db_sched.last_run,
-                            "last_status": db_sched.last_status,
-                        }
-                    )
+        Args:
+            workflow_name: Name of the workflow.
+        """
+        with self._status_cache_lock:
+            self._status_cache.pop(workflow_name, None)
+
+    def iter_status(self, workflow_name: str | None = None) -> Iterator[dict[str, Any]]:
+        """Iterate over schedule statuses, one dictionary at a time.
+
+        Disabled schedules are streamed from the database as they are
+        consumed, so callers that handle one status at a time never hold
+        every row in memory.
+
+        Args:
+            workflow_name: Optional specific workflow to get status for.
+
+        Yields:
+            Schedule status dictionaries, in the same order as get_status().
+        """
+        if workflow_name:
+            yield from self.get_status_many([workflow_name])
+            return
 
-            return result
+        file_watches, webhooks = self._get_active_watches_and_webhooks()
+
+        # Get all schedules
+        active_schedules = self._scheduler.get_schedules()
+
+        # Workflows with an APScheduler job, then file watch only, then webhook only
+        active = {sched["name"]: sched for sched in active_schedules}
+        live_names = list(dict.fromkeys([*active, *file_watches, *webhooks]))
+
+        # Reuse an enclosing session_scope(), but don't install this one as the
+        # shared session: the generator may be suspended between other calls
+        current = self._current_session.get()
+        scope: AbstractContextManager[Session] = (
+            nullcontext(current) if current is not None else self._db.session_scope()
+        )
+        with scope as session:
+            repo = ScheduleRepository(session)
+            db_schedules = repo.get_by_workflows(live_names)
+
+            # Add workflows with an APScheduler job, file watch or webhook
+            for name in live_names:
+                sched = active.get(name)
+                db_sched = db_schedules.get(name)
+                yield {
+                    "name": name,
+                    "enabled": not sched["paused"] if sched else True,
+                    "next_run": sched["next_run"] if sched else None,
+                    "trigger": sched["trigger"] if sched else None,
+                    "file_watch": file_watches.get(name),
+                    "webhook": webhooks.get(name),
+                    "last_run": db_sched.last_run if db_sched else None,
+                    "last_status": db_sched.last_status if db_sched else None,
+                }
+
+            # Add disabled schedules from database
+            for db_sched in repo.iter_all_except(live_names):
+                yield {
+                    "name": db_sched.workflow_name,
+                    "enabled": False,
+                    "next_run": None,
+                    "trigger": _format_stored_trigger_config(db_sched.trigger_config),
+                    "file_watch": None,
+                    "webhook": None,
+                    "last_run": db_sched.last_run,
+                    "last_status": db_sched.last_status,
+                }
 
     def update_last_run(
         self,
@@ -502,13 +851,14 @@ class ScheduleManager:
             status: Status of the last run (success, failed, etc.).
             run_time: Time of the run (defaults to now).
         """
-        with self._db.session_scope() as session:
-            repo = ScheduleRepository(session)
-            schedule = repo.get_by_workflow(workflow_name)
-
-            if schedule:
-                schedule.last_run = run_time or datetime.now(UTC)
-                schedule.last_status = status
-                schedule.next_run = self._scheduler.get_next_run(workflow_name)
-                schedule.updated_at = datetime.now(UTC)
-                repo.update(schedule)
+        now = _now()
+        next_run = self._scheduler.get_next_run(workflow_name)
+        with self.session_scope() as session:
+            ScheduleRepository(session).update_by_workflow(
+                workflow_name,
+                last_run=run_time or now,
+                last_status=status,
+                next_run=next_run,
+                updated_at=now,
+            )
+        self._invalidate_status(workflow_name)
@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
+
+from flowpilot.engine.parser import load_workflow_file
+
+from .background_loop import BackgroundLoop
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from datetime import datetime
 
+    from apscheduler.job import Job
     from apscheduler.schedulers.base import BaseScheduler
     from apscheduler.triggers.cron import CronTrigger as APCronTrigger
     from apscheduler.triggers.interval import IntervalTrigger as APIntervalTrigger
+    from sqlalchemy.engine import Engine
 
     from flowpilot.engine.runner import WorkflowRunner
     from flowpilot.models import Workflow
@@ -25,6 +37,9 @@ logger = logging.getLogger(__name__)
 # Global reference to runner for job execution (set via set_global_runner)
 _global_runner: WorkflowRunner | None = None
 
+# Event loop that scheduled runs are submitted to (set by SchedulerService.start)
+_global_loop: asyncio.AbstractEventLoop | None = None
+
 
 def set_global_runner(runner: WorkflowRunner | None) -> None:
     """Set the global workflow runner for scheduled job execution.
@@ -45,39 +60,73 @@ def _execute_scheduled_workflow(workflow_name: str, workflow_path: str) -> None:
         workflow_name: Name of the workflow.
         workflow_path: Path to the workflow file.
     """
-    import asyncio
-
-    from flowpilot.engine.parser import WorkflowParser
-
     if _global_runner is None:
         logger.error(f"Cannot execute workflow '{workflow_name}': no runner configured")
         return
 
     path = Path(workflow_path)
-    if not path.exists():
-        logger.error(f"Workflow file not found: {path}")
-        return
-
     try:
-        parser = WorkflowParser()
-        workflow = parser.parse_file(path)
+        # Scheduled workflows run repeatedly from a file that rarely changes
+        workflow = load_workflow_file(path)
 
         logger.info(f"Executing scheduled workflow: {workflow_name}")
 
-        # Run the async workflow in an event loop
-        asyncio.run(
-            _global_runner.run(
-                workflow,
-                workflow_path=str(path),
-                trigger_type="scheduled",
-            )
+        coro = _global_runner.run(
+            workflow,
+            workflow_path=str(path),
+            trigger_type="scheduled",
         )
+        loop = _global_loop
+        if loop is not None and loop.is_running():
+            # Run on the service's long-lived loop; block this job's worker thread
+            # until it finishes so max_instances still applies
+            asyncio.run_coroutine_threadsafe(coro, loop).result()
+        else:
+            # No service loop (e.g. called directly); use a temporary one
+            asyncio.run(coro)
         logger.info(f"Completed scheduled workflow: {workflow_name}")
 
+    except FileNotFoundError:
+        logger.error(f"Workflow file not found: {path}")
     except Exception as e:
         logger.exception(f"Failed to execute scheduled workflow '{workflow_name}': {e}")
 
 
+@lru_cache(maxsize=1024)
+def _job_id(workflow_name: str) -> str:
+    """Get the APScheduler job ID for a workflow.
+
+    Cached so repeated lookups for the same workflow reuse one string.
+
+    Args:
+        workflow_name: Name of the workflow.
+
+    Returns:
+        The job ID.
+    """
+    return f"workflow:{workflow_name}"
+
+
+def _job_info(job: Job) -> dict[str, Any]:
+    """Describe a scheduled job.
+
+    Args:
+        job: The APScheduler job.
+
+    Returns:
+        Schedule information dictionary.
+    """
+    # Read once; the paused flag is derived from the same value
+    next_run = job.next_run_time
+    return {
+        "id": job.id,
+        "name": job.name,
+        "next_run": next_run,
+        "trigger": str(job.trigger),
+        "paused": next_run is None,
+    }
+
+
 class SchedulerService:
     """APScheduler-based scheduling service for workflows.
 
@@ -87,9 +136,11 @@ class SchedulerService:
 
     def __init__(
         self,
-        db_url: str,
+        db_url: str | None = None,
         workflows_dir: Path | None = None,
         scheduler_type: Literal["asyncio", "background"] = "background",
+        *,
+        engine: Engine | None = None,
     ) -> None:
         """Initialize the scheduler service.
 
@@ -97,8 +148,21 @@ class SchedulerService:
             db_url: SQLAlchemy database URL for job persistence.
             workflows_dir: Directory containing workflow files.
             scheduler_type: Type of scheduler to use ("asyncio" or "background").
+            engine: Existing SQLAlchemy engine to persist jobs with instead of
+                db_url, e.g. ``Database.engine`` to share its connection pool.
+
+        Raises:
+            ValueError: If neither db_url nor engine is given.
         """
-        jobstores = {"default": SQLAlchemyJobStore(url=db_url)}
+        if engine is None and db_url is None:
+            msg = "SchedulerService needs a db_url or an engine for job persistence"
+            raise ValueError(msg)
+        jobstore = (
+            SQLAlchemyJobStore(engine=engine)
+            if engine is not None
+            else SQLAlchemyJobStore(url=db_url)
+        )
+        jobstores = {"default": jobstore}
 
         job_defaults = {
             "coalesce": True,  # Combine missed runs into one
@@ -118,6 +182,9 @@ class SchedulerService:
         self._workflows_dir = workflows_dir or (Path.home() / ".flowpilot" / "workflows")
         self._runner: WorkflowRunner | None = None
         self._running = False
+        self._scheduler_type = scheduler_type
+        # Loop the service owns and runs jobs on (background scheduler only)
+        self._loop = BackgroundLoop("flowpilot-scheduler-loop", "scheduled workflows")
 
     @property
     def is_running(self) -> bool:
@@ -140,6 +207,7 @@ class SchedulerService:
             return
 
         self._scheduler.start()
+        self._start_loop()
         self._running = True
         logger.info("Scheduler started")
 
@@ -153,15 +221,62 @@ class SchedulerService:
             return
 
         self._scheduler.shutdown(wait=wait)
+        self._stop_loop()
         self._running = False
         logger.info("Scheduler stopped")
 
+    def _start_loop(self) -> None:
+        """Set up the event loop that scheduled workflows run on.
+
+        One long-lived loop replaces creating and tearing down a loop with
+        asyncio.run() for every job. An asyncio scheduler runs jobs on the loop
+        it was started from; a background scheduler gets a loop on its own thread.
+        """
+        global _global_loop
+        if self._scheduler_type == "asyncio":
+            try:
+                _global_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                _global_loop = None
+            return
+
+        _global_loop = self._loop.start()
+
+    def _stop_loop(self) -> None:
+        """Stop and close the event loop owned by the service, if any."""
+        global _global_loop
+        _global_loop = None
+        # Runs still going after shutdown(wait=False) are cancelled
+        self._loop.stop()
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Group several schedule changes into one scheduler wakeup.
+
+        A running scheduler wakes up to recompute its next fire time after
+        every job it adds. Inside this context job processing is paused, so
+        the jobs are only picked up once, when it resumes on exit. Usage:
+
+            with scheduler.batch():
+                for workflow, trigger in jobs:
+                    scheduler.schedule_workflow(workflow, trigger)
+        """
+        if self._scheduler.state != STATE_RUNNING:
+            yield
+            return
+
+        self._scheduler.pause()
+        try:
+            yield
+        finally:
+            self._scheduler.resume()
+
     def schedule_workflow(
         self,
         workflow: Workflow,
         trigger: APCronTrigger | APIntervalTrigger,
         workflow_path: str | None = None,
-    ) -> str:
+    ) -> tuple[str, datetime | None]:
         """Schedule a workflow execution.
 
         Args:
@@ -170,9 +285,10 @@ class SchedulerService:
             workflow_path: Path to workflow file (for persistence).
 
         Returns:
-            The job ID.
+            Tuple of (job ID, next run time). The next run time is None until
+            the scheduler has been started.
         """
-        job_id = f"workflow:{workflow.name}"
+        job_id = _job_id(workflow.name)
 
         job = self._scheduler.add_job(
             _execute_scheduled_workflow,
@@ -188,7 +304,8 @@ class SchedulerService:
         )
 
         logger.info(f"Scheduled workflow '{workflow.name}' with job ID: {job.id}")
-        return str(job.id)
+        # Jobs added before the scheduler starts have no next run time yet
+        return str(job.id), getattr(job, "next_run_time", None)
 
     def remove_schedule(self, workflow_name: str) -> bool:
         """Remove a workflow schedule.
@@ -199,7 +316,7 @@ class SchedulerService:
         Returns:
             True if removed, False if not found.
         """
-        job_id = f"workflow:{workflow_name}"
+        job_id = _job_id(workflow_name)
         job = self._scheduler.get_job(job_id)
 
         if job:
@@ -218,15 +335,13 @@ class SchedulerService:
         Returns:
             True if paused, False if not found.
         """
-        job_id = f"workflow:{workflow_name}"
-        job = self._scheduler.get_job(job_id)
-
-        if job:
-            self._scheduler.pause_job(job_id)
-            logger.info(f"Paused schedule for workflow: {workflow_name}")
-            return True
+        try:
+            self._scheduler.pause_job(_job_id(workflow_name))
+        except JobLookupError:
+            return False
 
-        return False
+        logger.info(f"Paused schedule for workflow: {workflow_name}")
+        return True
 
     def resume_schedule(self, workflow_name: str) -> bool:
         """Resume a paused workflow schedule.
@@ -237,15 +352,13 @@ class SchedulerService:
         Returns:
             True if resumed, False if not found.
         """
-        job_id = f"workflow:{workflow_name}"
-        job = self._scheduler.get_job(job_id)
+        try:
+            self._scheduler.resume_job(_job_id(workflow_name))
+        except JobLookupError:
+            return False
 
-        if job:
-            self._scheduler.resume_job(job_id)
-            logger.info(f"Resumed schedule for workflow: {workflow_name}")
-            return True
-
-        return False
+        logger.info(f"Resumed schedule for workflow: {workflow_name}")
+        return True
 
     def get_schedules(self) -> list[dict[str, Any]]:
         """Get all scheduled workflows.
@@ -255,16 +368,7 @@ class SchedulerService:
         """
         jobs = self._scheduler.get_jobs()
 
-        return [
-            {
-                "id": job.id,
-                "name": job.name,
-                "next_run": job.next_run_time,
-                "trigger": str(job.trigger),
-                "paused": job.next_run_time is None,
-            }
-            for job in jobs
-        ]
+        return [_job_info(job) for job in jobs]
 
     def get_schedule(self, workflow_name: str) -> dict[str, Any] | None:
         """Get schedule info for a specific workflow.
@@ -275,19 +379,10 @@ class SchedulerService:
         Returns:
             Schedule information or None if not found.
         """
-        job_id = f"workflow:{workflow_name}"
+        job_id = _job_id(workflow_name)
         job = self._scheduler.get_job(job_id)
 
-        if job:
-            return {
-                "id": job.id,
-                "name": job.name,
-                "next_run": job.next_run_time,
-                "trigger": str(job.trigger),
-                "paused": job.next_run_time is None,
-            }
-
-        return None
+        return _job_info(job) if job else None
 
     def get_next_run(self, workflow_name: str) -> datetime | None:
         """Get next run time for a workflow.
@@ -298,7 +393,7 @@ class SchedulerService:
         Returns:
             Next run datetime or None if not scheduled.
         """
-        job_id = f"workflow:{workflow_name}"
+        job_id = _job_id(workflow_name)
         job = self._scheduler.get_job(job_id)
 
         return job.next_run_time if job else None
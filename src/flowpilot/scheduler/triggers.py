@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
-from apscheduler.triggers.cron import CronTrigger as APCronTrigger
 from apscheduler.triggers.interval import IntervalTrigger as APIntervalTrigger
 
 if TYPE_CHECKING:
+    from apscheduler.triggers.cron import CronTrigger as APCronTrigger
+
     from flowpilot.models.triggers import CronTrigger, IntervalTrigger, Trigger
 
+# Trigger types that APScheduler runs (see parse_trigger)
+SCHEDULABLE_TRIGGER_TYPES = frozenset({"cron", "interval"})
+
 
 def parse_cron_trigger(config: CronTrigger) -> APCronTrigger:
     """Parse cron trigger from workflow config to APScheduler trigger.
@@ -24,37 +27,8 @@ def parse_cron_trigger(config: CronTrigger) -> APCronTrigger:
     Raises:
         ValueError: If cron expression is invalid.
     """
-    parts = config.schedule.split()
-
-    # Determine timezone
-    timezone = config.timezone if config.timezone != "local" else None
-
-    if len(parts) == 5:
-        # Standard cron: minute hour day month day_of_week
-        minute, hour, day, month, day_of_week = parts
-        return APCronTrigger(
-            minute=minute,
-            hour=hour,
-            day=day,
-            month=month,
-            day_of_week=day_of_week,
-            timezone=timezone,
-        )
-    elif len(parts) == 6:
-        # Extended cron: second minute hour day month day_of_week
-        second, minute, hour, day, month, day_of_week = parts
-        return APCronTrigger(
-            second=second,
-            minute=minute,
-            hour=hour,
-            day=day,
-            month=month,
-            day_of_week=day_of_week,
-            timezone=timezone,
-        )
-    else:
-        msg = f"Invalid cron expression: {config.schedule}. Expected 5 or 6 fields."
-        raise ValueError(msg)
+    # Parsed (and cached) when the workflow model was validated
+    return config.to_apscheduler()
 
 
 def parse_interval_trigger(config: IntervalTrigger) -> APIntervalTrigger:
@@ -69,22 +43,9 @@ def parse_interval_trigger(config: IntervalTrigger) -> APIntervalTrigger:
     Raises:
         ValueError: If interval format is invalid.
     """
-    match = re.match(r"^(\d+)(s|m|h|d)$", config.every)
-    if not match:
-        msg = f"Invalid interval: {config.every}. Use format like '30s', '5m', '2h', '1d'"
-        raise ValueError(msg)
-
-    value = int(match.group(1))
-    unit = match.group(2)
-
-    kwargs: dict[str, int] = {
-        "s": {"seconds": value},
-        "m": {"minutes": value},
-        "h": {"hours": value},
-        "d": {"days": value},
-    }[unit]
-
-    return APIntervalTrigger(**kwargs)
+    # Seconds were computed (and cached) when the workflow model was validated.
+    # Triggers aren't shared: IntervalTrigger anchors its start at construction.
+    return APIntervalTrigger(seconds=config.to_seconds())
 
 
 def parse_trigger(trigger_config: Trigger) -> APCronTrigger | APIntervalTrigger:
@@ -99,16 +60,13 @@ def parse_trigger(trigger_config: Trigger) -> APCronTrigger | APIntervalTrigger:
     Raises:
         ValueError: If trigger type is not schedulable.
     """
-    # Import here to avoid circular imports
-    from flowpilot.models.triggers import CronTrigger, IntervalTrigger
-
-    if isinstance(trigger_config, CronTrigger):
+    # Dispatch on the type tag: no import or isinstance checks per call
+    if trigger_config.type == "cron":
         return parse_cron_trigger(trigger_config)
-    elif isinstance(trigger_config, IntervalTrigger):
+    if trigger_config.type == "interval":
         return parse_interval_trigger(trigger_config)
-    else:
-        msg = f"Cannot schedule trigger type: {trigger_config.type}"
-        raise ValueError(msg)
+    msg = f"Cannot schedule trigger type: {trigger_config.type}"
+    raise ValueError(msg)
 
 
 def is_schedulable(trigger_config: Trigger) -> bool:
@@ -120,4 +78,4 @@ def is_schedulable(trigger_config: Trigger) -> bool:
     Returns:
         True if trigger can be scheduled with APScheduler.
     """
-    return trigger_config.type in ("cron", "interval")
+    return trigger_config.type in SCHEDULABLE_TRIGGER_TYPES
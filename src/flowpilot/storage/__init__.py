@@ -4,7 +4,7 @@ This module provides database storage for workflow executions, node logs,
 and schedule metadata using SQLite and SQLAlchemy.
 """
 
-from .database import Database, get_database, init_database
+from .database import Database, close_databases, get_database, init_database
 from .models import (
     Base,
     Execution,
@@ -28,6 +28,7 @@ __all__ = [
     "NodeExecutionRepository",
     "Schedule",
     "ScheduleRepository",
+    "close_databases",
     "get_database",
     "init_database",
 ]
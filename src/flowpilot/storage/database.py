@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import atexit
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from .models import Base
 
@@ -16,6 +18,29 @@ if TYPE_CHECKING:
 
     from sqlalchemy.engine import Engine
 
+# Applied to every new connection to a file database. WAL lets readers run
+# alongside the writer and, with synchronous=NORMAL, commits skip the per-
+# transaction fsync while staying crash-safe. The page cache is per
+# connection, so it is kept modest for a pooled engine.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16384",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Tune a new SQLite connection (SQLAlchemy "connect" event handler)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class Database:
     """Database connection manager for FlowPilot.
@@ -23,28 +48,56 @@ class Database:
     Handles SQLite database creation, connection, and session management.
     """
 
-    def __init__(self, db_path: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        *,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+    ) -> None:
         """Initialize the database connection.
 
         Args:
             db_path: Path to the SQLite database file.
                      If None, uses ~/.flowpilot/flowpilot.db
+            pool_size: Connections kept open for reuse (file databases only).
+            max_overflow: Extra connections allowed beyond pool_size under
+                concurrent load (file databases only).
         """
         if db_path is None:
             db_path = Path.home() / ".flowpilot" / "flowpilot.db"
         elif isinstance(db_path, str):
             db_path = Path(db_path)
 
+        engine_kwargs: dict[str, Any]
         # Handle special case for in-memory database
         if str(db_path) == ":memory:":
             db_url = "sqlite:///:memory:"
+            # One shared connection, so every thread and session sees the
+            # same database and its tables
+            engine_kwargs = {
+                "poolclass": StaticPool,
+                "connect_args": {"check_same_thread": False},
+            }
         else:
             # Ensure parent directory exists
             db_path.parent.mkdir(parents=True, exist_ok=True)
             db_url = f"sqlite:///{db_path}"
+            # Size the pool for concurrent API and scheduler sessions, and
+            # reuse the most recently returned (warm) connection first
+            engine_kwargs = {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_use_lifo": True,
+            }
 
         self._db_path = db_path
-        self._engine: Engine = create_engine(db_url, echo=False)
+        # JSON columns keep SQLAlchemy's stdlib json (de)serializers: orjson
+        # writes NaN/Infinity as null and reads integers beyond 64 bits back as
+        # floats, so it cannot round-trip every value stored here
+        self._engine: Engine = create_engine(db_url, echo=False, **engine_kwargs)
+        if str(db_path) != ":memory:":
+            event.listen(self._engine, "connect", _set_sqlite_pragmas)
         self._session_factory = sessionmaker(bind=self._engine)
 
     @property
@@ -52,9 +105,26 @@ class Database:
         """Get the database file path."""
         return self._db_path
 
+    @property
+    def engine(self) -> Engine:
+        """Get the SQLAlchemy engine, e.g. to share its connection pool."""
+        return self._engine
+
+    def dispose(self) -> None:
+        """Close the engine's pooled connections.
+
+        The instance stays usable; new connections are opened on demand.
+        """
+        self._engine.dispose()
+
     def create_tables(self) -> None:
-        """Create all database tables if they don't exist."""
+        """Create all database tables and indexes if they don't exist."""
         Base.metadata.create_all(self._engine)
+        # create_all() skips tables that already exist, so add indexes
+        # introduced since an existing database was created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self._engine, checkfirst=True)
 
     def drop_tables(self) -> None:
         """Drop all database tables. Use with caution!"""
@@ -97,13 +167,18 @@ class Database:
 # Global database instance (initialized lazily)
 _default_db: Database | None = None
 
+# Instances for explicit paths, keyed by resolved path, so repeat callers
+# reuse one engine and its open connections
+_db_cache: dict[Path, Database] = {}
+
 
 def get_database(db_path: Path | str | None = None) -> Database:
     """Get the default database instance or create one.
 
     Args:
         db_path: Optional path to use for the database.
-                 If provided, creates a new Database instance.
+                 If provided, returns the instance for that file, creating it
+                 on first use (":memory:" always gets a new instance).
                  If None and no default exists, creates default at ~/.flowpilot/flowpilot.db
 
     Returns:
@@ -112,8 +187,13 @@ def get_database(db_path: Path | str | None = None) -> Database:
     global _default_db
 
     if db_path is not None:
-        # Return a new instance for specific path
-        return Database(db_path)
+        if str(db_path) == ":memory:":
+            return Database(db_path)
+        key = Path(db_path).expanduser().resolve()
+        db = _db_cache.get(key)
+        if db is None:
+            db = _db_cache.setdefault(key, Database(key))
+        return db
 
     if _default_db is None:
         _default_db = Database()
@@ -122,6 +202,26 @@ def get_database(db_path: Path | str | None = None) -> Database:
     return _default_db
 
 
+def close_databases() -> None:
+    """Dispose of every database instance handed out by get_database.
+
+    Closes their pooled connections and forgets them, so the next
+    get_database call creates fresh instances. Registered to run at exit.
+    """
+    global _default_db
+
+    databases = list(_db_cache.values())
+    _db_cache.clear()
+    if _default_db is not None:
+        databases.append(_default_db)
+        _default_db = None
+    for db in databases:
+        db.dispose()
+
+
+atexit.register(close_databases)
+
+
 def init_database(db_path: Path | str | None = None) -> Database:
     """Initialize the database with tables created.
 
@@ -7,12 +7,15 @@ from datetime import UTC, datetime
 from typing import Any, ClassVar
 
 from sqlalchemy import (
+    Boolean,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -45,9 +48,15 @@ class Execution(Base):
     """Record of a workflow execution."""
 
     __tablename__ = "executions"
+    # Serve "latest runs" queries (per workflow, overall and by age) as
+    # ordered index scans instead of sorting every matching row
+    __table_args__ = (
+        Index("ix_exec_workflow_started", "workflow_name", "started_at"),
+        Index("ix_exec_started", "started_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    workflow_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    workflow_name: Mapped[str] = mapped_column(String(100), nullable=False)
     workflow_path: Mapped[str] = mapped_column(String(500), nullable=False)
     status: Mapped[ExecutionStatus] = mapped_column(
         Enum(ExecutionStatus), default=ExecutionStatus.PENDING
@@ -74,10 +83,12 @@ class NodeExecution(Base):
     """Record of a single node execution within a workflow execution."""
 
     __tablename__ = "node_executions"
+    # Returns an execution's nodes already in start order
+    __table_args__ = (Index("ix_ne_exec_started", "execution_id", "started_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     execution_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("executions.id", ondelete="CASCADE"), index=True
+        String(36), ForeignKey("executions.id", ondelete="CASCADE")
     )
     node_id: Mapped[str] = mapped_column(String(100), nullable=False)
     node_type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -101,11 +112,13 @@ class Schedule(Base):
     """Record of a scheduled workflow."""
 
     __tablename__ = "schedules"
+    # Covers only enabled schedules, so get_enabled() skips disabled ones
+    __table_args__ = (Index("ix_sched_enabled", "workflow_name", sqlite_where=text("enabled = 1")),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     workflow_name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     workflow_path: Mapped[str] = mapped_column(String(500), nullable=False)
-    enabled: Mapped[int] = mapped_column(Integer, default=1)  # SQLite boolean
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True)  # Stored as INTEGER 0/1
     trigger_config: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     next_run: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_run: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -118,4 +131,4 @@ class Schedule(Base):
     )
 
     def __repr__(self) -> str:
-        return f"<Schedule(id={self.id}, workflow={self.workflow_name!r}, enabled={bool(self.enabled)})>"
+        return f"<Schedule(id={self.id}, workflow={self.workflow_name!r}, enabled={self.enabled})>"
@@ -3,15 +3,54 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, bindparam, delete, func, insert, inspect, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .models import Execution, ExecutionStatus, NodeExecution, Schedule
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from sqlalchemy.orm import Session
 
+# Rows fetched per round-trip when streaming large result sets
+_YIELD_PER = 500
+
+# Column attributes copied from NodeExecution objects for bulk inserts
+_NODE_EXECUTION_COLUMNS = tuple(attr.key for attr in inspect(NodeExecution).column_attrs)
+
+# Frequently run queries, built once with bound parameters instead of on every call
+_EXECUTIONS_BY_WORKFLOW = (
+    select(Execution)
+    .where(Execution.workflow_name == bindparam("workflow_name"))
+    .order_by(Execution.started_at.desc())
+    .limit(bindparam("limit"))
+)
+_EXECUTIONS_BY_WORKFLOW_STATUS = _EXECUTIONS_BY_WORKFLOW.where(
+    Execution.status == bindparam("status")
+)
+_RECENT_EXECUTIONS = (
+    select(Execution).order_by(Execution.started_at.desc()).limit(bindparam("limit"))
+)
+_NODE_EXECUTIONS_BY_EXECUTION = (
+    select(NodeExecution)
+    .where(NodeExecution.execution_id == bindparam("execution_id"))
+    .order_by(NodeExecution.started_at.asc().nullsfirst(), NodeExecution.id)
+)
+_NODE_EXECUTION_COUNT = (
+    select(func.count())
+    .select_from(NodeExecution)
+    .where(NodeExecution.execution_id == bindparam("execution_id"))
+)
+_SCHEDULE_BY_WORKFLOW = select(Schedule).where(Schedule.workflow_name == bindparam("workflow_name"))
+_SCHEDULES_BY_WORKFLOWS = select(Schedule).where(
+    Schedule.workflow_name.in_(bindparam("workflow_names", expanding=True))
+)
+_ENABLED_SCHEDULES = select(Schedule).where(Schedule.enabled)
+_ALL_SCHEDULES = select(Schedule).order_by(Schedule.workflow_name)
+
 
 class ExecutionRepository:
     """Repository for Execution records."""
@@ -58,8 +97,8 @@ class ExecutionRepository:
         Returns:
             The execution if found, None otherwise.
         """
-        stmt = select(Execution).where(Execution.id == execution_id)
-        return self._session.scalar(stmt)
+        # Served from the identity map without SQL when already loaded
+        return self._session.get(Execution, execution_id)
 
     def get_by_workflow(
         self,
@@ -77,17 +116,13 @@ class ExecutionRepository:
         Returns:
             List of executions, ordered by start time descending.
         """
-        stmt = (
-            select(Execution)
-            .where(Execution.workflow_name == workflow_name)
-            .order_by(Execution.started_at.desc())
-            .limit(limit)
-        )
-
+        params: dict[str, Any] = {"workflow_name": workflow_name, "limit": limit}
+        stmt = _EXECUTIONS_BY_WORKFLOW
         if status is not None:
-            stmt = stmt.where(Execution.status == status)
+            stmt = _EXECUTIONS_BY_WORKFLOW_STATUS
+            params["status"] = status
 
-        return list(self._session.scalars(stmt))
+        return list(self._session.scalars(stmt, params))
 
     def get_recent(self, limit: int = 50) -> list[Execution]:
         """Get the most recent executions across all workflows.
@@ -98,8 +133,7 @@ class ExecutionRepository:
         Returns:
             List of executions, ordered by start time descending.
         """
-        stmt = select(Execution).order_by(Execution.started_at.desc()).limit(limit)
-        return list(self._session.scalars(stmt))
+        return list(self._session.scalars(_RECENT_EXECUTIONS, {"limit": limit}))
 
     def cleanup_old(self, days: int = 30) -> int:
         """Delete executions older than a specified number of days.
@@ -111,18 +145,22 @@ class ExecutionRepository:
             Number of executions deleted.
         """
         cutoff = datetime.now(UTC) - timedelta(days=days)
-
-        # Get count first
-        stmt = select(Execution).where(Execution.started_at < cutoff)
-        old_executions = list(self._session.scalars(stmt))
-        count = len(old_executions)
-
-        # Delete (cascades to node_executions)
-        for execution in old_executions:
-            self._session.delete(execution)
-
-        self._session.flush()
-        return count
+        old_ids = select(Execution.id).where(Execution.started_at < cutoff)
+
+        # Two bulk DELETEs instead of loading and deleting each execution.
+        # Node executions go first: SQLite only applies ON DELETE CASCADE
+        # when foreign key enforcement is on.
+        self._session.execute(
+            delete(NodeExecution).where(NodeExecution.execution_id.in_(old_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        result: CursorResult[Any] = self._session.execute(  # type: ignore[assignment]
+            delete(Execution).where(Execution.started_at < cutoff),
+            execution_options={"synchronize_session": False},
+        )
+        # Objects already loaded in this session may refer to deleted rows
+        self._session.expire_all()
+        return result.rowcount
 
     def delete(self, execution_id: str) -> bool:
         """Delete an execution by ID.
@@ -133,13 +171,14 @@ class ExecutionRepository:
         Returns:
             True if deleted, False if not found.
         """
-        execution = self.get_by_id(execution_id)
-        if execution is None:
-            return False
-
-        self._session.delete(execution)
-        self._session.flush()
-        return True
+        # Delete node executions explicitly; see cleanup_old()
+        self._session.execute(
+            delete(NodeExecution).where(NodeExecution.execution_id == execution_id)
+        )
+        result: CursorResult[Any] = self._session.execute(  # type: ignore[assignment]
+            delete(Execution).where(Execution.id == execution_id)
+        )
+        return result.rowcount > 0
 
 
 class NodeExecutionRepository:
@@ -166,34 +205,63 @@ class NodeExecutionRepository:
         self._session.flush()
         return node_execution
 
-    def create_batch(self, node_executions: list[NodeExecution]) -> list[NodeExecution]:
-        """Create multiple node execution records.
+    def create_batch(self, node_executions: list[NodeExecution]) -> int:
+        """Create multiple node execution records in one batched INSERT.
+
+        The records are inserted directly rather than added to the session,
+        so the objects passed in stay transient (their ``id`` is not set).
 
         Args:
-            node_executions: List of node executions to create.
+            node_executions: Node executions to create, with ``execution_id`` set.
 
         Returns:
-            The created node executions.
+            Number of node executions created.
         """
-        self._session.add_all(node_executions)
-        self._session.flush()
-        return node_executions
-
-    def get_by_execution(self, execution_id: str) -> list[NodeExecution]:
-        """Get all node executions for a workflow execution.
+        if not node_executions:
+            return 0
+
+        # Only columns set on the object; unset ones get their defaults
+        rows = [
+            {key: node.__dict__[key] for key in _NODE_EXECUTION_COLUMNS if key in node.__dict__}
+            for node in node_executions
+        ]
+        self._session.execute(insert(NodeExecution), rows)
+        return len(rows)
+
+    def get_by_execution(
+        self,
+        execution_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[NodeExecution]:
+        """Get node executions for a workflow execution.
 
         Args:
             execution_id: The UUID of the parent execution.
+            offset: Number of node executions to skip.
+            limit: Maximum number to return, or None for all.
 
         Returns:
             List of node executions, ordered by start time.
         """
-        stmt = (
-            select(NodeExecution)
-            .where(NodeExecution.execution_id == execution_id)
-            .order_by(NodeExecution.started_at.asc().nullsfirst())
-        )
-        return list(self._session.scalars(stmt))
+        stmt = _NODE_EXECUTIONS_BY_EXECUTION
+        # Page in SQL so callers never load the rows they would discard
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list(self._session.scalars(stmt, {"execution_id": execution_id}))
+
+    def count_by_execution(self, execution_id: str) -> int:
+        """Count the node executions of a workflow execution.
+
+        Args:
+            execution_id: The UUID of the parent execution.
+
+        Returns:
+            Number of node executions.
+        """
+        return self._session.scalar(_NODE_EXECUTION_COUNT, {"execution_id": execution_id}) or 0
 
 
 class ScheduleRepository:
@@ -232,6 +300,97 @@ class ScheduleRepository:
         self._session.flush()
         return schedule
 
+    def upsert(self, workflow_name: str, **fields: Any) -> None:
+        """Create or update the schedule for a workflow in a single statement.
+
+        Args:
+            workflow_name: The name of the workflow.
+            **fields: Schedule columns to set.
+        """
+        self.bulk_upsert([{"workflow_name": workflow_name, **fields}])
+
+    def bulk_upsert(self, rows: list[dict[str, Any]]) -> None:
+        """Create or update several schedules in one batched statement.
+
+        Args:
+            rows: Schedule column values, each including ``workflow_name``.
+                All rows must set the same columns. ``updated_at`` defaults
+                to now.
+        """
+        if not rows:
+            return
+
+        if "updated_at" not in rows[0]:
+            now = datetime.now(UTC)
+            rows = [{**row, "updated_at": now} for row in rows]
+        stmt = sqlite_insert(Schedule)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Schedule.workflow_name],
+            set_={column: stmt.excluded[column] for column in rows[0] if column != "workflow_name"},
+        )
+        self._session.execute(stmt, rows)
+        # The upsert bypasses the identity map; reload schedules loaded earlier
+        self._session.expire_all()
+
+    def update_by_workflow(self, workflow_name: str, **fields: Any) -> bool:
+        """Update columns of a workflow's schedule without loading it first.
+
+        Args:
+            workflow_name: The name of the workflow.
+            **fields: Schedule columns to set. ``updated_at`` defaults to now.
+
+        Returns:
+            True if a schedule was updated, False if not found.
+        """
+        if "updated_at" not in fields:
+            fields["updated_at"] = datetime.now(UTC)
+        stmt = update(Schedule).where(Schedule.workflow_name == workflow_name).values(**fields)
+        result: CursorResult[Any] = self._session.execute(stmt)  # type: ignore[assignment]
+        return result.rowcount > 0
+
+    def update_by_workflows(self, workflow_names: list[str], **fields: Any) -> int:
+        """Update the same columns of several workflows' schedules in one statement.
+
+        Args:
+            workflow_names: The names of the workflows.
+            **fields: Schedule columns to set. ``updated_at`` defaults to now.
+
+        Returns:
+            Number of schedules updated.
+        """
+        if not workflow_names:
+            return 0
+        if "updated_at" not in fields:
+            fields["updated_at"] = datetime.now(UTC)
+        stmt = update(Schedule).where(Schedule.workflow_name.in_(workflow_names)).values(**fields)
+        result: CursorResult[Any] = self._session.execute(stmt)  # type: ignore[assignment]
+        return result.rowcount
+
+    def update_next_run(self, workflow_name: str, next_run: datetime | None, **fields: Any) -> bool:
+        """Set a workflow's next run time, skipping the write if it is unchanged.
+
+        Args:
+            workflow_name: The name of the workflow.
+            next_run: The next run time, or None if not scheduled.
+            **fields: Other Schedule columns to set alongside it. ``updated_at``
+                defaults to now.
+
+        Returns:
+            True if a schedule was updated, False if not found or unchanged.
+        """
+        if "updated_at" not in fields:
+            fields["updated_at"] = datetime.now(UTC)
+        stmt = (
+            update(Schedule)
+            .where(
+                Schedule.workflow_name == workflow_name,
+                Schedule.next_run.is_distinct_from(next_run),
+            )
+            .values(next_run=next_run, **fields)
+        )
+        result: CursorResult[Any] = self._session.execute(stmt)  # type: ignore[assignment]
+        return result.rowcount > 0
+
     def get_by_workflow(self, workflow_name: str) -> Schedule | None:
         """Get schedule for a specific workflow.
 
@@ -241,8 +400,23 @@ class ScheduleRepository:
         Returns:
             The schedule if found, None otherwise.
         """
-        stmt = select(Schedule).where(Schedule.workflow_name == workflow_name)
-        return self._session.scalar(stmt)
+        return self._session.scalar(_SCHEDULE_BY_WORKFLOW, {"workflow_name": workflow_name})
+
+    def get_by_workflows(self, workflow_names: list[str]) -> dict[str, Schedule]:
+        """Get schedules for several workflows in a single query.
+
+        Args:
+            workflow_names: Names of the workflows.
+
+        Returns:
+            Mapping of workflow name to schedule for those that have one.
+        """
+        if not workflow_names:
+            return {}
+        schedules = self._session.scalars(
+            _SCHEDULES_BY_WORKFLOWS, {"workflow_names": workflow_names}
+        )
+        return {schedule.workflow_name: schedule for schedule in schedules}
 
     def get_enabled(self) -> list[Schedule]:
         """Get all enabled schedules.
@@ -250,8 +424,7 @@ class ScheduleRepository:
         Returns:
             List of enabled schedules.
         """
-        stmt = select(Schedule).where(Schedule.enabled == 1)
-        return list(self._session.scalars(stmt))
+        return list(self._session.scalars(_ENABLED_SCHEDULES))
 
     def get_all(self) -> list[Schedule]:
         """Get all schedules.
@@ -259,8 +432,24 @@ class ScheduleRepository:
         Returns:
             List of all schedules.
         """
-        stmt = select(Schedule).order_by(Schedule.workflow_name)
-        return list(self._session.scalars(stmt))
+        return list(self._session.scalars(_ALL_SCHEDULES))
+
+    def iter_all_except(self, workflow_names: list[str]) -> Iterator[Schedule]:
+        """Iterate over all schedules other than those for the given workflows.
+
+        Rows are fetched from the database in batches as the iterator is
+        consumed, instead of being loaded all at once.
+
+        Args:
+            workflow_names: Names of the workflows to leave out.
+
+        Yields:
+            The remaining schedules, ordered by workflow name.
+        """
+        stmt = _ALL_SCHEDULES
+        if workflow_names:
+            stmt = stmt.where(Schedule.workflow_name.not_in(workflow_names))
+        yield from self._session.scalars(stmt.execution_options(yield_per=_YIELD_PER))
 
     def delete(self, workflow_name: str) -> bool:
         """Delete a schedule by workflow name.
@@ -271,10 +460,6 @@ class ScheduleRepository:
         Returns:
             True if deleted, False if not found.
         """
-        schedule = self.get_by_workflow(workflow_name)
-        if schedule is None:
-            return False
-
-        self._session.delete(schedule)
-        self._session.flush()
-        return True
+        stmt = delete(Schedule).where(Schedule.workflow_name == workflow_name)
+        result: CursorResult[Any] = self._session.execute(stmt)  # type: ignore[assignment]
+        return result.rowcount > 0
@@ -2,22 +2,26 @@
 
 from __future__ import annotations
 
-import tempfile
 from collections.abc import Generator
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from flowpilot.api import create_app
+from flowpilot.api.dependencies import get_runner, get_workflows_dir, require_runner
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
 @pytest.fixture
-def temp_workflows_dir() -> Generator[Path, None, None]:
+def temp_workflows_dir(tmp_path: Path) -> Path:
     """Create a temporary workflows directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    # pytest's per-test tmp_path is cleaned up in bulk, not removed after each test
+    return tmp_path
 
 
 @pytest.fixture
@@ -43,18 +47,26 @@ def mock_runner() -> MagicMock:
     return runner
 
 
+@pytest.fixture(scope="module")
+def app(tmp_path_factory: pytest.TempPathFactory) -> FastAPI:
+    """Create the app once per module; tests point it at their own directory."""
+    return create_app(workflows_dir=tmp_path_factory.mktemp("workflows"), enable_cors=True)
+
+
 @pytest.fixture
-def client(temp_workflows_dir: Path) -> TestClient:
+def client(app: FastAPI, temp_workflows_dir: Path) -> Generator[TestClient, None, None]:
     """Create a test client without runner."""
-    app = create_app(workflows_dir=temp_workflows_dir, enable_cors=True)
-    return TestClient(app)
+    app.dependency_overrides[get_workflows_dir] = lambda: temp_workflows_dir
+    yield TestClient(app)
+    app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def client_with_runner(temp_workflows_dir: Path, mock_runner: MagicMock) -> TestClient:
+def client_with_runner(client: TestClient, app: FastAPI, mock_runner: MagicMock) -> TestClient:
     """Create a test client with mock runner."""
-    app = create_app(workflows_dir=temp_workflows_dir, runner=mock_runner, enable_cors=True)
-    return TestClient(app)
+    app.dependency_overrides[get_runner] = lambda: mock_runner
+    app.dependency_overrides[require_runner] = lambda: mock_runner
+    return client
 
 
 class TestHealthEndpoints:
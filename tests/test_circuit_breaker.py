@@ -124,7 +124,7 @@ class TestCircuitBreaker:
         breaker = CircuitBreaker(
             name="test",
             failure_threshold=2,
-            recovery_timeout=1,  # 1 second timeout
+            recovery_timeout=0.05,
         )
 
         async def fail_func() -> str:
@@ -138,7 +138,7 @@ class TestCircuitBreaker:
         assert breaker.state == CircuitState.OPEN
 
         # Wait for recovery timeout
-        await asyncio.sleep(1.1)
+        await asyncio.sleep(0.06)
 
         async def success_func() -> str:
             return "recovered"
@@ -154,7 +154,7 @@ class TestCircuitBreaker:
         breaker = CircuitBreaker(
             name="test",
             failure_threshold=2,
-            recovery_timeout=1,
+            recovery_timeout=0.05,
         )
 
         async def fail_func() -> str:
@@ -166,7 +166,7 @@ class TestCircuitBreaker:
                 await breaker.call(fail_func)
 
         # Wait for recovery timeout
-        await asyncio.sleep(1.1)
+        await asyncio.sleep(0.06)
 
         # Fail again in half-open state
         with pytest.raises(CircuitBreakerTestError):
@@ -181,7 +181,7 @@ class TestCircuitBreaker:
         breaker = CircuitBreaker(
             name="test",
             failure_threshold=2,
-            recovery_timeout=1,
+            recovery_timeout=0.05,
             half_open_requests=1,
         )
 
@@ -194,7 +194,7 @@ class TestCircuitBreaker:
                 await breaker.call(fail_func)
 
         # Wait for recovery timeout
-        await asyncio.sleep(1.1)
+        await asyncio.sleep(0.06)
 
         async def slow_func() -> str:
             await asyncio.sleep(0.5)
@@ -28,10 +28,12 @@ class TestDebouncedHandler:
             debounce_seconds=0.5,
         )
 
-        assert handler.callback == callback
-        assert handler.events == ["created", "modified"]
-        assert handler.pattern == "*.txt"
-        assert handler.debounce_seconds == 0.5
+        (subscription,) = handler._subscriptions
+        assert subscription.callback == callback
+        assert subscription.event_set == {"created", "modified"}
+        assert subscription.pattern_re is not None
+        assert subscription.pattern_re.match("notes.txt")
+        assert subscription.debounce_seconds == 0.5
 
     def test_should_handle_directory_event(self) -> None:
         """Test that directory events are ignored."""
@@ -112,6 +114,57 @@ class TestDebouncedHandler:
         # Should only be called once due to debouncing
         assert callback.call_count == 1
 
+    def test_debounce_per_path_with_single_worker(self) -> None:
+        """Test each path is debounced separately by one worker thread."""
+        callback = MagicMock()
+        handler = DebouncedHandler(
+            callback=callback,
+            events=["modified"],
+            debounce_seconds=0.1,
+        )
+
+        threads_before = threading.active_count()
+        for _ in range(5):
+            handler.on_any_event(FileModifiedEvent("/tmp/a.txt"))
+            handler.on_any_event(FileModifiedEvent("/tmp/b.txt"))
+        assert threading.active_count() <= threads_before + 1
+
+        time.sleep(0.5)
+
+        paths = sorted(call.args[0].src_path for call in callback.call_args_list)
+        assert paths == ["/tmp/a.txt", "/tmp/b.txt"]
+
+    def test_shared_handler_filters_per_callback(self) -> None:
+        """Test callbacks on one handler keep their own filters and debounce state."""
+        on_created = MagicMock()
+        on_modified = MagicMock()
+        handler = DebouncedHandler(callback=on_created, events=["created"], debounce_seconds=0.1)
+        handler.add_callback(on_modified, events=["modified"], debounce_seconds=0.1)
+
+        handler.on_any_event(FileCreatedEvent("/tmp/file.txt"))
+        handler.on_any_event(FileModifiedEvent("/tmp/file.txt"))
+        time.sleep(0.5)
+
+        assert on_created.call_count == 1
+        assert on_created.call_args.args[0].event_type == "created"
+        assert on_modified.call_count == 1
+        assert on_modified.call_args.args[0].event_type == "modified"
+
+    def test_remove_callback(self) -> None:
+        """Test removing a callback drops its pending events."""
+        first = MagicMock()
+        second = MagicMock()
+        handler = DebouncedHandler(callback=first, events=["modified"], debounce_seconds=0.1)
+        handler.add_callback(second, events=["modified"], debounce_seconds=0.1)
+
+        handler.on_any_event(FileModifiedEvent("/tmp/file.txt"))
+        assert handler.remove_callback(first) == 1
+        assert [sub.callback for sub in handler._subscriptions] == [second]
+        time.sleep(0.5)
+
+        assert first.call_count == 0
+        assert second.call_count == 1
+
     def test_cancel_all(self) -> None:
         """Test canceling all pending callbacks."""
         callback = MagicMock()
@@ -172,6 +225,91 @@ class TestFileWatchService:
         service.stop()  # Should not raise
         assert service.is_running is False
 
+    def test_workflows_run_on_service_loop(self, tmp_path: Path) -> None:
+        """Test triggered workflows run concurrently on the service's event loop."""
+        import asyncio
+
+        from flowpilot.scheduler import file_watcher
+
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text(
+            "name: loop-test\nnodes:\n  - id: a\n    type: shell\n    command: 'true'\n"
+        )
+        loops: list[object] = []
+        threads: list[str] = []
+        finished = threading.Semaphore(0)
+
+        async def fake_run(*args: object, **kwargs: object) -> None:
+            loops.append(asyncio.get_running_loop())
+            threads.append(threading.current_thread().name)
+            await asyncio.sleep(0.2)
+            finished.release()
+
+        runner = MagicMock()
+        runner.run = fake_run
+        set_global_file_watcher_runner(runner)
+        service = FileWatchService()
+        service.start()
+        try:
+            start = time.monotonic()
+            for _ in range(2):
+                file_watcher._execute_file_watch_workflow(
+                    "loop-test", str(workflow_file), "created", str(tmp_path / "x.txt"), False
+                )
+            # Submission does not wait for the workflow to finish
+            assert time.monotonic() - start < 0.2
+
+            assert finished.acquire(timeout=5.0)
+            assert finished.acquire(timeout=5.0)
+            # Both runs overlapped rather than running back to back
+            assert time.monotonic() - start < 0.4
+        finally:
+            service.stop()
+            set_global_file_watcher_runner(None)
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        assert threads == ["flowpilot-file-watch-loop"] * 2
+        assert file_watcher._global_loop is None
+
+    def test_stop_cancels_running_workflows(self, tmp_path: Path) -> None:
+        """Test stopping the service cancels workflows still running on its loop."""
+        import asyncio
+
+        from flowpilot.scheduler import file_watcher
+
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text(
+            "name: loop-test\nnodes:\n  - id: a\n    type: shell\n    command: 'true'\n"
+        )
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def fake_run(*args: object, **kwargs: object) -> None:
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        runner = MagicMock()
+        runner.run = fake_run
+        set_global_file_watcher_runner(runner)
+        service = FileWatchService()
+        service.start()
+        try:
+            file_watcher._execute_file_watch_workflow(
+                "loop-test", str(workflow_file), "created", str(tmp_path / "x.txt"), False
+            )
+            assert started.wait(timeout=5.0)
+        finally:
+            service.stop()
+            set_global_file_watcher_runner(None)
+
+        assert cancelled.is_set()
+        assert file_watcher._inflight == set()
+
     def test_add_watch(self, tmp_path: Path) -> None:
         """Test adding a file watch."""
         service = FileWatchService()
@@ -258,6 +396,52 @@ class TestFileWatchService:
         finally:
             service.stop()
 
+    def test_get_watches_for_path(self, tmp_path: Path) -> None:
+        """Test looking up workflows by watched directory."""
+        service = FileWatchService()
+        service.start()
+
+        try:
+            trigger = FileWatchTrigger(type="file-watch", path=str(tmp_path), events=["created"])
+            service.add_watch("workflow-1", trigger, "/path/to/workflow1.yaml")
+            service.add_watch("workflow-2", trigger, "/path/to/workflow2.yaml")
+
+            assert service.get_watches_for_path(tmp_path) == {"workflow-1", "workflow-2"}
+
+            service.remove_watch("workflow-1")
+            assert service.get_watches_for_path(str(tmp_path)) == {"workflow-2"}
+
+            service.remove_watch("workflow-2")
+            assert service.get_watches_for_path(tmp_path) == set()
+            assert service._by_path == {}
+
+        finally:
+            service.stop()
+
+    def test_same_directory_shares_handler(self, tmp_path: Path) -> None:
+        """Test workflows on one directory share a handler and can be removed independently."""
+        service = FileWatchService()
+        service.start()
+
+        try:
+            trigger = FileWatchTrigger(type="file-watch", path=str(tmp_path), events=["created"])
+            service.add_watch("workflow-1", trigger, "/path/to/workflow1.yaml")
+            service.add_watch("workflow-2", trigger, "/path/to/workflow2.yaml")
+
+            assert service._handlers["workflow-1"] is service._handlers["workflow-2"]
+            assert len(service._dir_handlers) == 1
+
+            # Removing one workflow keeps the directory watched for the other
+            assert service.remove_watch("workflow-1") is True
+            assert len(service._dir_handlers) == 1
+            assert service.get_watch("workflow-2") is not None
+
+            assert service.remove_watch("workflow-2") is True
+            assert service._dir_handlers == {}
+
+        finally:
+            service.stop()
+
     def test_get_watch(self, tmp_path: Path) -> None:
         """Test getting a specific watch."""
         service = FileWatchService()
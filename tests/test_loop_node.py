@@ -397,6 +397,21 @@ class TestExecutionContextLoopVariables:
 
         assert "item" not in context.loop_variables
 
+    def test_loop_scope_isolates_loop_variables(self) -> None:
+        """Test a loop scope has its own loop variables but shares node results."""
+        context = ExecutionContext(workflow_name="test", inputs={"x": 1})
+        context.set_loop_variable("outer", "kept")
+
+        scope = context.loop_scope()
+        scope.set_loop_variable("item", "value")
+        scope.set_node_result("child[0]", NodeResult.success(stdout="done"))
+
+        assert scope.loop_variables == {"outer": "kept", "item": "value"}
+        assert context.loop_variables == {"outer": "kept"}
+        assert context.nodes["child[0]"].stdout == "done"
+        assert scope.execution_id == context.execution_id
+        assert scope.inputs is context.inputs
+
 
 class TestLoopExecutorExpressionResolution:
     """Tests for expression resolution."""
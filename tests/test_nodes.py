@@ -263,3 +263,19 @@ class TestClaudeApiNode:
         """Test temperature must be between 0 and 1."""
         with pytest.raises(ValidationError):
             ClaudeApiNode(type="claude-api", id="node", prompt="test", temperature=1.5)
+
+
+class TestTemplateFields:
+    """Tests for per-class template field detection."""
+
+    def test_string_fields_included(self) -> None:
+        """Test string and string-container fields are template-capable."""
+        assert {"command", "working_dir", "env"} <= ShellNode._TEMPLATE_FIELDS
+        assert {"url", "headers", "body"} <= HttpNode._TEMPLATE_FIELDS
+        assert {"prompt", "messages", "json_schema"} <= ClaudeApiNode._TEMPLATE_FIELDS
+
+    def test_non_string_fields_excluded(self) -> None:
+        """Test numeric, boolean, literal and nested model fields are skipped."""
+        assert not {"type", "timeout", "retry", "continue_on_error"} & ShellNode._TEMPLATE_FIELDS
+        assert "method" not in HttpNode._TEMPLATE_FIELDS
+        assert not {"fail_fast", "max_concurrency"} & ParallelNode._TEMPLATE_FIELDS
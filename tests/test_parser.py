@@ -1,10 +1,17 @@
 """Tests for FlowPilot WorkflowParser."""
 
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 
-from flowpilot.engine import WorkflowParseError, WorkflowParser, get_node_by_id
+from flowpilot.engine import (
+    WorkflowParseError,
+    WorkflowParser,
+    get_node_by_id,
+    load_workflow_file,
+)
+from flowpilot.engine import parser as parser_module
 from flowpilot.models import ShellNode, Workflow
 
 
@@ -119,6 +126,17 @@ class TestWorkflowParserParseFile:
         with pytest.raises(FileNotFoundError):
             parser.parse_file("/nonexistent/path/workflow.yaml")
 
+    def test_parse_utf8_workflow_file(self, parser: WorkflowParser, tmp_path: Path) -> None:
+        """Test non-ASCII content is decoded as UTF-8."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_bytes(
+            "name: unicode\ndescription: Café ☕\nnodes:\n"
+            "  - id: a\n    type: shell\n    command: echo 你好\n".encode()
+        )
+        workflow = parser.parse_file(workflow_file)
+        assert workflow.description == "Café ☕"
+        assert workflow.nodes[0].command == "echo 你好"
+
 
 class TestWorkflowParserParseDict:
     """Tests for parse_dict method."""
@@ -254,6 +272,67 @@ class TestGetNodeById:
         assert node is None
 
 
+class TestLoadWorkflowFile:
+    """Tests for the shared, stat-validated workflow cache."""
+
+    WORKFLOW_YAML = """
+name: cached-workflow
+nodes:
+  - id: step
+    type: shell
+    command: echo {text}
+"""
+
+    def test_unchanged_file_reuses_parsed_workflow(self, tmp_path: Path) -> None:
+        """Test the same Workflow object is returned while the file is unchanged."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text(self.WORKFLOW_YAML.format(text="one"))
+
+        first = load_workflow_file(workflow_file)
+        second = load_workflow_file(str(workflow_file))
+
+        assert first is second
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        """Test editing the workflow file invalidates the cached model."""
+        workflow_file = tmp_path / "workflow.yaml"
+        workflow_file.write_text(self.WORKFLOW_YAML.format(text="one"))
+        first = load_workflow_file(workflow_file)
+
+        workflow_file.write_text(self.WORKFLOW_YAML.format(text="changed"))
+        second = load_workflow_file(workflow_file)
+
+        assert second is not first
+        assert isinstance(second.nodes[0], ShellNode)
+        assert second.nodes[0].command == "echo changed"
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_workflow_file(tmp_path / "missing.yaml")
+
+    def test_least_recently_used_evicted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the cache keeps at most WORKFLOW_CACHE_SIZE files."""
+        monkeypatch.setattr(parser_module, "WORKFLOW_CACHE_SIZE", 2)
+        monkeypatch.setattr(parser_module, "_workflow_cache", OrderedDict())
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.yaml"
+            path.write_text(self.WORKFLOW_YAML.format(text=name))
+            paths.append(path)
+
+        load_workflow_file(paths[0])
+        load_workflow_file(paths[1])
+        load_workflow_file(paths[0])  # Now most recently used
+        load_workflow_file(paths[2])
+
+        assert paths[0] in parser_module._workflow_cache
+        assert paths[1] not in parser_module._workflow_cache
+        assert paths[2] in parser_module._workflow_cache
+
+
 class TestAllNodeTypes:
     """Test parsing all node types."""
 
@@ -1,5 +1,7 @@
 """Tests for FlowPilot workflow runner."""
 
+import asyncio
+
 import pytest
 
 from flowpilot.engine import (
@@ -10,6 +12,8 @@ from flowpilot.engine import (
     NodeResult,
     WorkflowRunner,
 )
+from flowpilot.engine.nodes.loop import LoopExecutor
+from flowpilot.engine.template import TemplateEngine
 from flowpilot.models import BaseNode, ShellNode, Workflow
 
 
@@ -235,6 +239,116 @@ class TestWorkflowRunnerDependencyGraph:
         assert context.status == "success"
         assert all(r.status == "success" for r in context.nodes.values())
 
+    @pytest.mark.asyncio
+    async def test_independent_nodes_run_concurrently(self, runner: WorkflowRunner) -> None:
+        """Test independent nodes are executed concurrently."""
+        ExecutorRegistry.clear()
+        released = asyncio.Event()
+
+        @ExecutorRegistry.register("shell")
+        class RendezvousExecutor(NodeExecutor):
+            async def execute(self, node: BaseNode, context: ExecutionContext) -> NodeResult:
+                # "waiter" can only finish if "releaser" runs at the same time
+                if node.id == "waiter":
+                    await asyncio.wait_for(released.wait(), timeout=2)
+                elif node.id == "releaser":
+                    released.set()
+                return NodeResult.success()
+
+        workflow = Workflow(
+            name="concurrent",
+            nodes=[
+                {"type": "shell", "id": "waiter", "command": "echo"},
+                {"type": "shell", "id": "releaser", "command": "echo"},
+                {
+                    "type": "shell",
+                    "id": "join",
+                    "command": "echo",
+                    "depends_on": ["waiter", "releaser"],
+                },
+            ],
+        )
+
+        context = await runner.run(workflow)
+
+        assert context.status == "success"
+        assert context.nodes["waiter"].status == "success"
+        assert context.nodes["join"].status == "success"
+
+    @pytest.mark.asyncio
+    async def test_error_stop_cancels_running_nodes(self, runner: WorkflowRunner) -> None:
+        """Test on_error=stop cancels independent nodes still running."""
+        ExecutorRegistry.clear()
+
+        @ExecutorRegistry.register("shell")
+        class SlowOrFailingExecutor(NodeExecutor):
+            async def execute(self, node: BaseNode, context: ExecutionContext) -> NodeResult:
+                if node.id == "fail":
+                    return NodeResult.error("Intentional failure")
+                await asyncio.sleep(5)
+                return NodeResult.success()
+
+        workflow = Workflow(
+            name="stop-cancels",
+            nodes=[
+                {"type": "shell", "id": "slow", "command": "sleep"},
+                {"type": "shell", "id": "fail", "command": "fail"},
+            ],
+        )
+
+        context = await runner.run(workflow)
+
+        assert context.status == "error"
+        assert context.nodes["fail"].status == "error"
+        assert "slow" not in context.nodes
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_clock_anchor(self, runner: WorkflowRunner) -> None:
+        """Test overlapping runs do not re-anchor the runner's wall clock."""
+        anchor = (runner._wall_epoch, runner._mono_epoch)
+        workflow = Workflow(
+            name="overlap",
+            nodes=[{"type": "shell", "id": "step-1", "command": "echo"}],
+        )
+
+        first, second = await asyncio.gather(runner.run(workflow), runner.run(workflow))
+
+        assert first.status == "success"
+        assert second.status == "success"
+        assert (runner._wall_epoch, runner._mono_epoch) == anchor
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loops_keep_own_variables(self, runner: WorkflowRunner) -> None:
+        """Test sibling loops running concurrently do not share loop variables."""
+        ExecutorRegistry.clear()
+        ExecutorRegistry.register("loop")(LoopExecutor)
+        engine = TemplateEngine()
+
+        @ExecutorRegistry.register("shell")
+        class RenderingExecutor(NodeExecutor):
+            async def execute(self, node: BaseNode, context: ExecutionContext) -> NodeResult:
+                assert isinstance(node, ShellNode)
+                # Yield so the sibling loop can advance, then read the loop variable again
+                await asyncio.sleep(0.01)
+                late = engine.render_with_context("{{ item | default('-') }}", context)
+                return NodeResult.success(stdout=f"{node.command} {late}")
+
+        workflow = Workflow(
+            name="sibling-loops",
+            nodes=[
+                {"type": "loop", "id": "la", "for_each": "['a1', 'a2']", "do": ["ca"]},
+                {"type": "loop", "id": "lb", "for_each": "['b1', 'b2']", "do": ["cb"]},
+                {"type": "shell", "id": "ca", "command": "{{ item | default('-') | upper }}"},
+                {"type": "shell", "id": "cb", "command": "{{ item | default('-') | upper }}"},
+            ],
+        )
+
+        context = await runner.run(workflow)
+
+        assert context.status == "success"
+        assert [context.nodes[f"ca[{i}]"].stdout for i in range(2)] == ["A1 a1", "A2 a2"]
+        assert [context.nodes[f"cb[{i}]"].stdout for i in range(2)] == ["B1 b1", "B2 b2"]
+
 
 class TestWorkflowRunnerValidation:
     """Tests for workflow validation."""
@@ -282,6 +396,27 @@ class TestWorkflowRunnerValidation:
 
         assert any("Circular dependency" in e for e in errors)
 
+    def test_validate_reports_cycle_path(self, runner: WorkflowRunner) -> None:
+        """Test validation reports the nodes forming the cycle."""
+
+        @ExecutorRegistry.register("shell")
+        class DummyExecutor(NodeExecutor):
+            async def execute(self, node: BaseNode, context: ExecutionContext) -> NodeResult:
+                return NodeResult.success()
+
+        workflow = Workflow(
+            name="cycle-path",
+            nodes=[
+                {"type": "shell", "id": "start", "command": "echo"},
+                {"type": "shell", "id": "b", "command": "echo", "depends_on": ["start", "c"]},
+                {"type": "shell", "id": "c", "command": "echo", "depends_on": ["b"]},
+            ],
+        )
+
+        errors = runner.validate_workflow(workflow)
+
+        assert errors == ["Circular dependency detected: b -> c -> b"]
+
     def test_validate_clean_workflow(self, runner: WorkflowRunner) -> None:
         """Test validation passes for clean workflow."""
 
@@ -370,3 +505,31 @@ class TestWorkflowRunnerTemplating:
 
         assert context.status == "success"
         assert context.nodes["step-2"].stdout == "Previous: first output"
+
+    @pytest.mark.asyncio
+    async def test_template_rendering_in_container_fields(self, runner: WorkflowRunner) -> None:
+        """Test templates inside dict fields are rendered."""
+        ExecutorRegistry.clear()
+
+        @ExecutorRegistry.register("shell")
+        class EnvExecutor(NodeExecutor):
+            async def execute(self, node: BaseNode, context: ExecutionContext) -> NodeResult:
+                assert isinstance(node, ShellNode)
+                return NodeResult.success(output=node.env)
+
+        workflow = Workflow(
+            name="template-env",
+            inputs={"level": {"type": "string", "default": "debug"}},
+            nodes=[
+                {
+                    "type": "shell",
+                    "id": "run",
+                    "command": "echo",
+                    "env": {"LOG_LEVEL": "{{ inputs.level }}", "STATIC": "1"},
+                },
+            ],
+        )
+
+        context = await runner.run(workflow)
+
+        assert context.nodes["run"].output == {"LOG_LEVEL": "debug", "STATIC": "1"}
@@ -0,0 +1,432 @@
+"""Tests for ScheduleManager."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from flowpilot.engine import parser as parser_module
+from flowpilot.scheduler import manager as manager_module
+from flowpilot.scheduler.manager import ScheduleManager, ScheduleManagerError
+
+WORKFLOW_YAML = """
+name: {name}
+nodes:
+  - id: step
+    type: shell
+    command: echo {text}
+"""
+
+
+@pytest.fixture
+def workflows_dir(tmp_path: Path) -> Path:
+    """Create a workflows directory."""
+    path = tmp_path / "workflows"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def manager(workflows_dir: Path) -> ScheduleManager:
+    """Create a ScheduleManager with mocked services."""
+    return ScheduleManager(MagicMock(), MagicMock(), workflows_dir=workflows_dir)
+
+
+class TestLoadWorkflow:
+    """Tests for ScheduleManager workflow loading."""
+
+    def test_unchanged_file_reuses_parsed_workflow(
+        self, manager: ScheduleManager, workflows_dir: Path
+    ) -> None:
+        """Test the parsed workflow is reused while the file is unchanged."""
+        (workflows_dir / "cached.yaml").write_text(WORKFLOW_YAML.format(name="cached", text="a"))
+
+        first, path = manager._load_workflow("cached")
+        second, _ = manager._load_workflow("cached")
+
+        assert first is second
+        assert path == workflows_dir / "cached.yaml"
+
+    def test_changed_file_is_reparsed(self, manager: ScheduleManager, workflows_dir: Path) -> None:
+        """Test editing the file invalidates the cached workflow."""
+        workflow_file = workflows_dir / "cached.yaml"
+        workflow_file.write_text(WORKFLOW_YAML.format(name="cached", text="a"))
+        first, _ = manager._load_workflow("cached")
+
+        workflow_file.write_text(WORKFLOW_YAML.format(name="cached", text="changed"))
+        second, _ = manager._load_workflow("cached")
+
+        assert second is not first
+        assert second.nodes[0].command == "echo changed"
+
+    def test_missing_workflow_raises(self, manager: ScheduleManager) -> None:
+        """Test loading an unknown workflow raises ScheduleManagerError."""
+        with pytest.raises(ScheduleManagerError, match="Workflow not found"):
+            manager._load_workflow("missing")
+
+    def test_invalid_workflow_raises(self, manager: ScheduleManager, workflows_dir: Path) -> None:
+        """Test loading an invalid workflow raises ScheduleManagerError."""
+        (workflows_dir / "broken.yaml").write_text("name: broken\nnodes: []\n")
+
+        with pytest.raises(ScheduleManagerError, match="Failed to load workflow 'broken'"):
+            manager._load_workflow("broken")
+        assert workflows_dir / "broken.yaml" not in parser_module._workflow_cache
+
+    def test_parsed_workflow_shared_across_managers(
+        self, manager: ScheduleManager, workflows_dir: Path
+    ) -> None:
+        """Test a new manager reuses workflows parsed by an earlier one."""
+        (workflows_dir / "shared.yaml").write_text(WORKFLOW_YAML.format(name="shared", text="a"))
+        first, _ = manager._load_workflow("shared")
+
+        other = ScheduleManager(MagicMock(), MagicMock(), workflows_dir=workflows_dir)
+        second, _ = other._load_workflow("shared")
+
+        assert second is first
+
+    def test_warm_cache(self, manager: ScheduleManager, workflows_dir: Path) -> None:
+        """Test warming parses every valid workflow in the directory."""
+        for name in ("warm-a", "warm-b"):
+            (workflows_dir / f"{name}.yaml").write_text(WORKFLOW_YAML.format(name=name, text="a"))
+        (workflows_dir / "warm-broken.yaml").write_text("name: broken\nnodes: []\n")
+
+        assert manager.warm_cache() == 2
+        assert workflows_dir / "warm-a.yaml" in parser_module._workflow_cache
+        assert workflows_dir / "warm-b.yaml" in parser_module._workflow_cache
+
+    def test_warm_cache_missing_directory(self, tmp_path: Path) -> None:
+        """Test warming a missing workflows directory loads nothing."""
+        manager = ScheduleManager(MagicMock(), MagicMock(), workflows_dir=tmp_path / "nope")
+        assert manager.warm_cache() == 0
+
+
+class TestGetStatusMany:
+    """Tests for batched schedule status lookups."""
+
+    @pytest.fixture
+    def status_manager(self, workflows_dir: Path) -> ScheduleManager:
+        """Create a ScheduleManager with an in-memory database and one active job."""
+        from flowpilot.storage import Database, Schedule, ScheduleRepository
+
+        db = Database(":memory:")
+        db.create_tables()
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            repo.create(Schedule(workflow_name="active", workflow_path="/a.yaml", enabled=1))
+            repo.create(Schedule(workflow_name="disabled", workflow_path="/d.yaml", enabled=0))
+
+        job = {"name": "active", "next_run": None, "trigger": "cron[hour='9']", "paused": False}
+        scheduler = MagicMock()
+        scheduler.get_schedules.return_value = [job]
+        scheduler.get_schedule.side_effect = lambda name: job if name == "active" else None
+        return ScheduleManager(scheduler, db, workflows_dir=workflows_dir)
+
+    def test_status_for_several_workflows(self, status_manager: ScheduleManager) -> None:
+        """Test statuses are returned in request order, skipping unknown workflows."""
+        statuses = status_manager.get_status_many(["disabled", "unknown", "active", "disabled"])
+
+        assert [s["name"] for s in statuses] == ["disabled", "active"]
+        assert statuses[0]["enabled"] is False
+        assert statuses[1]["enabled"] is True
+        assert statuses[1]["trigger"] == "cron[hour='9']"
+        status_manager._scheduler.get_schedules.assert_called_once()  # type: ignore[attr-defined]
+
+    def test_single_status_matches_batch(self, status_manager: ScheduleManager) -> None:
+        """Test get_status(name) returns the same entry as the batched lookup."""
+        assert status_manager.get_status("active") == status_manager.get_status_many(["active"])
+        assert status_manager.get_status("unknown") == []
+
+    def test_full_status(self, status_manager: ScheduleManager) -> None:
+        """Test the full listing covers active jobs and disabled leftovers."""
+        statuses = status_manager.get_status()
+
+        assert [(s["name"], s["enabled"]) for s in statuses] == [
+            ("active", True),
+            ("disabled", False),
+        ]
+
+    def test_single_status_reused_briefly(
+        self, status_manager: ScheduleManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeated single-workflow lookups within the TTL hit the backends once."""
+        scheduler = status_manager._scheduler
+        scheduler.get_next_run.return_value = None  # type: ignore[attr-defined]
+        clock = [100.0]
+        monkeypatch.setattr(manager_module.time, "monotonic", lambda: clock[0])
+
+        first = status_manager.get_status("active")
+        first[0]["name"] = "mutated"
+        assert status_manager.get_status("active")[0]["name"] == "active"
+        assert scheduler.get_schedule.call_count == 1  # type: ignore[attr-defined]
+
+        # Writes through the manager drop the cached entry
+        status_manager.update_last_run("active", "failed")
+        assert status_manager.get_status("active")[0]["last_status"] == "failed"
+        assert scheduler.get_schedule.call_count == 2  # type: ignore[attr-defined]
+
+        clock[0] += manager_module._STATUS_CACHE_TTL
+        status_manager.get_status("active")
+        assert scheduler.get_schedule.call_count == 3  # type: ignore[attr-defined]
+
+    def test_full_status_merges_watches_and_webhooks(self, status_manager: ScheduleManager) -> None:
+        """Test jobs, file watches and webhooks merge into one entry per workflow."""
+        status_manager._file_watcher = MagicMock()
+        status_manager._file_watcher.get_watches.return_value = [
+            {"workflow": "watched", "path": "/in"}
+        ]
+        status_manager._webhook_service = MagicMock()
+        status_manager._webhook_service.get_webhooks.return_value = [
+            {"workflow_name": "active", "path": "/hooks/a"},
+            {"workflow_name": "hooked", "path": "/hooks/h"},
+        ]
+
+        statuses = {s["name"]: s for s in status_manager.get_status()}
+
+        assert list(statuses) == ["active", "watched", "hooked", "disabled"]
+        assert statuses["active"]["trigger"] == "cron[hour='9']"
+        assert statuses["active"]["webhook"] == {"workflow_name": "active", "path": "/hooks/a"}
+        assert statuses["watched"]["file_watch"] == {"workflow": "watched", "path": "/in"}
+        assert statuses["watched"]["trigger"] is None
+        assert statuses["hooked"]["enabled"] is True
+        assert statuses["disabled"]["enabled"] is False
+
+    def test_single_status_looks_up_registrations(self, status_manager: ScheduleManager) -> None:
+        """Test a single-workflow lookup queries each service for that workflow only."""
+        status_manager._file_watcher = MagicMock()
+        status_manager._file_watcher.get_watch.return_value = None
+        status_manager._webhook_service = MagicMock()
+        status_manager._webhook_service.get_webhook.return_value = {"workflow_name": "active"}
+
+        statuses = status_manager.get_status_many(["active"])
+
+        assert statuses[0]["webhook"] == {"workflow_name": "active"}
+        assert statuses[0]["file_watch"] is None
+        status_manager._file_watcher.get_watches.assert_not_called()
+        status_manager._webhook_service.get_webhooks.assert_not_called()
+        status_manager._scheduler.get_schedules.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_iter_status_is_lazy(self, status_manager: ScheduleManager) -> None:
+        """Test statuses stream without sharing the suspended generator's session."""
+        statuses = status_manager.iter_status()
+
+        assert next(statuses)["name"] == "active"
+        assert status_manager._current_session.get() is None
+        assert [s["name"] for s in statuses] == ["disabled"]
+
+
+CRON_WORKFLOW_YAML = """
+name: {name}
+triggers:
+  - type: cron
+    schedule: "0 9 * * *"
+nodes:
+  - id: step
+    type: shell
+    command: echo hi
+"""
+
+
+class TestEnableDisable:
+    """Tests for persisting enabled and disabled schedules."""
+
+    @pytest.fixture
+    def db_manager(self, workflows_dir: Path) -> ScheduleManager:
+        """Create a ScheduleManager with an in-memory database."""
+        from flowpilot.storage import Database
+
+        db = Database(":memory:")
+        db.create_tables()
+        scheduler = MagicMock()
+        scheduler.schedule_workflow.return_value = ("workflow:first", None)
+        scheduler.get_next_run.return_value = None
+        scheduler.get_schedule.return_value = None
+        for name in ("first", "second"):
+            (workflows_dir / f"{name}.yaml").write_text(CRON_WORKFLOW_YAML.format(name=name))
+        return ScheduleManager(scheduler, db, workflows_dir=workflows_dir)
+
+    def _schedules(self, manager: ScheduleManager) -> dict[str, tuple[int, object]]:
+        from flowpilot.storage import ScheduleRepository
+
+        with manager._db.session_scope() as session:
+            return {
+                s.workflow_name: (s.enabled, s.trigger_config)
+                for s in ScheduleRepository(session).get_all()
+            }
+
+    def test_enable_then_disable(self, db_manager: ScheduleManager) -> None:
+        """Test enabling writes the schedule and disabling flips it off."""
+        db_manager.enable_workflow("first")
+        enabled, config = self._schedules(db_manager)["first"]
+        assert enabled == 1
+        assert config["schedule"]["schedule"] == "0 9 * * *"  # type: ignore[index]
+
+        db_manager.disable_workflow("first")
+        assert self._schedules(db_manager)["first"][0] == 0
+
+        # Re-enabling updates the existing record
+        db_manager.enable_workflow("first")
+        assert self._schedules(db_manager)["first"][0] == 1
+
+    def test_disabled_status_shows_stored_trigger(self, db_manager: ScheduleManager) -> None:
+        """Test a disabled schedule reports its stored trigger config as JSON."""
+        import json
+
+        db_manager.enable_workflow("first")
+        db_manager.disable_workflow("first")
+
+        status = db_manager.get_status_many(["first"])[0]
+        assert status["enabled"] is False
+        assert json.loads(status["trigger"]) == self._schedules(db_manager)["first"][1]
+
+    def test_triggers_grouped_once(self, db_manager: ScheduleManager) -> None:
+        """Test triggers are grouped and serialized once while the workflow is unchanged."""
+        workflow, path = db_manager._load_workflow("first")
+        first = db_manager._get_workflow_triggers(path, workflow)
+
+        db_manager.enable_workflow("first")
+        db_manager.enable_workflow("first")
+        other = ScheduleManager(MagicMock(), MagicMock(), workflows_dir=path.parent)
+
+        assert db_manager._get_workflow_triggers(path, workflow) is first
+        other_workflow, other_path = other._load_workflow("first")
+        assert other._get_workflow_triggers(other_path, other_workflow) is first
+        assert first.schedulable == list(workflow.triggers)
+        assert first.file_watches == first.webhooks == []
+        assert first.stored_config == {
+            "schedule": {"type": "cron", "schedule": "0 9 * * *", "timezone": "local"}
+        }
+
+    def test_enable_workflows_batch(self, db_manager: ScheduleManager) -> None:
+        """Test enabling several workflows records all of them."""
+        results = db_manager.enable_workflows(["first", "second"])
+
+        assert [r["workflow_name"] for r in results] == ["first", "second"]
+        assert {name: s[0] for name, s in self._schedules(db_manager).items()} == {
+            "first": 1,
+            "second": 1,
+        }
+
+    def test_batch_shares_one_timestamp(self, db_manager: ScheduleManager) -> None:
+        """Test records written by one batch or call share a single timestamp."""
+        from flowpilot.storage import ScheduleRepository
+
+        db_manager.enable_workflows(["first", "second"])
+        db_manager.update_last_run("first", "success")
+
+        with db_manager._db.session_scope() as session:
+            schedules = {s.workflow_name: s for s in ScheduleRepository(session).get_all()}
+            assert schedules["first"].last_run == schedules["first"].updated_at
+            assert schedules["second"].updated_at < schedules["first"].updated_at
+
+        db_manager.enable_workflows(["first", "second"])
+        with db_manager._db.session_scope() as session:
+            schedules = {s.workflow_name: s for s in ScheduleRepository(session).get_all()}
+            assert schedules["first"].updated_at == schedules["second"].updated_at
+
+    def test_enable_workflows_records_before_failure(self, db_manager: ScheduleManager) -> None:
+        """Test workflows enabled before a failing one are still recorded."""
+        with pytest.raises(ScheduleManagerError):
+            db_manager.enable_workflows(["first", "missing", "second"])
+
+        assert set(self._schedules(db_manager)) == {"first"}
+
+    def test_disable_workflows_batch(self, db_manager: ScheduleManager) -> None:
+        """Test disabling several workflows updates all of their records."""
+        db_manager.enable_workflows(["first", "second"])
+
+        results = db_manager.disable_workflows(["first", "second"])
+
+        assert [r["workflow_name"] for r in results] == ["first", "second"]
+        assert {name: s[0] for name, s in self._schedules(db_manager).items()} == {
+            "first": 0,
+            "second": 0,
+        }
+
+    def test_session_scope_shares_one_session(self, db_manager: ScheduleManager) -> None:
+        """Test calls inside session_scope reuse one session and commit together."""
+        from unittest.mock import patch
+
+        real_scope = db_manager._db.session_scope
+        with (
+            patch.object(db_manager._db, "session_scope", side_effect=real_scope) as scope,
+            db_manager.session_scope(),
+        ):
+            db_manager.enable_workflow("first")
+            db_manager.update_last_run("first", "success")
+            statuses = db_manager.get_status_many(["first"])
+
+        assert scope.call_count == 1
+        assert statuses[0]["last_status"] == "success"
+        assert self._schedules(db_manager)["first"][0] == 1
+
+    def test_session_scope_rolls_back_on_error(self, db_manager: ScheduleManager) -> None:
+        """Test an error inside session_scope discards writes made in it."""
+        with pytest.raises(RuntimeError), db_manager.session_scope():
+            db_manager.enable_workflow("first")
+            raise RuntimeError("boom")
+
+        assert self._schedules(db_manager) == {}
+
+
+class TestFindWorkflowPath:
+    """Tests for locating workflow files by name."""
+
+    def test_prefers_yaml_over_yml(self, manager: ScheduleManager, workflows_dir: Path) -> None:
+        """Test .yaml wins when both extensions exist, as before."""
+        (workflows_dir / "both.yml").write_text("")
+        (workflows_dir / "both.yaml").write_text("")
+        (workflows_dir / "only.yml").write_text("")
+
+        assert manager._find_workflow_path("both") == workflows_dir / "both.yaml"
+        assert manager._find_workflow_path("only") == workflows_dir / "only.yml"
+
+    def test_new_and_removed_files(self, manager: ScheduleManager, workflows_dir: Path) -> None:
+        """Test files added or removed after a lookup are noticed."""
+        with pytest.raises(ScheduleManagerError, match="Workflow not found"):
+            manager._find_workflow_path("later")
+
+        # Added immediately after a scan (directory mtime may not have changed)
+        (workflows_dir / "later.yaml").write_text(WORKFLOW_YAML.format(name="later", text="a"))
+        assert manager._find_workflow_path("later") == workflows_dir / "later.yaml"
+
+        (workflows_dir / "later.yaml").unlink()
+        with pytest.raises(ScheduleManagerError, match="Workflow not found"):
+            manager._load_workflow("later")
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Test a missing workflows directory reports the workflow as not found."""
+        manager = ScheduleManager(MagicMock(), MagicMock(), workflows_dir=tmp_path / "nope")
+        with pytest.raises(ScheduleManagerError, match="Workflow not found"):
+            manager._find_workflow_path("anything")
+
+
+class TestGroupTriggers:
+    """Tests for classifying a workflow's triggers."""
+
+    def test_mixed_triggers(self) -> None:
+        """Test each trigger lands in its group and manual triggers are ignored."""
+        from flowpilot.models import Workflow
+
+        workflow = Workflow.model_validate(
+            {
+                "name": "mixed",
+                "triggers": [
+                    {"type": "manual"},
+                    {"type": "webhook", "path": "/hooks/mixed"},
+                    {"type": "interval", "every": "5m"},
+                    {"type": "file-watch", "path": "/tmp/in"},
+                    {"type": "cron", "schedule": "0 9 * * *"},
+                ],
+                "nodes": [{"id": "step", "type": "shell", "command": "echo hi"}],
+            }
+        )
+
+        triggers = manager_module._group_triggers(workflow)
+
+        assert [t.type for t in triggers.schedulable] == ["interval", "cron"]
+        assert [t.path for t in triggers.file_watches] == ["/tmp/in"]
+        assert [t.path for t in triggers.webhooks] == ["/hooks/mixed"]
+        assert triggers.stored_config["schedule"]["type"] == "interval"
+        # Unset optional fields are not stored
+        assert "secret" not in triggers.stored_config["webhooks"][0]
+        assert "pattern" not in triggers.stored_config["file_watches"][0]
@@ -0,0 +1,55 @@
+"""Tests for the scheduler's background event loop."""
+
+import asyncio
+
+from flowpilot.scheduler.background_loop import BackgroundLoop
+
+
+class TestBackgroundLoop:
+    """Tests for BackgroundLoop."""
+
+    def test_start_runs_loop_on_thread(self) -> None:
+        """Test coroutines submitted to the started loop run on it."""
+        background = BackgroundLoop("test-loop", "test runs")
+        loop = background.start()
+        try:
+            assert background.start() is loop
+            assert background.loop is loop
+
+            async def running_loop() -> asyncio.AbstractEventLoop:
+                return asyncio.get_running_loop()
+
+            future = asyncio.run_coroutine_threadsafe(running_loop(), loop)
+            assert future.result(timeout=2) is loop
+        finally:
+            background.stop()
+
+        assert background.loop is None
+        assert loop.is_closed()
+
+    def test_stop_cancels_running_tasks(self) -> None:
+        """Test stopping cancels work still running on the loop."""
+        background = BackgroundLoop("test-loop", "test runs")
+        loop = background.start()
+        future = asyncio.run_coroutine_threadsafe(asyncio.sleep(30), loop)
+
+        background.stop(timeout=2)
+
+        assert future.cancelled()
+
+    def test_restart_creates_new_loop(self) -> None:
+        """Test a stopped background loop can be started again."""
+        background = BackgroundLoop("test-loop", "test runs")
+        first = background.start()
+        background.stop()
+
+        second = background.start()
+        try:
+            assert second is not first
+            assert second.is_running()
+        finally:
+            background.stop()
+
+    def test_stop_when_not_started(self) -> None:
+        """Test stopping a loop that never started does nothing."""
+        BackgroundLoop("test-loop", "test runs").stop()
@@ -6,10 +6,12 @@ from unittest.mock import MagicMock
 import pytest
 from apscheduler.triggers.cron import CronTrigger as APCronTrigger
 from apscheduler.triggers.interval import IntervalTrigger as APIntervalTrigger
+from sqlalchemy import text
 
 from flowpilot.models import Workflow
 from flowpilot.models.triggers import ManualTrigger
 from flowpilot.scheduler.service import SchedulerService
+from flowpilot.storage import Database
 
 
 @pytest.fixture
@@ -38,6 +40,26 @@ class TestSchedulerService:
         """Test service initialization."""
         assert scheduler_service.is_running is False
 
+    def test_init_requires_persistence(self, tmp_path: Path) -> None:
+        """Test that a db_url or an engine is required."""
+        with pytest.raises(ValueError, match="db_url or an engine"):
+            SchedulerService(workflows_dir=tmp_path)
+
+    def test_shared_engine(self, tmp_path: Path, sample_workflow: Workflow) -> None:
+        """Test that jobs persist through an engine shared with Database."""
+        db = Database(tmp_path / "flowpilot.db")
+        service = SchedulerService(workflows_dir=tmp_path, engine=db.engine)
+        service.start()
+        try:
+            service.schedule_workflow(sample_workflow, APIntervalTrigger(minutes=5))
+        finally:
+            service.shutdown()
+
+        with db.engine.connect() as conn:
+            count = conn.execute(text("SELECT COUNT(*) FROM apscheduler_jobs")).scalar()
+        assert count == 1
+        db.engine.dispose()
+
     def test_start_stop(self, scheduler_service: SchedulerService) -> None:
         """Test starting and stopping the scheduler."""
         scheduler_service.start()
@@ -68,9 +90,10 @@ class TestSchedulerService:
 
         try:
             trigger = APCronTrigger(hour=9, minute=0)
-            job_id = scheduler_service.schedule_workflow(sample_workflow, trigger)
+            job_id, next_run = scheduler_service.schedule_workflow(sample_workflow, trigger)
 
             assert job_id == f"workflow:{sample_workflow.name}"
+            assert next_run == scheduler_service.get_next_run(sample_workflow.name)
 
             # Verify job exists
             schedules = scheduler_service.get_schedules()
@@ -90,9 +113,10 @@ class TestSchedulerService:
 
         try:
             trigger = APIntervalTrigger(minutes=5)
-            job_id = scheduler_service.schedule_workflow(sample_workflow, trigger)
+            job_id, next_run = scheduler_service.schedule_workflow(sample_workflow, trigger)
 
             assert job_id == f"workflow:{sample_workflow.name}"
+            assert next_run == scheduler_service.get_next_run(sample_workflow.name)
 
             # Verify job exists
             schedules = scheduler_service.get_schedules()
@@ -268,3 +292,156 @@ class TestSchedulerService:
         mock_runner = MagicMock()
         scheduler_service.set_runner(mock_runner)
         assert scheduler_service._runner == mock_runner
+
+    def test_batch_wakes_scheduler_once(
+        self,
+        scheduler_service: SchedulerService,
+        sample_workflow: Workflow,
+    ) -> None:
+        """Test jobs added in a batch trigger a single scheduler wakeup."""
+        scheduler_service.start()
+
+        try:
+            wakeup = MagicMock()
+            scheduler_service._scheduler.wakeup = wakeup  # type: ignore[method-assign]
+            with scheduler_service.batch():
+                for i in range(3):
+                    workflow = sample_workflow.model_copy(update={"name": f"batch-{i}"})
+                    scheduler_service.schedule_workflow(workflow, APIntervalTrigger(minutes=5))
+                assert wakeup.call_count == 0
+
+            assert wakeup.call_count == 1
+            assert len(scheduler_service.get_schedules()) == 3
+            assert all(not s["paused"] for s in scheduler_service.get_schedules())
+        finally:
+            scheduler_service.shutdown()
+
+    def test_batch_when_not_running(
+        self,
+        scheduler_service: SchedulerService,
+        sample_workflow: Workflow,
+    ) -> None:
+        """Test batching is a no-op while the scheduler is stopped."""
+        with scheduler_service.batch():
+            _, next_run = scheduler_service.schedule_workflow(
+                sample_workflow, APIntervalTrigger(minutes=5)
+            )
+
+        assert next_run is None
+
+        assert scheduler_service.is_running is False
+
+
+class TestScheduledExecution:
+    """Tests for running scheduled workflows on the service event loop."""
+
+    def test_runs_on_service_loop(
+        self, scheduler_service: SchedulerService, tmp_path: Path
+    ) -> None:
+        """Test jobs run on the service's long-lived loop, not a fresh one per run."""
+        import asyncio
+
+        from flowpilot.scheduler import service
+
+        workflow_file = tmp_path / "looped.yaml"
+        workflow_file.write_text(
+            "name: looped\nnodes:\n  - id: step\n    type: shell\n    command: echo hi\n"
+        )
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        async def run(*args: object, **kwargs: object) -> None:
+            loops.append(asyncio.get_running_loop())
+
+        runner = MagicMock()
+        runner.run = run
+        scheduler_service.set_runner(runner)
+        scheduler_service.start()
+        try:
+            service_loop = service._global_loop
+            assert service_loop is not None
+            service._execute_scheduled_workflow("looped", str(workflow_file))
+            service._execute_scheduled_workflow("looped", str(workflow_file))
+        finally:
+            scheduler_service.shutdown()
+            service.set_global_runner(None)
+
+        assert loops == [service_loop, service_loop]
+        assert service._global_loop is None
+        assert service_loop.is_closed()
+
+    def test_runs_without_service_loop(self, tmp_path: Path) -> None:
+        """Test a job called with no running service still runs the workflow."""
+        from flowpilot.scheduler import service
+
+        workflow_file = tmp_path / "direct.yaml"
+        workflow_file.write_text(
+            "name: direct\nnodes:\n  - id: step\n    type: shell\n    command: echo hi\n"
+        )
+        calls: list[str] = []
+
+        async def run(workflow: Workflow, **kwargs: object) -> None:
+            calls.append(workflow.name)
+
+        runner = MagicMock()
+        runner.run = run
+        service.set_global_runner(runner)
+        try:
+            service._execute_scheduled_workflow("direct", str(workflow_file))
+        finally:
+            service.set_global_runner(None)
+
+        assert calls == ["direct"]
+
+    def test_unchanged_workflow_parsed_once(self, tmp_path: Path) -> None:
+        """Test repeated runs reuse the parsed workflow until the file changes."""
+        from flowpilot.scheduler import service
+
+        workflow_file = tmp_path / "cached.yaml"
+        workflow_file.write_text(
+            "name: cached\nnodes:\n  - id: step\n    type: shell\n    command: echo a\n"
+        )
+        workflows: list[Workflow] = []
+
+        async def run(workflow: Workflow, **kwargs: object) -> None:
+            workflows.append(workflow)
+
+        runner = MagicMock()
+        runner.run = run
+        service.set_global_runner(runner)
+        try:
+            service._execute_scheduled_workflow("cached", str(workflow_file))
+            service._execute_scheduled_workflow("cached", str(workflow_file))
+            workflow_file.write_text(
+                "name: cached\nnodes:\n  - id: step\n    type: shell\n    command: echo bb\n"
+            )
+            service._execute_scheduled_workflow("cached", str(workflow_file))
+        finally:
+            service.set_global_runner(None)
+
+        assert workflows[0] is workflows[1]
+        assert workflows[2] is not workflows[0]
+        assert workflows[2].nodes[0].command == "echo bb"
+
+
+class TestSchedulerPackage:
+    """Tests for the flowpilot.scheduler package namespace."""
+
+    def test_import_does_not_load_submodules(self) -> None:
+        """Test importing the package defers watchdog and APScheduler imports."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, flowpilot.scheduler as s; "
+            "assert 'watchdog' not in sys.modules; "
+            "assert 'apscheduler' not in sys.modules; "
+            "assert s.FileWatchService.__module__ == 'flowpilot.scheduler.file_watcher'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test unknown names still raise AttributeError."""
+        import flowpilot.scheduler
+
+        with pytest.raises(AttributeError):
+            _ = flowpilot.scheduler.DoesNotExist  # type: ignore[attr-defined]
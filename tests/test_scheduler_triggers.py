@@ -110,6 +110,21 @@ class TestParseIntervalTrigger:
         assert isinstance(trigger, APIntervalTrigger)
         assert trigger.interval.total_seconds() == 86400
 
+    def test_parse_returns_fresh_trigger(self) -> None:
+        """Test that each parse gets its own trigger from the cached seconds."""
+        config = IntervalTrigger(type="interval", every="5m")
+        first = parse_interval_trigger(config)
+        second = parse_interval_trigger(config)
+
+        assert first is not second
+        assert first.interval == second.interval
+
+    def test_parse_unvalidated_interval(self) -> None:
+        """Test that an interval that skipped validation still raises."""
+        config = IntervalTrigger.model_construct(type="interval", every="5min")
+        with pytest.raises(ValueError, match="Invalid interval"):
+            parse_interval_trigger(config)
+
     def test_invalid_interval_format(self) -> None:
         """Test that invalid interval format raises error."""
         with pytest.raises(ValueError, match="Invalid interval format"):
@@ -1,6 +1,7 @@
 """Tests for FlowPilot storage layer."""
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
@@ -43,6 +44,133 @@ class TestDatabase:
 
         assert db_path.exists()
 
+    def test_file_database_pool_size(self, tmp_path: pytest.TempPathFactory) -> None:
+        """Test pool sizing options are applied to file-based databases."""
+        from sqlalchemy.pool import QueuePool
+
+        db = Database(tmp_path / "pool.db", pool_size=3, max_overflow=4)  # type: ignore[operator]
+        pool = db._engine.pool
+
+        assert isinstance(pool, QueuePool)
+        assert pool.size() == 3
+        assert pool._max_overflow == 4
+
+    def test_file_database_pragmas(self, tmp_path: pytest.TempPathFactory) -> None:
+        """Test new file database connections use WAL and a busy timeout."""
+        from sqlalchemy import text
+
+        db = Database(tmp_path / "wal.db")  # type: ignore[operator]
+        with db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+    def test_in_memory_shared_across_threads(self, db: Database) -> None:
+        """Test an in-memory database is visible from other threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with db.session_scope() as session:
+            ScheduleRepository(session).create(
+                Schedule(workflow_name="shared", workflow_path="/s.yaml")
+            )
+
+        def lookup() -> bool:
+            with db.session_scope() as session:
+                return ScheduleRepository(session).get_by_workflow("shared") is not None
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(lookup).result() is True
+
+    def test_get_database_reuses_instance(self, tmp_path: Path) -> None:
+        """Test get_database returns one instance per database file until closed."""
+        from flowpilot.storage import close_databases, get_database
+
+        db_path = tmp_path / "shared.db"
+        first = get_database(db_path)
+        try:
+            assert get_database(str(db_path)) is first
+            assert get_database(":memory:") is not get_database(":memory:")
+
+            with first.engine.connect():
+                pass
+            assert first.engine.pool.checkedin() == 1  # type: ignore[attr-defined]
+
+            close_databases()
+
+            assert first.engine.pool.checkedin() == 0  # type: ignore[attr-defined]
+            assert get_database(db_path) is not first
+        finally:
+            close_databases()
+
+    def test_create_tables_adds_missing_indexes(self, tmp_path: pytest.TempPathFactory) -> None:
+        """Test create_tables adds new indexes to an existing database."""
+        from sqlalchemy import inspect, text
+
+        db = Database(tmp_path / "old.db")  # type: ignore[operator]
+        db.create_tables()
+        with db.engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_exec_workflow_started"))
+
+        db.create_tables()
+
+        names = {index["name"] for index in inspect(db.engine).get_indexes("executions")}
+        assert {"ix_exec_workflow_started", "ix_exec_started"} <= names
+
+    def test_workflow_history_uses_index(self, db: Database) -> None:
+        """Test latest-runs-per-workflow queries scan the index instead of sorting."""
+        from sqlalchemy import text
+
+        with db.engine.connect() as conn:
+            plan = conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT * FROM executions WHERE workflow_name = 'w' "
+                    "ORDER BY started_at DESC LIMIT 10"
+                )
+            ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_exec_workflow_started" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_json_columns_round_trip(self, db: Database) -> None:
+        """Test JSON columns store and load nested, unicode and very large values."""
+        config = {"schedule": {"type": "cron", "schedule": "0 9 * * *"}, "note": "café ☕"}
+        config["big"] = 2**70  # beyond orjson's 64-bit integer range
+        with db.session_scope() as session:
+            ScheduleRepository(session).create(
+                Schedule(workflow_name="json", workflow_path="/j.yaml", trigger_config=config)
+            )
+
+        with db.session_scope() as session:
+            schedule = ScheduleRepository(session).get_by_workflow("json")
+            assert schedule is not None
+            assert schedule.trigger_config == config
+
+    def test_json_columns_round_trip_special_numbers(self, db: Database) -> None:
+        """Test JSON columns keep big integers as int and NaN/Infinity as floats."""
+        import math
+
+        inputs = {"big": 2**70, "nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")}
+        with db.session_scope() as session:
+            ExecutionRepository(session).create(
+                Execution(
+                    id="exec-json",
+                    workflow_name="test",
+                    workflow_path="/test",
+                    status=ExecutionStatus.SUCCESS,
+                    inputs=inputs,
+                )
+            )
+
+        with db.session_scope() as session:
+            execution = ExecutionRepository(session).get_by_id("exec-json")
+            assert execution is not None
+            loaded = execution.inputs
+            assert loaded["big"] == 2**70
+            assert isinstance(loaded["big"], int)
+            assert math.isnan(loaded["nan"])
+            assert loaded["inf"] == math.inf
+            assert loaded["ninf"] == -math.inf
+
     def test_session_scope_commits_on_success(self, db: Database) -> None:
         """Test that session_scope commits on success."""
         with db.session_scope() as session:
@@ -241,6 +369,17 @@ class TestExecutionRepository:
             )
             repo.create(execution_recent)
 
+            node_repo = NodeExecutionRepository(session)
+            for execution_id in ("exec-old", "exec-recent"):
+                node_repo.create(
+                    NodeExecution(
+                        execution_id=execution_id,
+                        node_id="step",
+                        node_type="shell",
+                        status="success",
+                    )
+                )
+
         with db.session_scope() as session:
             repo = ExecutionRepository(session)
             deleted = repo.cleanup_old(days=30)
@@ -250,6 +389,9 @@ class TestExecutionRepository:
             repo = ExecutionRepository(session)
             assert repo.get_by_id("exec-old") is None
             assert repo.get_by_id("exec-recent") is not None
+            node_repo = NodeExecutionRepository(session)
+            assert node_repo.get_by_execution("exec-old") == []
+            assert len(node_repo.get_by_execution("exec-recent")) == 1
 
     def test_delete_execution(self, db: Database) -> None:
         """Test deleting an execution."""
@@ -272,6 +414,29 @@ class TestExecutionRepository:
             result = repo.delete("non-existent")
             assert result is False
 
+    def test_delete_execution_removes_node_executions(self, db: Database) -> None:
+        """Test deleting an execution also deletes its node executions."""
+        with db.session_scope() as session:
+            ExecutionRepository(session).create(
+                Execution(
+                    id="exec-nodes",
+                    workflow_name="test",
+                    workflow_path="/test",
+                    status=ExecutionStatus.SUCCESS,
+                )
+            )
+            NodeExecutionRepository(session).create(
+                NodeExecution(
+                    execution_id="exec-nodes", node_id="step", node_type="shell", status="success"
+                )
+            )
+
+        with db.session_scope() as session:
+            assert ExecutionRepository(session).delete("exec-nodes") is True
+
+        with db.session_scope() as session:
+            assert NodeExecutionRepository(session).get_by_execution("exec-nodes") == []
+
 
 class TestNodeExecutionRepository:
     """Tests for NodeExecutionRepository class."""
@@ -328,8 +493,12 @@ class TestNodeExecutionRepository:
                 )
                 for i in range(3)
             ]
-            results = repo.create_batch(nodes)
-            assert len(results) == 3
+            assert repo.create_batch(nodes) == 3
+
+        with db.session_scope() as session:
+            results = NodeExecutionRepository(session).get_by_execution("exec-node-batch")
+            assert [node.node_id for node in results] == ["step-0", "step-1", "step-2"]
+            assert all(node.stdout == "" for node in results)
 
     def test_get_by_execution(self, db: Database) -> None:
         """Test getting node executions for a workflow execution."""
@@ -367,6 +536,67 @@ class TestNodeExecutionRepository:
             assert results[0].node_id == "step-0"
             assert results[2].node_id == "step-2"
 
+            # Paged in SQL
+            page = repo.get_by_execution("exec-node-get", offset=1, limit=1)
+            assert [node.node_id for node in page] == ["step-1"]
+            rest = repo.get_by_execution("exec-node-get", offset=1)
+            assert [node.node_id for node in rest] == ["step-1", "step-2"]
+            assert repo.count_by_execution("exec-node-get") == 3
+            assert repo.count_by_execution("missing") == 0
+
+    def test_get_by_execution_pages_ties_stably(self, db: Database) -> None:
+        """Test paging visits each row once when started_at values tie or are NULL."""
+        with db.session_scope() as session:
+            ExecutionRepository(session).create(
+                Execution(
+                    id="exec-node-ties",
+                    workflow_name="test",
+                    workflow_path="/test",
+                    status=ExecutionStatus.RUNNING,
+                )
+            )
+
+        now = datetime.now(UTC)
+        with db.session_scope() as session:
+            NodeExecutionRepository(session).create_batch(
+                [
+                    NodeExecution(
+                        execution_id="exec-node-ties",
+                        node_id=f"step-{i}",
+                        node_type="shell",
+                        status="success",
+                        started_at=None if i < 2 else now,
+                    )
+                    for i in range(6)
+                ]
+            )
+
+        with db.session_scope() as session:
+            repo = NodeExecutionRepository(session)
+            paged = [
+                node.node_id
+                for offset in range(6)
+                for node in repo.get_by_execution("exec-node-ties", offset=offset, limit=1)
+            ]
+            assert paged == [f"step-{i}" for i in range(6)]
+
+        from sqlalchemy import text
+
+        from flowpilot.storage.repositories import _NODE_EXECUTIONS_BY_EXECUTION
+
+        # The id tie-breaker is part of the ORDER BY and still served by the index
+        query = str(
+            _NODE_EXECUTIONS_BY_EXECUTION.params(execution_id="exec-node-ties").compile(
+                db.engine, compile_kwargs={"literal_binds": True}
+            )
+        )
+        assert query.endswith("node_executions.id")
+        with db.engine.connect() as conn:
+            plan = conn.execute(text(f"EXPLAIN QUERY PLAN {query}")).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_ne_exec_started" in details
+        assert "TEMP B-TREE" not in details
+
     def test_cascade_delete(self, db: Database) -> None:
         """Test that node executions are deleted when parent execution is deleted."""
         # Create execution with nodes
@@ -460,6 +690,18 @@ class TestScheduleRepository:
             repo = ScheduleRepository(session)
             results = repo.get_enabled()
             assert len(results) == 3
+            assert all(schedule.enabled is True for schedule in results)
+
+    def test_get_enabled_uses_partial_index(self, db: Database) -> None:
+        """Test the enabled-schedules query is served by the partial index."""
+        from sqlalchemy import text
+
+        from flowpilot.storage.repositories import _ENABLED_SCHEDULES
+
+        query = str(_ENABLED_SCHEDULES.compile(db.engine))
+        with db.engine.connect() as conn:
+            plan = conn.execute(text(f"EXPLAIN QUERY PLAN {query}")).fetchall()
+        assert "ix_sched_enabled" in " ".join(row[-1] for row in plan)
 
     def test_get_all(self, db: Database) -> None:
         """Test getting all schedules."""
@@ -478,6 +720,134 @@ class TestScheduleRepository:
             results = repo.get_all()
             assert len(results) == 3
 
+    def test_get_by_workflows(self, db: Database) -> None:
+        """Test getting schedules for several workflows at once."""
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            for i in range(3):
+                repo.create(
+                    Schedule(workflow_name=f"many-{i}", workflow_path=f"/test/{i}.yaml", enabled=1)
+                )
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            results = repo.get_by_workflows(["many-0", "many-2", "missing"])
+            assert set(results) == {"many-0", "many-2"}
+            assert results["many-2"].workflow_path == "/test/2.yaml"
+            assert repo.get_by_workflows([]) == {}
+
+    def test_iter_all_except(self, db: Database) -> None:
+        """Test getting every schedule other than the named ones."""
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            for i in (2, 0, 1):
+                repo.create(
+                    Schedule(workflow_name=f"rest-{i}", workflow_path=f"/test/{i}.yaml", enabled=0)
+                )
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            names = [s.workflow_name for s in repo.iter_all_except(["rest-1", "missing"])]
+            assert names == ["rest-0", "rest-2"]
+            assert len(list(repo.iter_all_except([]))) == 3
+
+    def test_upsert_creates_then_updates(self, db: Database) -> None:
+        """Test upsert inserts a new schedule and updates it in place."""
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            repo.upsert("upserted", workflow_path="/a.yaml", enabled=1, trigger_config={"a": 1})
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            created = repo.get_by_workflow("upserted")
+            assert created is not None
+            schedule_id, created_at = created.id, created.created_at
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            repo.upsert("upserted", workflow_path="/b.yaml", enabled=0, trigger_config={"b": 2})
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            schedule = repo.get_by_workflow("upserted")
+            assert schedule is not None
+            assert schedule.id == schedule_id
+            assert schedule.created_at == created_at
+            assert schedule.workflow_path == "/b.yaml"
+            assert schedule.enabled == 0
+            assert schedule.trigger_config == {"b": 2}
+            assert len(repo.get_all()) == 1
+
+    def test_bulk_upsert(self, db: Database) -> None:
+        """Test bulk upsert mixes inserts and updates in one call."""
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            repo.create(Schedule(workflow_name="bulk-0", workflow_path="/old.yaml", enabled=0))
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            repo.bulk_upsert(
+                [
+                    {"workflow_name": f"bulk-{i}", "workflow_path": f"/{i}.yaml", "enabled": 1}
+                    for i in range(3)
+                ]
+            )
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            schedules = repo.get_all()
+            assert [s.workflow_name for s in schedules] == ["bulk-0", "bulk-1", "bulk-2"]
+            assert all(s.enabled == 1 for s in schedules)
+            assert schedules[0].workflow_path == "/0.yaml"
+
+    def test_update_by_workflow(self, db: Database) -> None:
+        """Test updating schedule columns without loading the record."""
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            repo.create(Schedule(workflow_name="direct", workflow_path="/d.yaml", enabled=1))
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            assert repo.update_by_workflow("direct", enabled=0, last_status="success") is True
+            assert repo.update_by_workflow("missing", enabled=0) is False
+
+        with db.session_scope() as session:
+            schedule = ScheduleRepository(session).get_by_workflow("direct")
+            assert schedule is not None
+            assert schedule.enabled == 0
+            assert schedule.last_status == "success"
+
+    def test_update_by_workflows(self, db: Database) -> None:
+        """Test updating several schedules in one statement."""
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            for name in ("a", "b", "c"):
+                repo.create(Schedule(workflow_name=name, workflow_path=f"/{name}.yaml", enabled=1))
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            assert repo.update_by_workflows(["a", "b", "missing"], enabled=0) == 2
+            assert repo.update_by_workflows([], enabled=0) == 0
+
+        with db.session_scope() as session:
+            schedules = {s.workflow_name: s for s in ScheduleRepository(session).get_all()}
+            assert {name: s.enabled for name, s in schedules.items()} == {"a": 0, "b": 0, "c": 1}
+
+    def test_update_next_run_skips_unchanged(self, db: Database) -> None:
+        """Test that setting the stored next run time again is a no-op."""
+        next_run = datetime(2030, 1, 1, 9, 0, tzinfo=UTC)
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            repo.create(Schedule(workflow_name="next", workflow_path="/n.yaml", enabled=1))
+
+        with db.session_scope() as session:
+            repo = ScheduleRepository(session)
+            assert repo.update_next_run("next", next_run) is True
+            assert repo.update_next_run("next", next_run) is False
+            assert repo.update_next_run("next", None) is True
+            assert repo.update_next_run("next", None) is False
+            assert repo.update_next_run("missing", None) is False
+
     def test_delete_schedule(self, db: Database) -> None:
         """Test deleting a schedule."""
         with db.session_scope() as session:
@@ -493,6 +863,7 @@ class TestScheduleRepository:
             repo = ScheduleRepository(session)
             result = repo.delete("delete-me")
             assert result is True
+            assert repo.get_by_workflow("delete-me") is None
 
             result = repo.delete("non-existent")
             assert result is False
@@ -1,11 +1,24 @@
 """Tests for FlowPilot template engine."""
 
+import json
+from datetime import datetime
+from enum import Enum, IntEnum
+from typing import Any
+
 import pytest
 from jinja2 import UndefinedError
 
 from flowpilot.engine import ExecutionContext, NodeResult, TemplateEngine
 
 
+class _Color(Enum):
+    RED = 1
+
+
+class _Level(IntEnum):
+    HIGH = 3
+
+
 class TestTemplateEngine:
     """Tests for TemplateEngine class."""
 
@@ -147,6 +160,33 @@ class TestTemplateFilters:
         assert '"key": "value"' in result
         assert "\n" in result
 
+    def test_json_filter_indent_matches_stdlib(self, engine: TemplateEngine) -> None:
+        """Test indented json output is the same with or without orjson."""
+        data = {"items": [1, 2.5, False], 3: datetime(2024, 1, 15, 10, 30), "nested": {"a": True}}
+        result = engine.render("{{ data | json(2) }}", {"data": data})
+        assert result == json.dumps(data, indent=2, default=str)
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"name": "café ☕", "tags": ["naïve"]},
+            {"ratio": float("nan"), "max": float("inf"), "min": float("-inf")},
+            {"missing": None, "note": "nullable"},
+            {"large": 1e16, "small": 1e-7, "big": 2**70, "third": 1 / 3},
+            {"color": _Color.RED, "level": _Level.HIGH},
+        ],
+    )
+    def test_json_filter_special_values_match_stdlib(
+        self,
+        engine: TemplateEngine,
+        indent: int | None,
+        data: dict[str, Any],
+    ) -> None:
+        """Test non-ASCII, non-finite, float and enum values render as json.dumps does."""
+        result = engine.render("{{ data | json(indent) }}", {"data": data, "indent": indent})
+        assert result == json.dumps(data, indent=indent, default=str)
+
     def test_lines_filter(self, engine: TemplateEngine) -> None:
         """Test lines filter."""
         result = engine.render(
@@ -171,6 +211,16 @@ class TestTemplateFilters:
         )
         assert result == "third"
 
+    @pytest.mark.parametrize(
+        "text",
+        ["", "\n", "single", "a\r\nb\r\n", "a\n\n", "\nlead\ntrail\n", "x\ry"],
+    )
+    def test_first_last_line_match_splitlines(self, engine: TemplateEngine, text: str) -> None:
+        """Test first_line/last_line agree with splitlines on edge cases."""
+        lines = text.splitlines()
+        assert engine._first_line(text) == (lines[0] if lines else "")
+        assert engine._last_line(text) == (lines[-1] if lines else "")
+
     def test_strip_filter(self, engine: TemplateEngine) -> None:
         """Test strip filter."""
         result = engine.render(
@@ -43,6 +43,24 @@ class TestCronTrigger:
             CronTrigger(type="cron", schedule="0 0 9 * * * 1-5")
         assert "Cron expression must have 5 or 6 fields" in str(exc_info.value)
 
+    def test_invalid_cron_field_value(self) -> None:
+        """Test cron field values are validated, not just the field count."""
+        with pytest.raises(ValidationError) as exc_info:
+            CronTrigger(type="cron", schedule="99 9 * * *")
+        assert "Invalid cron schedule" in str(exc_info.value)
+
+    def test_invalid_cron_timezone(self) -> None:
+        """Test unknown timezones are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            CronTrigger(type="cron", schedule="0 9 * * *", timezone="Not/A_Zone")
+        assert "Invalid cron schedule" in str(exc_info.value)
+
+    def test_parsed_schedule_is_shared(self) -> None:
+        """Test identical schedules reuse one parsed APScheduler trigger."""
+        first = CronTrigger(type="cron", schedule="0 9 * * 1-5")
+        second = CronTrigger(type="cron", schedule="0 9 * * 1-5")
+        assert first.to_apscheduler() is second.to_apscheduler()
+
 
 class TestIntervalTrigger:
     """Tests for IntervalTrigger model."""
@@ -80,10 +98,45 @@ class TestIntervalTrigger:
             IntervalTrigger(type="interval", every="30w")
         assert "Invalid interval format" in str(exc_info.value)
 
+    @pytest.mark.parametrize("every", ["m", "-5m", "+5m", " 5m", "5 m", "5M"])
+    def test_invalid_interval_edge_cases(self, every: str) -> None:
+        """Test strings the digit fast path must still reject."""
+        with pytest.raises(ValidationError, match="Invalid interval format"):
+            IntervalTrigger(type="interval", every=every)
+
+    def test_non_ascii_digits(self) -> None:
+        """Test non-ASCII digits are still parsed as the regex allows."""
+        trigger = IntervalTrigger(type="interval", every="\u0665m")  # Arabic-Indic 5
+        assert trigger.to_seconds() == 300
+
 
 class TestFileWatchTrigger:
     """Tests for FileWatchTrigger model."""
 
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {
+                "type": "file-watch",
+                "path": "/etc/myapp",
+                "events": ["modified"],
+                "pattern": "*.yaml",
+                "recursive": False,
+            },
+            {
+                "type": "file-watch",
+                "path": "~/data/incoming",
+                "events": ["created"],
+                "pattern": "*.json",
+                "debounce": 2.0,
+            },
+        ],
+    )
+    def test_documented_examples_validate(self, config: dict[str, object]) -> None:
+        """Test the file-watch examples in docs/guides/triggers.md validate."""
+        trigger = FileWatchTrigger.model_validate(config)
+        assert trigger.path == config["path"]
+
     def test_minimal_file_watch(self) -> None:
         """Test file watch with minimal config."""
         trigger = FileWatchTrigger(type="file-watch", path="~/Code/project")
@@ -121,6 +174,13 @@ class TestWebhookTrigger:
         trigger = WebhookTrigger(type="webhook", path="/hooks/secure", secret="${WEBHOOK_SECRET}")
         assert trigger.secret == "${WEBHOOK_SECRET}"
 
+    def test_webhook_paths_shared(self) -> None:
+        """Test equal normalized paths reuse one string object."""
+        first = WebhookTrigger(type="webhook", path="hooks/" + "shared")
+        second = WebhookTrigger(type="webhook", path="".join(["/hooks/", "shared"]))
+        assert first.path == "/hooks/shared"
+        assert first.path is second.path
+
 
 class TestManualTrigger:
     """Tests for ManualTrigger model."""
@@ -129,3 +189,11 @@ class TestManualTrigger:
         """Test manual trigger."""
         trigger = ManualTrigger(type="manual")
         assert trigger.type == "manual"
+
+    def test_triggers_are_frozen(self) -> None:
+        """Test trigger models reject assignment but still ignore unknown fields."""
+        trigger = ManualTrigger(type="manual")
+        with pytest.raises(ValidationError):
+            trigger.type = "manual"
+        cron = CronTrigger(type="cron", schedule="0 9 * * *", scheduel="typo")  # type: ignore[call-arg]
+        assert cron.schedule == "0 9 * * *"
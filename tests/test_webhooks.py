@@ -30,9 +30,11 @@ def clean_webhooks():
 
     # Clear webhooks before test
     webhooks._webhooks.clear()
+    webhooks._paths_by_workflow.clear()
     yield
     # Clear webhooks after test
     webhooks._webhooks.clear()
+    webhooks._paths_by_workflow.clear()
 
 
 @pytest.fixture
@@ -165,6 +167,19 @@ class TestGetWebhooks:
         assert webhook["workflow_name"] == "workflow1"
         assert webhook["path"] == "/hook1"
 
+    def test_get_webhook_after_path_reassigned(self, clean_webhooks) -> None:
+        """Test a path registered to another workflow moves with it."""
+        register_webhook("/shared", "workflow1", "/path1.yaml")
+        register_webhook("/own", "workflow1", "/path1.yaml")
+        register_webhook("/shared", "workflow2", "/path2.yaml")
+
+        assert get_webhook("workflow1")["path"] == "/own"
+        assert get_webhook("workflow2")["path"] == "/shared"
+
+        assert unregister_webhook("workflow1") is True
+        assert get_webhook("workflow2")["path"] == "/shared"
+        assert [w["path"] for w in get_webhooks()] == ["/shared"]
+
     def test_get_webhook_nonexistent(self, clean_webhooks) -> None:
         """Test getting a non-existent workflow's webhook."""
         webhook = get_webhook("nonexistent")
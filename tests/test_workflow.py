@@ -53,6 +53,12 @@ class TestWorkflowSettings:
         with pytest.raises(ValidationError):
             WorkflowSettings(on_error="invalid")
 
+    def test_settings_frozen(self) -> None:
+        """Test settings reject assignment."""
+        settings = WorkflowSettings()
+        with pytest.raises(ValidationError):
+            settings.timeout = 10
+
 
 class TestWorkflow:
     """Tests for Workflow model."""
@@ -70,6 +76,14 @@ class TestWorkflow:
         assert workflow.triggers[0].type == "manual"
         assert len(workflow.nodes) == 1
 
+    def test_default_trigger_shared(self) -> None:
+        """Test workflows without triggers share the frozen default trigger."""
+        nodes = [{"type": "shell", "id": "step-1", "command": "echo hello"}]
+        first = Workflow(name="first", nodes=nodes)
+        second = Workflow(name="second", nodes=nodes)
+        assert first.triggers[0] is second.triggers[0]
+        assert first.triggers is not second.triggers
+
     def test_full_workflow(self) -> None:
         """Test workflow with all options."""
         workflow = Workflow(
@@ -127,6 +141,21 @@ class TestWorkflow:
             )
         assert "Duplicate node IDs" in str(exc_info.value)
 
+    def test_duplicate_ids_and_bad_references_reported_together(self) -> None:
+        """Test duplicate IDs and unknown references are reported in one error."""
+        with pytest.raises(ValidationError) as exc_info:
+            Workflow(
+                name="dup-and-ref",
+                nodes=[
+                    {"type": "shell", "id": "same-id", "command": "echo 1"},
+                    {"type": "shell", "id": "same-id", "command": "echo 2"},
+                    {"type": "shell", "id": "other", "command": "echo", "depends_on": ["missing"]},
+                ],
+            )
+        message = str(exc_info.value)
+        assert "Duplicate node IDs found: ['same-id']" in message
+        assert "depends on unknown node 'missing'" in message
+
     def test_invalid_depends_on_reference(self) -> None:
         """Test depends_on must reference existing node."""
         with pytest.raises(ValidationError) as exc_info:
@@ -209,6 +238,21 @@ class TestWorkflow:
             )
         assert "references unknown node" in str(exc_info.value)
 
+    def test_control_flow_nodes_indexed_by_type(self) -> None:
+        """Test validation keeps the control-flow nodes grouped by type."""
+        workflow = Workflow(
+            name="indexed",
+            nodes=[
+                {"type": "shell", "id": "task-a", "command": "echo a"},
+                {"type": "condition", "id": "check", "if": "true", "then": "task-a"},
+                {"type": "loop", "id": "each", "for_each": "[1, 2]", "do": ["task-a"]},
+                {"type": "parallel", "id": "fan-out", "nodes": ["task-a"]},
+            ],
+        )
+        assert [node.id for node in workflow._condition_nodes] == ["check"]
+        assert [node.id for node in workflow._loop_nodes] == ["each"]
+        assert [node.id for node in workflow._parallel_nodes] == ["fan-out"]
+
     def test_get_node(self) -> None:
         """Test get_node method."""
         workflow = Workflow(